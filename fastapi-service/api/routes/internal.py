@@ -0,0 +1,43 @@
+"""Internal endpoints called by backend services (not part of the public API)."""
+
+import hmac
+import logging
+
+from core.settings import ocr_settings
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from pipeline.clients.ocr_callbacks import get_ocr_callback_registry
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+@router.post(
+    "/internal/ocr/callback",
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
+    include_in_schema=False,
+)
+async def ocr_completion_callback(payload: dict, token: str = Query("")):
+    """Receive a finished OCR result (OCR_COMPLETION_MODE=callback)."""
+    if ocr_settings.OCR_COMPLETION_MODE != "callback":
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    # Startup validation requires a token in callback mode; an empty one
+    # still never matches
+    expected = ocr_settings.OCR_CALLBACK_TOKEN.get_secret_value()
+    if not expected or not hmac.compare_digest(token.encode(), expected.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Invalid callback token"
+        )
+
+    registry = get_ocr_callback_registry()
+    file_id = str(payload.get("id") or "")
+    if not registry.is_valid_file_id(file_id):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Callback payload must contain a valid 'id'",
+        )
+
+    local = await registry.deliver(file_id, payload)
+    logger.debug(f"OCR callback for file_id={file_id} (local waiter: {local})")
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
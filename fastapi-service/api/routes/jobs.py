@@ -0,0 +1,152 @@
+"""Asynchronous verification job endpoints.
+
+Submissions return 202 with a run_id; clients poll (or long-poll with
+``?wait=``) the status endpoint until the job completes.
+"""
+
+import asyncio
+import logging
+import os
+from dataclasses import asdict
+
+from api.schemas import (
+    JobAcceptedResponse,
+    JobStatusResponse,
+    KafkaEventRequest,
+    ProblemDetail,
+    VerifyRequest,
+)
+from api.streaming_upload import UPLOAD_FORM_OPENAPI, receive_upload
+from core.dependencies import get_job_queue
+from core.security import sanitize_fio, sanitize_iin
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pipeline.config.settings import JOB_STATUS_MAX_WAIT_SECONDS
+from pipeline.errors.exceptions import ValidationError
+from services.jobs import AnyJobQueue, Job
+from services.mappers import build_external_metadata, build_job_status_response
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+def _accepted(job: Job, response: Response) -> JobAcceptedResponse:
+    status_url = f"/v2/jobs/{job.run_id}"
+    response.headers["Location"] = status_url
+    return JobAcceptedResponse(
+        run_id=job.run_id, status=job.status, status_url=status_url
+    )
+
+
+@router.post(
+    "/v2/jobs",
+    response_model=JobAcceptedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    tags=["jobs"],
+    responses={503: {"description": "Job queue full", "model": ProblemDetail}},
+)
+async def submit_kafka_job(
+    request: Request,
+    response: Response,
+    event: KafkaEventRequest,
+    queue: AnyJobQueue = Depends(get_job_queue),
+):
+    trace_id = getattr(request.state, "trace_id", None)
+
+    logger.info(
+        "[NEW JOB] request_id=%s s3_path=%s iin=%s",
+        event.request_id,
+        event.s3_path,
+        sanitize_iin(event.iin),
+        extra={"trace_id": trace_id, "request_id": event.request_id},
+    )
+
+    job = await queue.submit_kafka(
+        event_data=event.dict(),
+        external_metadata=build_external_metadata(event, trace_id),
+    )
+    return _accepted(job, response)
+
+
+@router.post(
+    "/v2/jobs/upload",
+    response_model=JobAcceptedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    tags=["jobs"],
+    responses={
+        413: {"description": "File too large", "model": ProblemDetail},
+        422: {"description": "Validation Error", "model": ProblemDetail},
+        503: {"description": "Job queue full", "model": ProblemDetail},
+    },
+    openapi_extra=UPLOAD_FORM_OPENAPI,
+)
+async def submit_upload_job(
+    request: Request,
+    response: Response,
+    queue: AnyJobQueue = Depends(get_job_queue),
+):
+    trace_id = getattr(request.state, "trace_id", None)
+
+    # Streams the file part next to the job inputs; submit moves it in
+    upload = await receive_upload(request, queue.store.incoming_path())
+    try:
+        fio = upload.fields.get("fio")
+        if not fio:
+            raise ValidationError(message="FIO is required", field="fio")
+
+        logger.info(
+            "[NEW JOB] fio=%s file=%s",
+            sanitize_fio(fio),
+            upload.filename,
+            extra={"trace_id": trace_id},
+        )
+        verify_req = VerifyRequest(fio=fio)
+
+        job = await queue.submit_upload(
+            upload.path,
+            original_filename=upload.filename,
+            fio=verify_req.fio,
+            rejected=upload.rejected,
+        )
+        return _accepted(job, response)
+    finally:
+        # Normally already moved to the job input path
+        try:
+            await asyncio.to_thread(os.remove, upload.path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            logger.warning(
+                "Failed to cleanup temp file: %s",
+                upload.path,
+                extra={"trace_id": trace_id},
+            )
+
+
+@router.get(
+    "/v2/jobs/{run_id}",
+    response_model=JobStatusResponse,
+    tags=["jobs"],
+    responses={404: {"description": "Job not found", "model": ProblemDetail}},
+)
+async def get_job_status(
+    run_id: str,
+    wait: float = Query(
+        0,
+        ge=0,
+        le=JOB_STATUS_MAX_WAIT_SECONDS,
+        description="Seconds to wait for the job to finish (long-poll)",
+    ),
+    queue: AnyJobQueue = Depends(get_job_queue),
+):
+    if wait > 0:
+        job = await queue.wait(run_id, timeout=wait)
+    else:
+        job = await queue.get(run_id)
+
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {run_id} not found",
+        )
+
+    return build_job_status_response(asdict(job))
@@ -1,26 +1,43 @@
 """Kafka event verification endpoints."""
 
+import asyncio
 import logging
 import time
 from typing import Callable, Optional
 
 from api.schemas import (
+    KafkaBatchItemResult,
+    KafkaBatchRequest,
+    KafkaBatchResponse,
     KafkaEventQueryParams,
     KafkaEventRequest,
     KafkaResponse,
+    ProblemDetail,
     VerifyResponse,
 )
-from core.dependencies import get_db_manager, get_webhook_client
+from core.admission import AdmissionController
+from core.dependencies import (
+    get_admission_controller,
+    get_db_manager,
+    get_webhook_client,
+)
 from core.security import sanitize_iin
-from fastapi import APIRouter, BackgroundTasks, Depends, Request
+from core.settings import app_settings
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from pipeline.database.manager import DatabaseManager
+from pipeline.errors.exceptions import BaseError
 from services.mappers import (
     build_external_metadata,
     build_kafka_response,
     build_verify_response,
 )
 from services.processor import DocumentProcessor
-from services.tasks import enqueue_verification_run
+from services.tasks import (
+    enqueue_verification_run,
+    enqueue_verification_runs_batch,
+    persist_verification_run,
+)
 from services.webhook_client import WebhookClient
 
 router = APIRouter()
@@ -39,6 +56,7 @@ async def _process_kafka_event(
     external_metadata_builder: Callable,
     db: DatabaseManager,
     webhook: WebhookClient,
+    admission: AdmissionController,
     send_webhook: bool,
 ):
     start_time = time.time()
@@ -54,10 +72,11 @@ async def _process_kafka_event(
 
     external_metadata = external_metadata_builder(trace_id)
 
-    result = await processor.process_kafka_event(
-        event_data=event_data,
-        external_metadata=external_metadata,
-    )
+    async with admission.admit():
+        result = await processor.process_kafka_event(
+            event_data=event_data,
+            external_metadata=external_metadata,
+        )
 
     processing_time = time.time() - start_time
     response = build_response(
@@ -95,6 +114,7 @@ async def _process_kafka_event(
     "/v1/kafka/verify",
     response_model=VerifyResponse,
     tags=["kafka-integration"],
+    responses={503: {"description": "Service overloaded", "model": ProblemDetail}},
 )
 async def verify_kafka_event(
     request: Request,
@@ -102,6 +122,7 @@ async def verify_kafka_event(
     event: KafkaEventRequest,
     db: DatabaseManager = Depends(get_db_manager),
     webhook: WebhookClient = Depends(get_webhook_client),
+    admission: AdmissionController = Depends(get_admission_controller),
 ):
     return await _process_kafka_event(
         request=request,
@@ -114,6 +135,7 @@ async def verify_kafka_event(
         ),
         db=db,
         webhook=webhook,
+        admission=admission,
         send_webhook=True,
     )
 
@@ -122,6 +144,7 @@ async def verify_kafka_event(
     "/v1/kafka/verify-get",
     response_model=VerifyResponse,
     tags=["kafka-integration"],
+    responses={503: {"description": "Service overloaded", "model": ProblemDetail}},
 )
 async def verify_kafka_event_get(
     request: Request,
@@ -129,6 +152,7 @@ async def verify_kafka_event_get(
     params: KafkaEventQueryParams = Depends(),
     db: DatabaseManager = Depends(get_db_manager),
     webhook: WebhookClient = Depends(get_webhook_client),
+    admission: AdmissionController = Depends(get_admission_controller),
 ):
     event = KafkaEventRequest(**params.dict())
 
@@ -143,6 +167,7 @@ async def verify_kafka_event_get(
         ),
         db=db,
         webhook=webhook,
+        admission=admission,
         send_webhook=True,
     )
 
@@ -151,6 +176,7 @@ async def verify_kafka_event_get(
     "/v2/kafka/verify",
     response_model=KafkaResponse,
     tags=["kafka-integration"],
+    responses={503: {"description": "Service overloaded", "model": ProblemDetail}},
 )
 async def verify_kafka_event_v2(
     request: Request,
@@ -158,6 +184,7 @@ async def verify_kafka_event_v2(
     event: KafkaEventRequest,
     db: DatabaseManager = Depends(get_db_manager),
     webhook: WebhookClient = Depends(get_webhook_client),
+    admission: AdmissionController = Depends(get_admission_controller),
 ):
     return await _process_kafka_event(
         request=request,
@@ -170,6 +197,7 @@ async def verify_kafka_event_v2(
         ),
         db=db,
         webhook=webhook,
+        admission=admission,
         send_webhook=False,
     )
 
@@ -178,6 +206,7 @@ async def verify_kafka_event_v2(
     "/v2/kafka/verify-get",
     response_model=KafkaResponse,
     tags=["kafka-integration"],
+    responses={503: {"description": "Service overloaded", "model": ProblemDetail}},
 )
 async def verify_kafka_event_get_v2(
     request: Request,
@@ -185,6 +214,7 @@ async def verify_kafka_event_get_v2(
     params: KafkaEventQueryParams = Depends(),
     db: DatabaseManager = Depends(get_db_manager),
     webhook: WebhookClient = Depends(get_webhook_client),
+    admission: AdmissionController = Depends(get_admission_controller),
 ):
     return await _process_kafka_event(
         request=request,
@@ -197,5 +227,132 @@ async def verify_kafka_event_get_v2(
         ),
         db=db,
         webhook=webhook,
+        admission=admission,
         send_webhook=False,
     )
+
+
+@router.post(
+    "/v2/kafka/verify-batch",
+    response_model=KafkaBatchResponse,
+    tags=["kafka-integration"],
+    responses={
+        200: {
+            "content": {"application/x-ndjson": {}},
+            "description": "Aggregated results, or one KafkaBatchItemResult "
+            "per line as each finishes when stream=true",
+        }
+    },
+)
+async def verify_kafka_batch(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    batch: KafkaBatchRequest,
+    stream: bool = Query(
+        False, description="Stream NDJSON results in completion order"
+    ),
+    db: DatabaseManager = Depends(get_db_manager),
+    admission: AdmissionController = Depends(get_admission_controller),
+):
+    start_time = time.time()
+    trace_id = getattr(request.state, "trace_id", None)
+    semaphore = asyncio.Semaphore(app_settings.KAFKA_BATCH_CONCURRENCY)
+    results: list[dict] = []
+
+    logger.info(
+        "[NEW KAFKA BATCH] items=%d stream=%s",
+        len(batch.items),
+        stream,
+        extra={"trace_id": trace_id},
+    )
+
+    async def run_item(index: int, event: KafkaEventRequest) -> KafkaBatchItemResult:
+        async with semaphore:
+            try:
+                async with admission.admit():
+                    result = await processor.process_kafka_event(
+                        event_data=event.dict(),
+                        external_metadata=build_external_metadata(event, trace_id),
+                    )
+            except Exception as exc:
+                logger.error(
+                    "[KAFKA BATCH ITEM ERROR] request_id=%s: %s",
+                    event.request_id,
+                    exc,
+                    exc_info=not isinstance(exc, BaseError),
+                    extra={"trace_id": trace_id, "request_id": event.request_id},
+                )
+                error = (
+                    {
+                        "code": exc.error_code,
+                        "message": exc.message,
+                        "retryable": exc.retryable,
+                    }
+                    if isinstance(exc, BaseError)
+                    else {
+                        "code": "INTERNAL_SERVER_ERROR",
+                        "message": "An unexpected error occurred",
+                        "retryable": True,
+                    }
+                )
+                return KafkaBatchItemResult(
+                    index=index,
+                    request_id=event.request_id,
+                    status="error",
+                    error=error,
+                )
+
+        results.append(result)
+        if stream:
+            # Persist as each document finishes: the stream may end with a
+            # client disconnect, after which nothing else here runs. Shielded
+            # so cancelling the remaining items cannot interrupt the insert.
+            await asyncio.shield(persist_verification_run(result, db, None))
+        response = build_kafka_response(result, request_id=event.request_id)
+        return KafkaBatchItemResult(index=index, **response.model_dump())
+
+    tasks = [
+        asyncio.create_task(run_item(i, event)) for i, event in enumerate(batch.items)
+    ]
+
+    def log_done() -> None:
+        logger.info(
+            "[KAFKA BATCH RESPONSE] items=%d completed=%d time=%.2fs",
+            len(tasks),
+            len(results),
+            time.time() - start_time,
+            extra={"trace_id": trace_id},
+        )
+
+    if stream:
+
+        async def ndjson():
+            for next_done in asyncio.as_completed(tasks):
+                item = await next_done
+                yield item.model_dump_json(exclude_none=True) + "\n"
+            log_done()
+
+        def cancel_remaining() -> None:
+            # Runs once the response ends, including on client disconnect
+            # (the generator itself is then only closed by GC)
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                logger.info(
+                    "[KAFKA BATCH CANCELLED] client disconnected, cancelled=%d",
+                    len(pending),
+                    extra={"trace_id": trace_id},
+                )
+
+        background_tasks.add_task(cancel_remaining)
+        return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+    items = await asyncio.gather(*tasks)
+    log_done()
+    enqueue_verification_runs_batch(background_tasks, results, db)
+
+    return KafkaBatchResponse(
+        results=list(items),
+        processing_time_seconds=round(time.time() - start_time, 2),
+    )
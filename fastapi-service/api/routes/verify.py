@@ -1,17 +1,24 @@
 """Manual document verification endpoint."""
 
+import asyncio
 import logging
 import os
 import time
 
-from api.file_validation import validate_upload_file
 from api.schemas import ProblemDetail, VerifyRequest, VerifyResponse
-from core.dependencies import get_db_manager, get_webhook_client
+from api.streaming_upload import UPLOAD_FORM_OPENAPI, receive_upload
+from core.admission import AdmissionController
+from core.dependencies import (
+    get_admission_controller,
+    get_db_manager,
+    get_webhook_client,
+)
 from core.security import sanitize_fio
-from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, Request, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Depends, Request
 from pipeline.database.manager import DatabaseManager
+from pipeline.errors.exceptions import ValidationError
 from services.mappers import build_verify_response
-from services.processor import DocumentProcessor, _save_upload_to_temp
+from services.processor import DocumentProcessor
 from services.tasks import enqueue_verification_run
 from services.webhook_client import WebhookClient
 
@@ -25,37 +32,74 @@ processor = DocumentProcessor(runs_root="./runs")
     "/v1/verify",
     response_model=VerifyResponse,
     tags=["manual-verification"],
-    responses={422: {"description": "Validation Error", "model": ProblemDetail}},
+    responses={
+        422: {"description": "Validation Error", "model": ProblemDetail},
+        413: {"description": "File too large", "model": ProblemDetail},
+        503: {"description": "Service overloaded", "model": ProblemDetail},
+    },
+    openapi_extra=UPLOAD_FORM_OPENAPI,
 )
 async def verify_document(
     request: Request,
     background_tasks: BackgroundTasks,
-    file: UploadFile = File(..., description="PDF or image file"),
-    fio: str = Form(..., description="Applicant full name (FIO)"),
     db: DatabaseManager = Depends(get_db_manager),
     webhook: WebhookClient = Depends(get_webhook_client),
+    admission: AdmissionController = Depends(get_admission_controller),
 ):
     start_time = time.time()
     trace_id = getattr(request.state, "trace_id", None)
 
-    logger.info(
-        "[NEW REQUEST] fio=%s file=%s",
-        sanitize_fio(fio),
-        file.filename,
-        extra={"trace_id": trace_id},
-    )
-
-    await validate_upload_file(file)
-    verify_req = VerifyRequest(fio=fio)
+    # Refuse before ingesting up to MAX_FILE_SIZE_MB when already overloaded
+    admission.check()
 
-    tmp_path = await _save_upload_to_temp(file)
+    # Streams the file part into runs/.incoming while validating it
+    upload = await receive_upload(request, processor.incoming_path())
+    tmp_path = str(upload.path)
 
     try:
-        result = await processor.process_document(
-            file_path=tmp_path,
-            original_filename=file.filename,
-            fio=verify_req.fio,
+        fio = upload.fields.get("fio")
+        if upload.rejected:
+            # Refused while streaming (e.g. too many PDF pages): nothing to
+            # process, but the run is recorded like any other failed run
+            result = await processor.reject_document(
+                upload.rejected,
+                original_filename=upload.filename,
+                fio=fio,
+            )
+            response = build_verify_response(
+                result,
+                processing_time=time.time() - start_time,
+                trace_id=trace_id,
+            )
+            logger.info(
+                "[RESPONSE] run_id=%s rejected=%s pages=%s",
+                response.run_id,
+                upload.rejected,
+                upload.page_count,
+                extra={"trace_id": trace_id, "run_id": response.run_id},
+            )
+            enqueue_verification_run(background_tasks, result, db, webhook)
+            return response
+
+        if not fio:
+            raise ValidationError(message="FIO is required", field="fio")
+
+        logger.info(
+            "[NEW REQUEST] fio=%s file=%s",
+            sanitize_fio(fio),
+            upload.filename,
+            extra={"trace_id": trace_id},
         )
+        verify_req = VerifyRequest(fio=fio)
+
+        async with admission.admit():
+            result = await processor.process_document(
+                file_path=tmp_path,
+                original_filename=upload.filename,
+                fio=verify_req.fio,
+                input_sha256=upload.sha256,
+                adopt_source=True,
+            )
 
         response = build_verify_response(
             result,
@@ -80,8 +124,11 @@ async def verify_document(
         return response
 
     finally:
+        # Normally already moved into the run directory
         try:
-            os.remove(tmp_path)
+            await asyncio.to_thread(os.remove, tmp_path)
+        except FileNotFoundError:
+            pass
         except OSError:
             logger.warning(
                 "Failed to cleanup temp file: %s",
@@ -9,6 +9,7 @@ from pipeline.config.settings import (
     FIO_MIN_LENGTH,
     FIO_MIN_WORDS,
     IIN_LENGTH,
+    KAFKA_BATCH_MAX_ITEMS,
     NAME_MAX_LENGTH,
     S3_PATH_MAX_LENGTH,
 )
@@ -303,6 +304,62 @@ class KafkaEventRequest(BaseModel):
         }
 
 
+class KafkaBatchRequest(BaseModel):
+    """Batch of Kafka events for /v2/kafka/verify-batch."""
+
+    items: list[KafkaEventRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=KAFKA_BATCH_MAX_ITEMS,
+        description="Events to verify (processed concurrently)",
+    )
+
+
+class KafkaBatchItemResult(BaseModel):
+    """Per-document result in a batch response.
+
+    ``status`` is 'success' or 'fail' as in KafkaResponse, or 'error' when the
+    document could not be processed (e.g. S3 object missing, service at
+    capacity); ``error`` then carries the code, message and retryable flag.
+    """
+
+    index: int = Field(..., description="Position of the item in the request")
+    request_id: int = Field(..., description="Original request ID from Kafka event")
+    status: str = Field(
+        ...,
+        description="Verification status: 'success', 'fail' or 'error'",
+        pattern="^(success|fail|error)$",
+    )
+    err_codes: list[int] = Field(
+        default_factory=list, description="List of integer error codes"
+    )
+    error: Optional[dict] = Field(
+        None, description="Processing error (code, message, retryable)"
+    )
+
+
+class KafkaBatchResponse(BaseModel):
+    """Aggregated response for /v2/kafka/verify-batch (non-streaming)."""
+
+    results: list[KafkaBatchItemResult] = Field(
+        ..., description="Per-item results in request order"
+    )
+    processing_time_seconds: float = Field(
+        ..., description="Batch processing duration in seconds"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "results": [
+                    {"index": 0, "request_id": 52015072, "status": "success", "err_codes": []},
+                    {"index": 1, "request_id": 52015073, "status": "fail", "err_codes": [4]},
+                ],
+                "processing_time_seconds": 31.2,
+            }
+        }
+
+
 class DatabaseHealth(BaseModel):
     """Database connection status."""
 
@@ -334,3 +391,66 @@ class HealthResponse(BaseModel):
                 },
             }
         }
+
+
+class JobAcceptedResponse(BaseModel):
+    """Response for job submission (HTTP 202 Accepted)."""
+
+    run_id: str = Field(..., description="Run identifier used to poll the job")
+    status: str = Field(..., description="Job status at submission ('queued')")
+    status_url: str = Field(..., description="Relative URL of the job status endpoint")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "run_id": "550e8400-e29b-41d4-a716-446655440000",
+                "status": "queued",
+                "status_url": "/v2/jobs/550e8400-e29b-41d4-a716-446655440000",
+            }
+        }
+
+
+class JobStatusResponse(BaseModel):
+    """Current state of an asynchronous verification job."""
+
+    run_id: str = Field(..., description="Unique run identifier (UUID)")
+    kind: str = Field(..., description="Job source: 'kafka' or 'upload'")
+    status: str = Field(
+        ...,
+        description="Job status: 'queued', 'running', 'completed' or 'failed'",
+        pattern="^(queued|running|completed|failed)$",
+    )
+    submitted_at: str = Field(..., description="Submission timestamp (ISO 8601)")
+    started_at: Optional[str] = Field(None, description="Start timestamp")
+    finished_at: Optional[str] = Field(None, description="Completion timestamp")
+    attempts: int = Field(0, description="Number of times the job was started")
+    request_id: Optional[int] = Field(None, description="Kafka request ID, if any")
+    verdict: Optional[bool] = Field(
+        None, description="True if all checks pass (set when completed)"
+    )
+    errors: list[int] = Field(
+        default_factory=list, description="Business validation error codes"
+    )
+    processing_time_seconds: Optional[float] = Field(
+        None, description="Pipeline duration in seconds (set when finished)"
+    )
+    error: Optional[dict] = Field(
+        None, description="Failure details (code, message) when status is 'failed'"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "run_id": "550e8400-e29b-41d4-a716-446655440000",
+                "kind": "kafka",
+                "status": "completed",
+                "submitted_at": "2025-11-14T10:00:00+05:00",
+                "started_at": "2025-11-14T10:00:01+05:00",
+                "finished_at": "2025-11-14T10:00:13+05:00",
+                "attempts": 1,
+                "request_id": 52015072,
+                "verdict": True,
+                "errors": [],
+                "processing_time_seconds": 12.4,
+            }
+        }
@@ -0,0 +1,392 @@
+"""Streaming multipart ingestion for document uploads.
+
+The request body is parsed chunk by chunk with python-multipart's
+``MultipartParser``; the file part is written straight to its final
+location as it arrives, while size, magic bytes and SHA-256 are checked
+incrementally. An upload is rejected as soon as it crosses
+``MAX_FILE_SIZE_MB`` instead of after it has been spooled in full, and
+no more than one write buffer of file data is held in memory.
+
+PDF page counts are checked at both ends of the file: a linearized PDF
+declares its page count in the first kilobyte, so an over-long one is
+cut off after the first chunk - provided its declared length (``/L``)
+equals the file size implied by Content-Length, i.e. it was not updated
+after linearization. Other PDFs are counted from the trailer once the
+last chunk is written. Such uploads come back with
+``rejected`` set instead of raising, so the caller can record a normal
+PDF_TOO_MANY_PAGES run.
+
+File I/O (open, write, close, unlink) runs in worker threads; only the
+parsing itself, which is cheap, runs on the event loop.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from fastapi import Request
+from multipart.multipart import MultipartParser, parse_options_header
+from pipeline.config.constants import ALLOWED_CONTENT_TYPES
+from pipeline.config.settings import MAX_FILE_SIZE_MB, MAX_PDF_PAGES
+from pipeline.errors.exceptions import PayloadTooLargeError, ValidationError
+from pipeline.utils.file_detection import detect_file_type_from_bytes
+from pipeline.utils.pdf_pages import (
+    LINEARIZED_HEADER_BYTES,
+    count_pdf_pages_fast,
+    linearized_page_count,
+)
+
+logger = logging.getLogger(__name__)
+
+_WRITE_BUFFER_BYTES = 1024 * 1024
+_SIGNATURE_BYTES = 8
+_MAX_FIELD_BYTES = 64 * 1024
+# Multipart framing (boundaries, part headers, small form fields)
+_ENVELOPE_ALLOWANCE_BYTES = 64 * 1024
+
+
+# Routes whose body is parsed by receive_upload rather than FastAPI declare
+# the form schema for the OpenAPI docs with ``openapi_extra``.
+UPLOAD_FORM_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file", "fio"],
+                    "properties": {
+                        "file": {
+                            "type": "string",
+                            "format": "binary",
+                            "description": "PDF or image file",
+                        },
+                        "fio": {
+                            "type": "string",
+                            "description": "Applicant full name (FIO)",
+                        },
+                    },
+                }
+            }
+        },
+    }
+}
+
+
+@dataclass
+class StreamedUpload:
+    """Result of a streamed multipart upload."""
+
+    path: Path
+    filename: str
+    content_type: str
+    size: int
+    sha256: str
+    file_type: str
+    fields: dict[str, str] = field(default_factory=dict)
+    page_count: Optional[int] = None
+    # Error code when the document was refused during ingestion; the file
+    # is then not kept (``path`` does not exist)
+    rejected: Optional[str] = None
+
+
+def _decode(value: bytes) -> str:
+    try:
+        return value.decode("utf-8")
+    except UnicodeDecodeError:
+        return value.decode("latin-1")
+
+
+def _too_large(size: int) -> PayloadTooLargeError:
+    return PayloadTooLargeError(
+        max_size_mb=MAX_FILE_SIZE_MB, actual_size_mb=size / (1024 * 1024)
+    )
+
+
+class _FormStream:
+    """Collects parser callbacks; file bytes are drained asynchronously."""
+
+    def __init__(self, file_field: str) -> None:
+        self.file_field = file_field
+        self.fields: dict[str, str] = {}
+        self.filename: Optional[str] = None
+        self.content_type: Optional[str] = None
+        self.file_seen = False
+        self.pending: list[bytes] = []
+        # Body bytes before the chunk being parsed / before the file data
+        self.body_offset = 0
+        self.file_start: Optional[int] = None
+
+        self._headers: dict[str, str] = {}
+        self._header_field = b""
+        self._header_value = b""
+        self._part_name: Optional[str] = None
+        self._in_file = False
+        self._field_value = bytearray()
+
+    def callbacks(self) -> dict:
+        return {
+            "on_part_begin": self._on_part_begin,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+        }
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+        self._part_name = None
+        self._in_file = False
+        self._field_value = bytearray()
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        name = self._header_field.decode("latin-1").lower()
+        self._headers[name] = _decode(self._header_value)
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(
+            self._headers.get("content-disposition", "").encode("utf-8")
+        )
+        self._part_name = _decode(options.get(b"name", b""))
+        if self._part_name == self.file_field and not self.file_seen:
+            self.file_seen = True
+            self._in_file = True
+            self.filename = _decode(options.get(b"filename", b"")) or "upload"
+            self.content_type = self._headers.get("content-type", "")
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_file:
+            if self.file_start is None:
+                self.file_start = self.body_offset + start
+            self.pending.append(data[start:end])
+        elif len(self._field_value) < _MAX_FIELD_BYTES:
+            self._field_value += data[start:end]
+
+    def _on_part_end(self) -> None:
+        if not self._in_file and self._part_name:
+            self.fields[self._part_name] = _decode(bytes(self._field_value))
+        self._in_file = False
+
+
+class _FileSink:
+    """Validates and writes file bytes off the event loop."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.size = 0
+        self.file_type: Optional[str] = None
+        self.expected_content_type: Optional[str] = None
+        self.page_count: Optional[int] = None
+        self.rejected: Optional[str] = None
+        # File sizes consistent with Content-Length (file as the last part)
+        self.expected_sizes: tuple[int, ...] = ()
+        self._digest = hashlib.sha256()
+        self._header = b""
+        self._buffer = bytearray()
+        self._fh: Optional[BinaryIO] = None
+
+    async def feed(self, chunks: list[bytes]) -> None:
+        for chunk in chunks:
+            self.size += len(chunk)
+            if self.size > MAX_FILE_SIZE_MB * 1024 * 1024:
+                raise _too_large(self.size)
+            if len(self._header) < LINEARIZED_HEADER_BYTES:
+                self._header += chunk[: LINEARIZED_HEADER_BYTES - len(self._header)]
+                if self.file_type is None and len(self._header) >= _SIGNATURE_BYTES:
+                    self._check_signature()
+                if len(self._header) >= LINEARIZED_HEADER_BYTES:
+                    self._check_linearized_pages()
+                    if self.rejected:
+                        return
+            self._digest.update(chunk)
+            self._buffer += chunk
+        if len(self._buffer) >= _WRITE_BUFFER_BYTES:
+            await self._flush()
+
+    def _check_signature(self) -> None:
+        result = detect_file_type_from_bytes(self._header[:_SIGNATURE_BYTES])
+        if result is None:
+            raise ValidationError(
+                message="Unsupported file type (invalid magic bytes)",
+                field="file",
+                details={
+                    "magic_bytes": self._header[:_SIGNATURE_BYTES].hex(),
+                    "expected_types": ["pdf", "jpeg", "png", "tiff"],
+                },
+            )
+        self.file_type, self.expected_content_type = result
+
+    def _check_linearized_pages(self) -> None:
+        # /N is only trusted when /L matches the size the file will have;
+        # otherwise (updated after linearization, size unknown, fields after
+        # the file) the trailer count in finish() decides
+        if self.file_type != "pdf":
+            return
+        for size in self.expected_sizes:
+            pages = linearized_page_count(self._header, file_size=size)
+            if pages is not None:
+                self.page_count = pages
+                if pages > MAX_PDF_PAGES:
+                    self.rejected = "PDF_TOO_MANY_PAGES"
+                return
+
+    async def _check_trailer_pages(self) -> None:
+        if self.file_type != "pdf":
+            return
+        # Authoritative count: /L checked against the real size, else the
+        # xref chain (covers linearized files updated after linearization)
+        self.page_count = await asyncio.to_thread(count_pdf_pages_fast, self.path)
+        if self.page_count is not None and self.page_count > MAX_PDF_PAGES:
+            self.rejected = "PDF_TOO_MANY_PAGES"
+
+    async def _flush(self) -> None:
+        if self._fh is None:
+            self._fh = await asyncio.to_thread(open, self.path, "wb")
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        await asyncio.to_thread(self._fh.write, data)
+
+    async def finish(self) -> str:
+        if self.size == 0:
+            raise ValidationError(
+                message="File is empty (0 bytes)",
+                field="file",
+                details={"file_size": 0},
+            )
+        if self.file_type is None:
+            self._check_signature()
+        await self._flush()
+        await asyncio.to_thread(self._fh.close)
+        self._fh = None
+        await self._check_trailer_pages()
+        return self._digest.hexdigest()
+
+    async def discard(self) -> None:
+        if self._fh is not None:
+            await asyncio.to_thread(self._fh.close)
+            self._fh = None
+        try:
+            await asyncio.to_thread(os.remove, self.path)
+        except FileNotFoundError:
+            pass
+
+
+async def receive_upload(
+    request: Request,
+    destination: Path,
+    file_field: str = "file",
+) -> StreamedUpload:
+    """Stream a multipart/form-data request body, writing the file part to ``destination``.
+
+    A PDF over MAX_PDF_PAGES is returned with ``rejected`` set and the
+    file removed; reading stops early when the page count is known from
+    the first chunk.
+
+    Raises:
+        ValidationError: Not multipart, missing file, bad content type or magic bytes
+        PayloadTooLargeError: File exceeds MAX_FILE_SIZE_MB
+    """
+    content_type, params = parse_options_header(
+        request.headers.get("content-type", "")
+    )
+    boundary = params.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        raise ValidationError(
+            message="Expected multipart/form-data request body", field="file"
+        )
+
+    declared = int(request.headers.get("content-length") or 0)
+    if declared > MAX_FILE_SIZE_MB * 1024 * 1024 + _ENVELOPE_ALLOWANCE_BYTES:
+        raise _too_large(declared)
+
+    form = _FormStream(file_field)
+    parser = MultipartParser(boundary, form.callbacks())
+    sink = _FileSink(destination)
+
+    received = 0
+    try:
+        async for chunk in request.stream():
+            form.body_offset = received
+            parser.write(chunk)
+            received += len(chunk)
+            if form.file_start is not None and declared and not sink.expected_sizes:
+                # Closing delimiter "\r\n--<boundary>--" plus optional CRLF
+                closing = len(boundary) + 6
+                remaining = declared - form.file_start
+                sink.expected_sizes = (remaining - closing, remaining - closing - 2)
+            if form.pending:
+                if form.content_type not in ALLOWED_CONTENT_TYPES:
+                    raise ValidationError(
+                        message=f"Invalid content type: {form.content_type}",
+                        field="file",
+                        details={"allowed_types": list(ALLOWED_CONTENT_TYPES)},
+                    )
+                chunks, form.pending = form.pending, []
+                await sink.feed(chunks)
+                if sink.rejected:
+                    break
+        else:
+            parser.finalize()
+            if not form.file_seen:
+                raise ValidationError(message="File is required", field="file")
+            sha256 = await sink.finish()
+    except BaseException:
+        await sink.discard()
+        raise
+
+    if sink.rejected:
+        await sink.discard()
+        logger.info(
+            "Upload rejected during ingestion: code=%s pages=%s received=%d",
+            sink.rejected,
+            sink.page_count,
+            sink.size,
+        )
+        return StreamedUpload(
+            path=destination,
+            filename=form.filename or "upload",
+            content_type=form.content_type or "",
+            size=sink.size,
+            sha256="",
+            file_type=sink.file_type,
+            fields=form.fields,
+            page_count=sink.page_count,
+            rejected=sink.rejected,
+        )
+
+    if form.content_type != sink.expected_content_type:
+        logger.warning(
+            "Content-Type mismatch: header=%s detected=%s",
+            form.content_type,
+            sink.expected_content_type,
+        )
+    logger.info(
+        "File received: type=%s size=%d content_type=%s",
+        sink.file_type,
+        sink.size,
+        form.content_type,
+    )
+    return StreamedUpload(
+        path=destination,
+        filename=form.filename or "upload",
+        content_type=form.content_type or "",
+        size=sink.size,
+        sha256=sha256,
+        file_type=sink.file_type,
+        fields=form.fields,
+        page_count=sink.page_count,
+    )
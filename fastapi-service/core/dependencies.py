@@ -4,8 +4,10 @@ This module provides dependency injection utilities for FastAPI routes,
 enabling clean separation of concerns and improved testability.
 """
 
+from core.admission import AdmissionController
 from fastapi import HTTPException, Request, status
 from pipeline.database.manager import DatabaseManager
+from services.jobs import AnyJobQueue
 from services.webhook_client import WebhookClient
 
 
@@ -53,3 +55,49 @@ async def get_webhook_client(request: Request) -> WebhookClient:
         )
 
     return webhook_client
+
+
+async def get_job_queue(request: Request) -> AnyJobQueue:
+    """Get asynchronous job queue from app state.
+
+    Args:
+        request: FastAPI request object
+
+    Returns:
+        Job queue instance (in-memory or Postgres-backed)
+
+    Raises:
+        HTTPException: 503 if job queue is unavailable
+    """
+    job_queue = getattr(request.app.state, "job_queue", None)
+
+    if job_queue is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Job queue unavailable",
+        )
+
+    return job_queue
+
+
+async def get_admission_controller(request: Request) -> AdmissionController:
+    """Get pipeline admission controller from app state.
+
+    Args:
+        request: FastAPI request object
+
+    Returns:
+        AdmissionController instance
+
+    Raises:
+        HTTPException: 503 if admission controller is unavailable
+    """
+    admission = getattr(request.app.state, "admission", None)
+
+    if admission is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Admission controller unavailable",
+        )
+
+    return admission
@@ -106,10 +106,15 @@ async def handle_app_error(request: Request, exc: BaseError):
         trace_id=trace_id,
     )
 
+    headers = {"X-Trace-ID": trace_id}
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after is not None:
+        headers["Retry-After"] = str(retry_after)
+
     return JSONResponse(
         status_code=exc.http_status,
         content=problem.dict(exclude_none=True),
-        headers={"X-Trace-ID": trace_id},
+        headers=headers,
     )
 
 
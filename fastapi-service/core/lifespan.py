@@ -3,8 +3,21 @@
 import logging
 from contextlib import asynccontextmanager
 
+from core.admission import AdmissionController
+from core.settings import app_settings
 from fastapi import FastAPI
+from pipeline.clients.llm_client import (
+    create_llm_client_from_settings,
+    set_default_llm_client,
+)
+from pipeline.clients.ocr_callbacks import get_ocr_callback_registry
+from pipeline.clients.tesseract_async_client import (
+    create_ocr_client_from_settings,
+    set_default_ocr_client,
+)
 from pipeline.database.manager import create_database_manager_from_env
+from services.jobs import JobQueue, JobStore, PostgresJobQueue
+from services.processor import DocumentProcessor
 from services.webhook_client import create_webhook_client_from_env
 
 logger = logging.getLogger(__name__)
@@ -34,8 +47,92 @@ async def lifespan(app: FastAPI):
         logger.error(f"Webhook client initialization failed: {e}", exc_info=True)
         app.state.webhook_client = None
 
+    logger.info("Initializing OCR HTTP client pool...")
+    try:
+        ocr_client = await create_ocr_client_from_settings().start()
+        set_default_ocr_client(ocr_client)
+        app.state.ocr_client = ocr_client
+        logger.info(
+            f"OCR client ready (http2={ocr_client.http2}, "
+            f"max_connections={ocr_client.limits.max_connections})"
+        )
+    except Exception as e:
+        logger.error(f"OCR client initialization failed: {e}", exc_info=True)
+        app.state.ocr_client = None
+
+    logger.info("Initializing LLM HTTP client pool...")
+    try:
+        llm_client = create_llm_client_from_settings()
+        set_default_llm_client(llm_client)
+        app.state.llm_client = llm_client
+        logger.info("LLM client ready")
+    except Exception as e:
+        logger.error(f"LLM client initialization failed: {e}", exc_info=True)
+        app.state.llm_client = None
+
+    # Callback payloads left behind by workers that died mid-wait
+    get_ocr_callback_registry().prune()
+
+    app.state.admission = AdmissionController(
+        max_in_flight=app_settings.ADMISSION_MAX_IN_FLIGHT,
+        max_queued=app_settings.ADMISSION_MAX_QUEUED,
+        queue_timeout=app_settings.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+    )
+
+    logger.info("Starting job queue workers...")
+    try:
+        processor = DocumentProcessor(
+            runs_root="./runs", ocr_client=app.state.ocr_client
+        )
+        store = JobStore(app_settings.runs_dir)
+        if app_settings.JOB_BACKEND == "postgres" and app.state.db_manager:
+            job_queue = PostgresJobQueue(
+                processor=processor,
+                store=store,
+                db_manager=app.state.db_manager,
+                webhook_client=app.state.webhook_client,
+                workers=app_settings.JOB_WORKERS,
+                max_pending=app_settings.JOB_QUEUE_MAX_SIZE,
+                lease_seconds=app_settings.JOB_LEASE_SECONDS,
+                max_attempts=app_settings.JOB_MAX_ATTEMPTS,
+                poll_interval=app_settings.JOB_POLL_INTERVAL_SECONDS,
+            )
+        else:
+            if app_settings.JOB_BACKEND == "postgres":
+                logger.warning(
+                    "JOB_BACKEND=postgres but database is unavailable, "
+                    "falling back to in-memory job queue"
+                )
+            job_queue = JobQueue(
+                processor=processor,
+                store=store,
+                db_manager=app.state.db_manager,
+                webhook_client=app.state.webhook_client,
+                workers=app_settings.JOB_WORKERS,
+                max_pending=app_settings.JOB_QUEUE_MAX_SIZE,
+            )
+        await job_queue.start()
+        app.state.job_queue = job_queue
+    except Exception as e:
+        logger.error(f"Job queue initialization failed: {e}", exc_info=True)
+        app.state.job_queue = None
+
     yield
 
+    if getattr(app.state, "job_queue", None):
+        logger.info("Stopping job queue workers...")
+        await app.state.job_queue.stop()
+
+    if getattr(app.state, "ocr_client", None):
+        logger.info("Closing OCR HTTP client pool...")
+        set_default_ocr_client(None)
+        await app.state.ocr_client.aclose()
+
+    if getattr(app.state, "llm_client", None):
+        logger.info("Closing LLM HTTP client pool...")
+        set_default_llm_client(None)
+        await app.state.llm_client.aclose()
+
     if hasattr(app.state, "db_manager") and app.state.db_manager:
         logger.info("Closing database connection pool...")
         await app.state.db_manager.disconnect()
@@ -5,6 +5,8 @@ All environment variables are read once at startup and validated.
 Use this instead of scattered os.getenv() calls throughout the codebase.
 """
 
+from typing import Literal
+
 from pydantic import SecretStr
 from pydantic_settings import BaseSettings
 
@@ -33,6 +35,13 @@ class S3Settings(BaseSettings):
     S3_SECRET_KEY: SecretStr
     S3_BUCKET: str
     S3_SECURE: bool = True
+    # Shared urllib3 pool (per worker process); covers concurrent ranged GETs
+    # of one download times concurrent downloads
+    S3_MAX_POOL_CONNECTIONS: int = 16
+    # Objects at least this large are fetched as concurrent byte ranges
+    S3_PARALLEL_DOWNLOAD_THRESHOLD_MB: int = 16
+    S3_DOWNLOAD_PART_SIZE_MB: int = 8
+    S3_DOWNLOAD_CONCURRENCY: int = 4
 
     model_config = {"case_sensitive": True, "env_file": ".env", "extra": "ignore"}
 
@@ -40,15 +49,76 @@ class S3Settings(BaseSettings):
 class OCRSettings(BaseSettings):
     """OCR service configuration."""
 
-    OCR_BASE_URL: str
+    OCR_BASE_URL: str = ""
+    # Comma-separated OCR nodes; jobs go to the least busy healthy node.
+    # Overrides OCR_BASE_URL when set.
+    OCR_BASE_URLS: str = ""
+    OCR_ENDPOINT_FAILURE_THRESHOLD: int = 3
+    OCR_ENDPOINT_EJECT_SECONDS: float = 30.0
+    # Bump when the OCR engine/model changes so cached results are not reused
+    OCR_SERVICE_VERSION: str = "v2"
+    OCR_CACHE_ENABLED: bool = True
+    # Empty: <runs_dir>/.cache/ocr
+    OCR_CACHE_DIR: str = ""
+    OCR_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+    OCR_CACHE_MAX_MB: int = 1024
+    # Process-wide pooled HTTP client for the OCR service
+    OCR_HTTP_MAX_CONNECTIONS: int = 20
+    OCR_HTTP_MAX_KEEPALIVE: int = 10
+    OCR_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    OCR_HTTP2: bool = False
+    # How OCR completion is detected: "poll" (adaptive polling), "long_poll"
+    # (GET /result/{id}?wait=N held server-side) or "callback" (the OCR
+    # service posts the result to OCR_CALLBACK_URL). Both fall back to polling.
+    OCR_COMPLETION_MODE: Literal["poll", "long_poll", "callback"] = "poll"
+    OCR_LONG_POLL_WAIT_SECONDS: float = 25.0
+    OCR_CALLBACK_URL: str = ""
+    OCR_CALLBACK_TOKEN: SecretStr = SecretStr("")
+    OCR_CALLBACK_SAFETY_POLL_SECONDS: float = 10.0
+    # Shrink photos before OCR: cap the long edge, grayscale, re-encode JPEG.
+    # Opt-in until accuracy parity is confirmed on production samples.
+    OCR_PREPROCESS_ENABLED: bool = False
+    OCR_PREPROCESS_MAX_LONG_EDGE: int = 3000
+    OCR_PREPROCESS_GRAYSCALE: bool = True
+    OCR_PREPROCESS_JPEG_QUALITY: int = 85
+    # Drop blank and duplicate scanned pages (PDF, multi-frame TIFF) before OCR
+    OCR_PAGE_FILTER_ENABLED: bool = False
+    # Use the embedded text layer of born-digital PDFs instead of OCR
+    # (opt-in until accuracy parity with OCR is confirmed)
+    OCR_TEXT_LAYER_ENABLED: bool = False
+    # Split multi-page PDFs and OCR the pages as concurrent single-page jobs
+    OCR_PAGE_PARALLEL: bool = False
+    OCR_PAGE_PARALLEL_MIN_PAGES: int = 2
+    OCR_PAGE_PARALLEL_CONCURRENCY: int = 4
 
     model_config = {"case_sensitive": True, "env_file": ".env", "extra": "ignore"}
 
+    @property
+    def base_urls(self) -> list[str]:
+        """OCR nodes to route to: OCR_BASE_URLS, or the single OCR_BASE_URL."""
+        urls = [u.strip() for u in self.OCR_BASE_URLS.split(",") if u.strip()]
+        if urls:
+            return urls
+        return [self.OCR_BASE_URL] if self.OCR_BASE_URL else []
+
 
 class LLMSettings(BaseSettings):
     """LLM service configuration."""
 
     LLM_ENDPOINT_URL: str
+    # "concurrent" starts the doc-type check and extractor calls together;
+    # "sequential" runs them one after the other; "combined" asks for both
+    # results in a single prompt.
+    LLM_EXECUTION_MODE: Literal["sequential", "concurrent", "combined"] = "concurrent"
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_TTL_SECONDS: int = 24 * 3600
+    LLM_CACHE_MAX_MB: int = 64  # in-process tier, per worker
+    LLM_CACHE_DIR: str = ""  # persistent tier shared by workers; empty disables
+    LLM_CACHE_DISK_MAX_MB: int = 256
+    # Process-wide pooled HTTP client for the LLM endpoint
+    LLM_HTTP_MAX_CONNECTIONS: int = 20
+    LLM_HTTP_MAX_KEEPALIVE: int = 10
+    LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
 
     model_config = {"case_sensitive": True, "env_file": ".env", "extra": "ignore"}
 
@@ -69,6 +139,16 @@ class AppSettings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     TZ: str = "Asia/Almaty"
     RB_IDP_RUNS_DIR: str = "./runs"
+    ADMISSION_MAX_IN_FLIGHT: int = 8
+    ADMISSION_MAX_QUEUED: int = 16
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = 20.0
+    KAFKA_BATCH_CONCURRENCY: int = 4
+    JOB_BACKEND: Literal["memory", "postgres"] = "memory"
+    JOB_WORKERS: int = 2
+    JOB_QUEUE_MAX_SIZE: int = 100
+    JOB_LEASE_SECONDS: float = 300.0
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0
 
     model_config = {"case_sensitive": True, "env_file": ".env", "extra": "ignore"}
 
@@ -46,9 +46,19 @@ def validate_all_settings() -> None:
             "S3/MinIO storage",
         ),
         (webhook_settings.WEBHOOK_URL, "WEBHOOK_URL", "Webhook integration"),
-        (ocr_settings.OCR_BASE_URL, "OCR_BASE_URL", "OCR service"),
+        (",".join(ocr_settings.base_urls), "OCR_BASE_URL", "OCR service"),
         (llm_settings.LLM_ENDPOINT_URL, "LLM_ENDPOINT_URL", "LLM service"),
     ]
+    if ocr_settings.OCR_COMPLETION_MODE == "callback":
+        # The callback route accepts OCR text that feeds the verdict
+        critical_checks += [
+            (ocr_settings.OCR_CALLBACK_URL, "OCR_CALLBACK_URL", "OCR callbacks"),
+            (
+                ocr_settings.OCR_CALLBACK_TOKEN.get_secret_value(),
+                "OCR_CALLBACK_TOKEN",
+                "OCR callbacks",
+            ),
+        ]
 
     missing = []
     for value, name, purpose in critical_checks:
@@ -67,8 +77,9 @@ def validate_all_settings() -> None:
     url_pattern = re.compile(r"^https?://.+")
     url_checks = [
         (webhook_settings.WEBHOOK_URL, "WEBHOOK_URL"),
-        (ocr_settings.OCR_BASE_URL, "OCR_BASE_URL"),
+        *((url, "OCR_BASE_URLS") for url in ocr_settings.base_urls),
         (llm_settings.LLM_ENDPOINT_URL, "LLM_ENDPOINT_URL"),
+        (ocr_settings.OCR_CALLBACK_URL, "OCR_CALLBACK_URL"),
     ]
 
     invalid_urls = []
@@ -97,6 +108,6 @@ def validate_all_settings() -> None:
         f"  - Database: {db_settings.DB_HOST}:{db_settings.DB_PORT}/{db_settings.DB_NAME}"
     )
     logger.info(f"  - S3: {s3_settings.S3_ENDPOINT}/{s3_settings.S3_BUCKET}")
-    logger.info(f"  - OCR: {ocr_settings.OCR_BASE_URL}")
+    logger.info(f"  - OCR: {', '.join(ocr_settings.base_urls)}")
     logger.info(f"  - LLM: {llm_settings.LLM_ENDPOINT_URL}")
     logger.info(f"  - Webhook: {webhook_settings.WEBHOOK_URL}")
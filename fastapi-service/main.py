@@ -6,7 +6,7 @@ load_dotenv()
 
 import logging
 
-from api.routes import health, kafka, verify
+from api.routes import health, internal, jobs, kafka, verify
 from core.error_handlers import (
     handle_app_error,
     handle_http_error,
@@ -69,3 +69,5 @@ app.add_exception_handler(Exception, handle_unknown_error)
 app.include_router(health.router)
 app.include_router(verify.router)
 app.include_router(kafka.router)
+app.include_router(jobs.router)
+app.include_router(internal.router)
@@ -0,0 +1 @@
+"""Result caches shared across pipeline runs."""
@@ -0,0 +1,136 @@
+"""
+File-system backed key/value cache shared across worker processes.
+
+Each entry is a small JSON file stored under ``root/<key[:2]>/<key>.json``.
+Writes go to a temporary file in the same directory followed by
+``os.replace``, so concurrent gunicorn workers never observe partial
+entries. Entries expire after ``ttl_seconds`` and the oldest (least
+recently read) entries are evicted once the directory grows past
+``max_bytes``.
+
+All methods perform blocking file I/O; call them via ``asyncio.to_thread``
+from coroutines.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """JSON value cache with TTL and size-based eviction."""
+
+    def __init__(
+        self,
+        root: str | Path,
+        ttl_seconds: float,
+        max_bytes: int,
+        prune_every: int = 100,
+    ) -> None:
+        self.root = Path(root)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.prune_every = prune_every
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing, expired or unreadable."""
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning(f"Dropping unreadable cache entry: {path}", exc_info=True)
+            self._unlink(path)
+            return None
+
+        if time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            self._unlink(path)
+            return None
+
+        try:
+            os.utime(path)  # mark as recently used for eviction ordering
+        except OSError:
+            pass
+        return entry.get("value")
+
+    def set(self, key: str, value: Any) -> None:
+        """Atomically store a JSON-serializable value."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"created_at": time.time(), "value": value}, f, ensure_ascii=False
+                )
+            os.replace(tmp_path, path)
+        except BaseException:
+            self._unlink(Path(tmp_path))
+            raise
+
+        with self._lock:
+            self._writes += 1
+            should_prune = self._writes % self.prune_every == 1
+        if should_prune:
+            self.prune()
+
+    def delete(self, key: str) -> None:
+        self._unlink(self._path(key))
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def prune(self) -> None:
+        """Drop expired entries, then evict oldest entries above ``max_bytes``."""
+        now = time.time()
+        entries = []
+        total = 0
+        for path in self.root.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            if now - st.st_mtime > self.ttl_seconds:
+                # Not read or written within TTL: certainly expired.
+                self._unlink(path)
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        entries.sort()
+        evicted = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._unlink(path)
+            total -= size
+            evicted += 1
+        logger.info(f"Cache {self.root}: evicted {evicted} entries over size limit")
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,200 @@
+"""
+Cache of raw LLM responses keyed by prompt hash and model parameters.
+
+``ask_llm`` is called with ``temperature=0.0``, so an identical prompt
+yields a reusable answer. Responses are kept in an in-process LRU tier
+(bounded by bytes and TTL) and, when ``LLM_CACHE_DIR`` is set, in a
+persistent ``DiskCache`` tier shared by all workers.
+
+Only responses that ``parse_llm_output`` can turn into a non-empty dict
+are stored; the ``usage`` block is stripped so cache hits do not show up
+as spent tokens. Keys hash the full prompt, so an edited template simply
+produces new keys; old disk entries age out through TTL and size
+eviction. Prompt templates register themselves via
+``register_prompt_template``; when this process's set of templates
+changes, only its memory tier is cleared and registered invalidation
+listeners are notified. The shared disk tier is never purged for it, as
+other processes (scripts, replicas mid-deploy) may register a different
+set.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from core.settings import llm_settings
+from pipeline.cache.disk_cache import DiskCache
+from pipeline.metrics.sink import get_metrics_sink
+from pipeline.utils.parsers import parse_llm_output
+
+logger = logging.getLogger(__name__)
+
+_prompt_templates: dict[str, str] = {}
+_invalidation_listeners: list[Callable[[], None]] = []
+
+
+def register_prompt_template(name: str, template: str) -> None:
+    """Register a prompt template whose changes must invalidate the cache."""
+    _prompt_templates[name] = template
+
+
+def add_invalidation_listener(listener: Callable[[], None]) -> None:
+    """Call ``listener`` whenever the memory tier is cleared on a template change."""
+    _invalidation_listeners.append(listener)
+
+
+def _templates_fingerprint() -> str:
+    digest = hashlib.sha256()
+    for name in sorted(_prompt_templates):
+        digest.update(name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(_prompt_templates[name].encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def make_llm_cache_key(
+    prompt: str, *, model: str, temperature: float, max_tokens: int
+) -> str:
+    """Build the cache key from model parameters and the prompt's SHA-256."""
+    prompt_sha256 = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    material = json.dumps([model, temperature, max_tokens, prompt_sha256])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class MemoryLRUCache:
+    """In-process LRU of strings bounded by total bytes and TTL."""
+
+    def __init__(self, max_bytes: int, ttl_seconds: float) -> None:
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        created_at, value = entry
+        if time.monotonic() - created_at > self.ttl_seconds:
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        self._remove(key)
+        self._entries[key] = (time.monotonic(), value)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1].encode("utf-8"))
+
+
+class LLMResponseCache:
+    """Two-tier (memory + optional disk) cache of raw LLM responses."""
+
+    def __init__(
+        self, memory: MemoryLRUCache, disk: Optional[DiskCache] = None
+    ) -> None:
+        self.memory = memory
+        self.disk = disk
+        self._fingerprint: Optional[str] = None
+
+    async def get(self, key: str) -> Optional[str]:
+        await self._check_templates()
+        sink = get_metrics_sink()
+
+        value = self.memory.get(key)
+        if value is not None:
+            sink.increment("pipeline.llm_cache.hit", tags={"tier": "memory"})
+            return value
+
+        if self.disk is not None:
+            try:
+                value = await asyncio.to_thread(self.disk.get, key)
+            except Exception:
+                logger.warning("LLM cache disk lookup failed", exc_info=True)
+                value = None
+            if isinstance(value, str):
+                self.memory.set(key, value)
+                sink.increment("pipeline.llm_cache.hit", tags={"tier": "disk"})
+                return value
+
+        sink.increment("pipeline.llm_cache.miss")
+        return None
+
+    async def put(self, key: str, raw: str) -> None:
+        """Store ``raw`` unless it fails to parse into a non-empty result."""
+        if not parse_llm_output(raw):
+            return
+
+        try:
+            outer = json.loads(raw)
+            outer.pop("usage", None)
+            value = json.dumps(outer, ensure_ascii=False)
+        except Exception:
+            return
+
+        self.memory.set(key, value)
+        if self.disk is not None:
+            try:
+                await asyncio.to_thread(self.disk.set, key, value)
+            except Exception:
+                logger.warning("LLM cache disk store failed", exc_info=True)
+
+    async def _check_templates(self) -> None:
+        fingerprint = _templates_fingerprint()
+        if fingerprint == self._fingerprint:
+            return
+
+        if self._fingerprint is not None:
+            logger.info("Prompt templates changed, clearing in-memory LLM cache")
+            self.memory.clear()
+            for listener in _invalidation_listeners:
+                try:
+                    listener()
+                except Exception:
+                    logger.warning("LLM cache invalidation listener failed", exc_info=True)
+        self._fingerprint = fingerprint
+
+
+_llm_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Return the process-wide LLM response cache, or None when disabled."""
+    global _llm_cache
+    if not llm_settings.LLM_CACHE_ENABLED:
+        return None
+    if _llm_cache is None:
+        ttl = llm_settings.LLM_CACHE_TTL_SECONDS
+        disk = None
+        if llm_settings.LLM_CACHE_DIR.strip():
+            disk = DiskCache(
+                llm_settings.LLM_CACHE_DIR,
+                ttl_seconds=ttl,
+                max_bytes=llm_settings.LLM_CACHE_DISK_MAX_MB * 1024 * 1024,
+            )
+        _llm_cache = LLMResponseCache(
+            MemoryLRUCache(llm_settings.LLM_CACHE_MAX_MB * 1024 * 1024, ttl), disk
+        )
+    return _llm_cache
@@ -0,0 +1,96 @@
+"""
+Content-addressed cache of parsed OCR pages.
+
+Entries are keyed by the SHA-256 of the input document bytes plus the
+OCR service version (and the preprocessing variant, when the image was
+downscaled before OCR), so a resubmitted PDF/JPEG or a redelivered Kafka
+event reuses the pages produced by ``parse_ocr_output`` instead of
+uploading to Tesseract again. The cache lives on disk (by default under
+the shared runs volume) and is therefore shared by all gunicorn workers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from typing import Optional
+
+from core.settings import app_settings, ocr_settings
+from pipeline.cache.disk_cache import DiskCache
+from pipeline.metrics.sink import get_metrics_sink
+
+logger = logging.getLogger(__name__)
+
+
+class OcrResultCache:
+    """Async facade over a ``DiskCache`` holding OCR page lists."""
+
+    def __init__(self, disk: DiskCache, service_version: str) -> None:
+        self.disk = disk
+        self.service_version = service_version
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, input_sha256: str, variant: str = "") -> str:
+        material = f"{self.service_version}:{input_sha256}"
+        if variant:
+            material = f"{material}:{variant}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    async def get(
+        self, input_sha256: str, variant: str = ""
+    ) -> Optional[list[dict]]:
+        """Return cached pages for the input hash, recording hit/miss."""
+        try:
+            pages = await asyncio.to_thread(
+                self.disk.get, self._key(input_sha256, variant)
+            )
+        except Exception:
+            logger.warning("OCR cache lookup failed", exc_info=True)
+            pages = None
+
+        if isinstance(pages, list) and pages:
+            self.hits += 1
+            get_metrics_sink().increment("pipeline.ocr_cache.hit")
+            return pages
+
+        self.misses += 1
+        get_metrics_sink().increment("pipeline.ocr_cache.miss")
+        return None
+
+    async def put(
+        self, input_sha256: str, pages: list[dict], variant: str = ""
+    ) -> None:
+        """Store non-empty pages; failures are logged and ignored."""
+        if not pages:
+            return
+        try:
+            await asyncio.to_thread(
+                self.disk.set, self._key(input_sha256, variant), pages
+            )
+        except Exception:
+            logger.warning("OCR cache store failed", exc_info=True)
+
+
+_ocr_cache: Optional[OcrResultCache] = None
+
+
+def get_ocr_cache() -> Optional[OcrResultCache]:
+    """Return the process-wide OCR cache, or None when disabled."""
+    global _ocr_cache
+    if not ocr_settings.OCR_CACHE_ENABLED:
+        return None
+    if _ocr_cache is None:
+        cache_dir = ocr_settings.OCR_CACHE_DIR.strip() or (
+            app_settings.runs_dir / ".cache" / "ocr"
+        )
+        _ocr_cache = OcrResultCache(
+            DiskCache(
+                cache_dir,
+                ttl_seconds=ocr_settings.OCR_CACHE_TTL_SECONDS,
+                max_bytes=ocr_settings.OCR_CACHE_MAX_MB * 1024 * 1024,
+            ),
+            service_version=ocr_settings.OCR_SERVICE_VERSION,
+        )
+    return _ocr_cache
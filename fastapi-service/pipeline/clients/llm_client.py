@@ -1,18 +1,14 @@
 """LLM client for internal language model endpoint."""
 
-import json
-import ssl
-import urllib.error
-import urllib.request
 from http import HTTPStatus
-from typing import Any
+from typing import Any, Optional
 
+import httpx
 from core.settings import llm_settings
+from pipeline.cache.llm_cache import get_llm_cache, make_llm_cache_key
 from pipeline.config.settings import ERROR_BODY_MAX_CHARS, LLM_REQUEST_TIMEOUT_SECONDS
 from pipeline.errors.exceptions import ExternalServiceError
 
-_SSL_CONTEXT = ssl._create_unverified_context()
-
 
 def _raise_llm_error(
     error_type: str,
@@ -26,36 +22,71 @@ def _raise_llm_error(
     ) from exc
 
 
-def _read_error_body(err: urllib.error.HTTPError) -> str:
+def _read_error_body(response: httpx.Response) -> str:
     try:
-        return err.read().decode("utf-8")[:ERROR_BODY_MAX_CHARS]
+        return response.text[:ERROR_BODY_MAX_CHARS]
     except Exception:
         return ""
 
 
-def _build_request(payload: dict) -> urllib.request.Request:
-    return urllib.request.Request(
+_default_client: Optional[httpx.AsyncClient] = None
+
+
+def set_default_llm_client(client: Optional[httpx.AsyncClient]) -> None:
+    """Register the process-wide pooled LLM client (None to unregister)."""
+    global _default_client
+    _default_client = client
+
+
+def get_default_llm_client() -> Optional[httpx.AsyncClient]:
+    return _default_client
+
+
+def create_llm_client_from_settings() -> httpx.AsyncClient:
+    """Build the pooled LLM HTTP client from LLMSettings."""
+    return httpx.AsyncClient(
+        timeout=LLM_REQUEST_TIMEOUT_SECONDS,
+        verify=False,
+        limits=httpx.Limits(
+            max_connections=llm_settings.LLM_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=llm_settings.LLM_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=llm_settings.LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+
+
+async def _post(client: httpx.AsyncClient, payload: dict[str, Any]) -> str:
+    response = await client.post(
         llm_settings.LLM_ENDPOINT_URL,
-        data=json.dumps(payload).encode("utf-8"),
+        json=payload,
         headers={"Content-Type": "application/json"},
-        method="POST",
     )
+    response.raise_for_status()
+    return response.text
 
 
-def ask_llm(
+async def ask_llm(
     prompt: str,
     *,
     model: str = "gpt-4o",
     temperature: float = 0.0,
     max_tokens: int = 500,
+    use_cache: bool = True,
 ) -> str:
     """Call internal LLM endpoint.
 
+    The request is awaited on the caller's event loop, so a slow LLM
+    round trip does not hold an executor thread. It goes through the
+    pooled client registered at startup (a one-off client otherwise).
+    Identical requests are served from the LLM response cache when it is
+    enabled.
+
     Args:
         prompt: Input prompt for the model
         model: Model identifier
         temperature: Sampling temperature
         max_tokens: Maximum response tokens
+        use_cache: Consult and populate the LLM response cache
 
     Returns:
         Raw response string from LLM
@@ -63,6 +94,16 @@ def ask_llm(
     Raises:
         ExternalServiceError: On network or service failure
     """
+    cache = get_llm_cache() if use_cache else None
+    cache_key = None
+    if cache is not None:
+        cache_key = make_llm_cache_key(
+            prompt, model=model, temperature=temperature, max_tokens=max_tokens
+        )
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return cached
+
     payload = {
         "Model": model,
         "Content": prompt,
@@ -70,35 +111,36 @@ def ask_llm(
         "MaxTokens": max_tokens,
     }
 
-    request = _build_request(payload)
-
     try:
-        with urllib.request.urlopen(
-            request,
-            context=_SSL_CONTEXT,
-            timeout=LLM_REQUEST_TIMEOUT_SECONDS,
-        ) as response:
-            return response.read().decode("utf-8")
-
-    except urllib.error.HTTPError as e:
-        error_type = "rate_limit" if e.code == HTTPStatus.TOO_MANY_REQUESTS else "error"
+        if _default_client is not None:
+            raw = await _post(_default_client, payload)
+        else:
+            async with httpx.AsyncClient(
+                timeout=LLM_REQUEST_TIMEOUT_SECONDS, verify=False
+            ) as client:
+                raw = await _post(client, payload)
+
+    except httpx.HTTPStatusError as e:
+        error_type = (
+            "rate_limit"
+            if e.response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+            else "error"
+        )
         _raise_llm_error(
             error_type,
             {
-                "http_code": e.code,
-                "reason": str(e.reason),
-                "body": _read_error_body(e),
+                "http_code": e.response.status_code,
+                "reason": e.response.reason_phrase,
+                "body": _read_error_body(e.response),
             },
             e,
         )
 
-    except urllib.error.URLError as e:
-        reason = str(getattr(e, "reason", e))
-        _raise_llm_error(
-            "timeout" if "timeout" in reason.lower() else "unavailable",
-            {"reason": reason},
-            e,
-        )
+    except httpx.TimeoutException as e:
+        _raise_llm_error("timeout", {"reason": str(e) or "timeout"}, e)
+
+    except httpx.TransportError as e:
+        _raise_llm_error("unavailable", {"reason": str(e)}, e)
 
     except Exception as e:
         _raise_llm_error(
@@ -107,4 +149,6 @@ def ask_llm(
             e,
         )
 
-    return ""
+    if cache is not None:
+        await cache.put(cache_key, raw)
+    return raw
@@ -0,0 +1,108 @@
+"""Client-side balancing across several OCR service nodes.
+
+Each OCR job (upload through final result) is assigned to the healthy
+node with the fewest outstanding jobs from this process. A node is
+ejected after ``failure_threshold`` consecutive failed jobs (transport
+errors, timeouts, 5xx responses) and becomes eligible again once its ejection expires; the next
+job sent to it is a probe - success restores it, failure ejects it again
+for twice as long (capped).
+
+All polling for a file_id goes to the node that accepted its upload; the
+caller holds the endpoint for the whole job.
+"""
+
+import itertools
+import logging
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_MAX_EJECTION_SECONDS = 300.0
+
+
+@dataclass
+class OcrEndpoint:
+    url: str
+    outstanding: int = 0
+    consecutive_failures: int = 0
+    ejected_until: Optional[float] = None
+    ejection_seconds: float = 0.0
+
+    def is_ejected(self, now: float) -> bool:
+        return self.ejected_until is not None and now < self.ejected_until
+
+
+class OcrEndpointPool:
+    """Least-outstanding-requests selection with passive health checks."""
+
+    def __init__(
+        self,
+        urls: list[str],
+        failure_threshold: int = 3,
+        ejection_seconds: float = 30.0,
+    ) -> None:
+        if not urls:
+            raise ValueError("At least one OCR base URL is required")
+        self.endpoints = [OcrEndpoint(url.rstrip("/")) for url in urls]
+        self.failure_threshold = failure_threshold
+        self.base_ejection_seconds = ejection_seconds
+        self._tiebreak = itertools.count()
+
+    def acquire(self) -> OcrEndpoint:
+        """Pick a node for a new job and count it as outstanding."""
+        now = time.monotonic()
+        candidates = [e for e in self.endpoints if not e.is_ejected(now)]
+        if not candidates:
+            # Everything is ejected: probe the node that comes back first
+            candidates = [min(self.endpoints, key=lambda e: e.ejected_until)]
+
+        fewest = min(e.outstanding for e in candidates)
+        least_loaded = [e for e in candidates if e.outstanding == fewest]
+        endpoint = least_loaded[next(self._tiebreak) % len(least_loaded)]
+        endpoint.outstanding += 1
+        return endpoint
+
+    def release(self, endpoint: OcrEndpoint, success: Optional[bool]) -> None:
+        """Finish a job on ``endpoint`` and update its health.
+
+        ``success=None`` frees the slot without judging the node (the job
+        was cancelled, or the request itself was rejected).
+        """
+        endpoint.outstanding -= 1
+        if success is None:
+            return
+        if success:
+            if endpoint.ejected_until is not None:
+                logger.info(f"OCR endpoint {endpoint.url} recovered")
+            endpoint.consecutive_failures = 0
+            endpoint.ejected_until = None
+            endpoint.ejection_seconds = 0.0
+            return
+
+        endpoint.consecutive_failures += 1
+        probing = endpoint.ejected_until is not None
+        if probing or endpoint.consecutive_failures >= self.failure_threshold:
+            endpoint.ejection_seconds = min(
+                _MAX_EJECTION_SECONDS,
+                endpoint.ejection_seconds * 2 or self.base_ejection_seconds,
+            )
+            endpoint.ejected_until = time.monotonic() + endpoint.ejection_seconds
+            logger.warning(
+                f"OCR endpoint {endpoint.url} ejected for "
+                f"{endpoint.ejection_seconds:.0f}s after "
+                f"{endpoint.consecutive_failures} consecutive failures"
+            )
+
+    def snapshot(self) -> list[dict]:
+        now = time.monotonic()
+        return [
+            {
+                "url": e.url,
+                "outstanding": e.outstanding,
+                "consecutive_failures": e.consecutive_failures,
+                "ejected": e.is_ejected(now),
+            }
+            for e in self.endpoints
+        ]
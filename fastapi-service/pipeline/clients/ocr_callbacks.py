@@ -0,0 +1,223 @@
+"""Completion callbacks from the OCR service.
+
+In callback mode the OCR client uploads with a ``callback_url`` pointing
+at ``POST /internal/ocr/callback``; the OCR service posts the finished
+result (same body as ``GET /result/{id}``, including ``id``) there.
+
+The callback can land on any gunicorn worker, so the receiving worker
+both resolves a local waiter (fast path) and drops the payload into a
+shared directory under the runs volume, where the waiting worker picks
+it up with a cheap local file check instead of HTTP polls.
+
+A waiting worker marks its file_id as expected (``<id>.expected``) for
+the duration of the wait. Callbacks are always spooled, since a fast OCR
+node can post before the upload response reaches the worker; ``expect``
+picks up such an early payload. Spooled payloads nobody claims within
+``UNCLAIMED_MAX_AGE_SECONDS`` are pruned, the entries of an id are
+removed when its wait ends, and anything older than
+``SPOOL_MAX_AGE_SECONDS`` - left by crashed workers - is pruned at
+startup and periodically while waiting.
+
+Waiting documents share one watcher task per process that lists the
+spool directory every ``_FILE_CHECK_INTERVAL`` seconds; all filesystem
+work runs in a thread so the event loop is never blocked on the volume.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from pipeline.utils.io_utils import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+_FILE_CHECK_INTERVAL = 0.25
+_PRUNE_INTERVAL_SECONDS = 60.0
+# Well above any OCR wait; only leftovers of crashed workers get this old
+SPOOL_MAX_AGE_SECONDS = 3600.0
+# Callbacks that beat their upload response are claimed within seconds
+UNCLAIMED_MAX_AGE_SECONDS = 120.0
+
+
+class OcrCallbackRegistry:
+    """Waiters for OCR completion callbacks, keyed by OCR file_id."""
+
+    def __init__(self, spool_dir: Path) -> None:
+        self.spool_dir = Path(spool_dir)
+        self._waiters: dict[str, asyncio.Future] = {}
+        # Payloads taken from the spool while their id had no active wait()
+        self._received: dict[str, dict[str, Any]] = {}
+        self._watcher: Optional[asyncio.Task] = None
+        self._last_prune = 0.0
+
+    def _spool_path(self, file_id: str) -> Path:
+        return self.spool_dir / f"{file_id}.json"
+
+    def _marker_path(self, file_id: str) -> Path:
+        return self.spool_dir / f"{file_id}.expected"
+
+    def _expect_sync(self, file_id: str) -> Optional[dict[str, Any]]:
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        self._marker_path(file_id).touch()
+        return self._take_spooled(file_id)
+
+    async def expect(self, file_id: str) -> None:
+        """Accept callbacks for ``file_id`` (on any worker) until ``forget``.
+
+        A callback that arrived before this call is claimed here.
+        """
+        payload = await asyncio.to_thread(self._expect_sync, file_id)
+        if payload is not None:
+            self._received[file_id] = payload
+
+    def _forget_sync(self, file_id: str) -> None:
+        for path in (self._marker_path(file_id), self._spool_path(file_id)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to remove OCR callback spool file {path}: {e}")
+
+    async def forget(self, file_id: str) -> None:
+        """Stop accepting callbacks for ``file_id`` and drop any spooled one."""
+        self._received.pop(file_id, None)
+        await asyncio.to_thread(self._forget_sync, file_id)
+
+    def prune(
+        self,
+        max_age: float = SPOOL_MAX_AGE_SECONDS,
+        unclaimed_max_age: float = UNCLAIMED_MAX_AGE_SECONDS,
+    ) -> int:
+        """Remove stale spool entries (blocking); return the count.
+
+        Entries older than ``max_age`` go, and so do payloads older than
+        ``unclaimed_max_age`` whose id no worker expects.
+        """
+        self._last_prune = time.monotonic()
+        now = time.time()
+        removed = 0
+        try:
+            entries = list(os.scandir(self.spool_dir))
+        except FileNotFoundError:
+            return 0
+        names = {entry.name for entry in entries}
+        for entry in entries:
+            try:
+                if not entry.is_file():
+                    continue
+                age = now - entry.stat().st_mtime
+                file_id, ext = os.path.splitext(entry.name)
+                unclaimed = ext == ".json" and f"{file_id}.expected" not in names
+                if age > max_age or (unclaimed and age > unclaimed_max_age):
+                    os.remove(entry.path)
+                    removed += 1
+            except OSError:
+                continue
+        if removed:
+            logger.info(f"Pruned {removed} stale OCR callback spool file(s)")
+        return removed
+
+    @staticmethod
+    def is_valid_file_id(file_id: str) -> bool:
+        return bool(file_id) and all(c.isalnum() or c in "-_" for c in file_id)
+
+    def _spool(self, file_id: str, payload: dict[str, Any]) -> None:
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        write_json_atomic(self._spool_path(file_id), payload)
+
+    async def deliver(self, file_id: str, payload: dict[str, Any]) -> bool:
+        """Hand a callback payload to its waiter.
+
+        Without a waiter in this process the payload is spooled for the
+        worker that expects it (or will, once its upload returns).
+
+        Returns:
+            True if a waiter in this process was resolved directly
+        """
+        waiter = self._waiters.get(file_id)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(payload)
+            return True
+        await asyncio.to_thread(self._spool, file_id, payload)
+        return False
+
+    def _take_spooled(self, file_id: str) -> Optional[dict[str, Any]]:
+        path = self._spool_path(file_id)
+        try:
+            with open(path, encoding="utf-8") as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return None
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return payload
+
+    def _collect(self, file_ids: set[str]) -> dict[str, dict[str, Any]]:
+        """Take the spooled payloads of ``file_ids`` (one directory listing)."""
+        try:
+            names = set(os.listdir(self.spool_dir))
+        except FileNotFoundError:
+            names = set()
+        found = {}
+        for file_id in file_ids:
+            if f"{file_id}.json" in names:
+                payload = self._take_spooled(file_id)
+                if payload is not None:
+                    found[file_id] = payload
+        if time.monotonic() - self._last_prune >= _PRUNE_INTERVAL_SECONDS:
+            self.prune()
+        return found
+
+    async def _watch(self) -> None:
+        while self._waiters:
+            await asyncio.sleep(_FILE_CHECK_INTERVAL)
+            file_ids = {i for i, w in self._waiters.items() if not w.done()}
+            if not file_ids:
+                continue
+            try:
+                found = await asyncio.to_thread(self._collect, file_ids)
+            except Exception:
+                logger.warning("OCR callback spool scan failed", exc_info=True)
+                continue
+            for file_id, payload in found.items():
+                waiter = self._waiters.get(file_id)
+                if waiter is not None and not waiter.done():
+                    waiter.set_result(payload)
+                else:
+                    # The wait ended while scanning; keep it for the next one
+                    self._received[file_id] = payload
+
+    async def wait(self, file_id: str, timeout: float) -> Optional[dict[str, Any]]:
+        """Wait up to ``timeout`` seconds for the callback; None if none came."""
+        payload = self._received.pop(file_id, None)
+        if payload is not None:
+            return payload
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[file_id] = waiter
+        if self._watcher is None or self._watcher.done():
+            self._watcher = asyncio.create_task(self._watch())
+        try:
+            return await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._waiters.pop(file_id, None)
+
+
+_registry: Optional[OcrCallbackRegistry] = None
+
+
+def get_ocr_callback_registry() -> OcrCallbackRegistry:
+    global _registry
+    if _registry is None:
+        from core.settings import app_settings
+
+        _registry = OcrCallbackRegistry(app_settings.runs_dir / ".ocr_callbacks")
+    return _registry
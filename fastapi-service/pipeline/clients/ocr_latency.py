@@ -0,0 +1,133 @@
+"""Adaptive polling for OCR results, driven by recent completion times.
+
+OCR completion time (upload accepted -> result ready) is learned per
+bucket of page count and file size as an EWMA of the mean and of the
+absolute deviation. A poll schedule then sleeps until shortly before the
+predicted completion and polls densely around it, falling back to the
+classic exponential backoff for buckets without enough history and for
+documents that run late.
+
+The model is per process and in memory; each worker warms up on its own
+traffic within a few documents.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+# Bucket upper bounds (inclusive)
+_PAGE_BUCKETS = (1, 2, 4, 8, 16)
+_SIZE_BUCKETS = (256 * 1024, 1024 * 1024, 4 * 1024 * 1024)
+
+_EWMA_ALPHA = 0.2
+_MIN_SAMPLES = 3
+
+# Fallback schedule (no history): check at once, then 0.5 s, x1.5, capped at 5 s
+_FALLBACK_INITIAL = 0.5
+_FALLBACK_BACKOFF = 1.5
+_FALLBACK_MAX = 5.0
+
+# Dense polling around the predicted completion
+_DENSE_MIN = 0.2
+_DENSE_MAX = 1.0
+_EARLY_DEVIATIONS = 2.0  # first poll at mean - 2 * deviation
+_LATE_DEVIATIONS = 3.0  # back off again after mean + 3 * deviation
+
+
+def _bucket(value: Optional[int], edges: tuple[int, ...]) -> str:
+    if value is None:
+        return "?"
+    for edge in edges:
+        if value <= edge:
+            return f"<={edge}"
+    return f">{edges[-1]}"
+
+
+def bucket_key(pages: Optional[int], size_bytes: Optional[int]) -> str:
+    return f"p{_bucket(pages, _PAGE_BUCKETS)}:s{_bucket(size_bytes, _SIZE_BUCKETS)}"
+
+
+@dataclass
+class _BucketStats:
+    mean: float
+    deviation: float
+    samples: int = 1
+
+    def update(self, seconds: float) -> None:
+        error = seconds - self.mean
+        self.mean += _EWMA_ALPHA * error
+        self.deviation += _EWMA_ALPHA * (abs(error) - self.deviation)
+        self.samples += 1
+
+
+class OcrLatencyModel:
+    """Learned OCR completion time per (page count, file size) bucket."""
+
+    def __init__(self) -> None:
+        self._stats: dict[str, _BucketStats] = {}
+        self._lock = threading.Lock()
+
+    def observe(
+        self, pages: Optional[int], size_bytes: Optional[int], seconds: float
+    ) -> None:
+        key = bucket_key(pages, size_bytes)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                self._stats[key] = _BucketStats(mean=seconds, deviation=seconds / 4)
+            else:
+                stats.update(seconds)
+
+    def predict(
+        self, pages: Optional[int], size_bytes: Optional[int]
+    ) -> Optional[tuple[float, float]]:
+        """Return (expected seconds, deviation) once the bucket has history."""
+        with self._lock:
+            stats = self._stats.get(bucket_key(pages, size_bytes))
+            if stats is None or stats.samples < _MIN_SAMPLES:
+                return None
+            return stats.mean, stats.deviation
+
+    def schedule(
+        self, pages: Optional[int], size_bytes: Optional[int]
+    ) -> "PollSchedule":
+        return PollSchedule(self.predict(pages, size_bytes))
+
+
+class PollSchedule:
+    """Sleep intervals before each result check for one document."""
+
+    def __init__(self, prediction: Optional[tuple[float, float]]) -> None:
+        self.predicted_seconds = prediction[0] if prediction else None
+        self._prediction = prediction
+
+    def delays(self) -> Iterator[float]:
+        if self._prediction is None:
+            yield 0.0
+            yield from self._backoff(_FALLBACK_INITIAL)
+            return
+
+        mean, deviation = self._prediction
+        dense = min(_DENSE_MAX, max(_DENSE_MIN, deviation / 2))
+        first = max(0.0, mean - _EARLY_DEVIATIONS * deviation)
+        late = mean + _LATE_DEVIATIONS * deviation
+
+        yield first
+        elapsed = first
+        while elapsed < late:
+            yield dense
+            elapsed += dense
+        yield from self._backoff(dense)
+
+    @staticmethod
+    def _backoff(interval: float) -> Iterator[float]:
+        while True:
+            yield interval
+            interval = min(interval * _FALLBACK_BACKOFF, _FALLBACK_MAX)
+
+
+_model = OcrLatencyModel()
+
+
+def get_ocr_latency_model() -> OcrLatencyModel:
+    return _model
@@ -1,10 +1,14 @@
 import asyncio
 import logging
 import os
+import time
 from typing import Any, Optional
 
 import httpx
 from core.settings import ocr_settings
+from pipeline.clients.ocr_balancer import OcrEndpointPool
+from pipeline.clients.ocr_callbacks import get_ocr_callback_registry
+from pipeline.clients.ocr_latency import get_ocr_latency_model
 from pipeline.config.settings import (
     OCR_CLIENT_TIMEOUT_SECONDS,
     OCR_RESULT_FILE,
@@ -35,75 +39,420 @@ def parse_ocr_result(resp: dict) -> tuple[bool, Optional[str], dict]:
     return False, error, raw_inner
 
 
+def _is_ready(resp: dict) -> bool:
+    status = str(resp.get("status", "")).lower()
+    return (
+        status in {"done", "completed", "success", "finished", "ready"}
+        or resp.get("result") is not None
+    )
+
+
+def _is_failed(resp: dict) -> bool:
+    return str(resp.get("status", "")).lower() in {"failed", "error"}
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
 class TesseractAsyncClient:
+    """Async client for the Tesseract OCR service.
+
+    Used either per document (``async with``) or as a long-lived pooled
+    client: ``start()`` once, share across requests, ``aclose()`` at
+    shutdown (see core/lifespan.py).
+    """
+
     def __init__(
-        self, base_url: Optional[str] = None, timeout: float = 60.0, verify: bool = True
+        self,
+        base_url: Optional[str] = None,
+        timeout: float = 60.0,
+        verify: bool = True,
+        *,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        completion_mode: str = "poll",
+        callback_url: Optional[str] = None,
+        long_poll_wait: float = 25.0,
+        callback_safety_poll: float = 10.0,
+        base_urls: Optional[list[str]] = None,
+        failure_threshold: int = 3,
+        ejection_seconds: float = 30.0,
     ):
-        self.base_url = base_url or ocr_settings.OCR_BASE_URL
+        urls = base_urls or ([base_url] if base_url else ocr_settings.base_urls)
+        self.endpoints = OcrEndpointPool(
+            urls, failure_threshold=failure_threshold, ejection_seconds=ejection_seconds
+        )
+        self.base_url = self.endpoints.endpoints[0].url
         self.timeout = timeout
         self.verify = verify
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        if http2 and not _http2_available():
+            logger.warning("OCR HTTP/2 requested but 'h2' is not installed, using HTTP/1.1")
+            http2 = False
+        self.http2 = http2
+        if completion_mode == "callback" and not callback_url:
+            logger.warning("OCR callback mode needs a callback URL, using polling")
+            completion_mode = "poll"
+        self.completion_mode = completion_mode
+        self.callback_url = callback_url
+        self.long_poll_wait = long_poll_wait
+        self.callback_safety_poll = callback_safety_poll
+        self._long_poll_unsupported: set[str] = set()
         self._client: Optional[httpx.AsyncClient] = None
 
-    async def __aenter__(self):
-        self._client = httpx.AsyncClient(timeout=self.timeout, verify=self.verify)
+    async def start(self) -> "TesseractAsyncClient":
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                verify=self.verify,
+                limits=self.limits,
+                http2=self.http2,
+            )
         return self
 
-    async def __aexit__(self, *args):
+    async def aclose(self) -> None:
         if self._client:
             await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self):
+        return await self.start()
 
-    async def upload(self, file_path: str) -> dict:
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def upload(self, file_path: str, base_url: Optional[str] = None) -> dict:
         if not self._client:
             raise RuntimeError("Client not started")
-        url = f"{self.base_url}/pdf"
+        url = f"{base_url or self.base_url}/pdf"
         filename = os.path.basename(file_path)
 
+        data = None
+        if self.completion_mode == "callback":
+            data = {"callback_url": self.callback_url}
         with open(file_path, "rb") as f:
             resp = await self._client.post(
-                url, files={"file": (filename, f, "application/pdf")}
+                url, files={"file": (filename, f, "application/pdf")}, data=data
             )
 
         resp.raise_for_status()
         return resp.json()
 
-    async def get_result(self, file_id: str) -> dict:
+    async def get_result(
+        self,
+        file_id: str,
+        wait: Optional[float] = None,
+        base_url: Optional[str] = None,
+    ) -> dict:
+        """Fetch the OCR result; ``wait`` asks the server to hold until ready."""
         if not self._client:
             raise RuntimeError("Client not started")
-        resp = await self._client.get(f"{self.base_url}/result/{file_id}")
+        url = f"{base_url or self.base_url}/result/{file_id}"
+        if wait is None:
+            resp = await self._client.get(url)
+        else:
+            resp = await self._client.get(
+                url,
+                params={"wait": round(wait, 1)},
+                timeout=self.timeout + wait,
+            )
         resp.raise_for_status()
         return resp.json()
 
-    async def wait_for_result(self, file_id: str, timeout: float) -> dict:
-        """Poll OCR service until result is ready using exponential backoff."""
-        deadline = asyncio.get_event_loop().time() + timeout
-        interval, backoff, max_interval = 0.5, 1.5, 5.0
-        attempts = 0
+    async def wait_for_result(
+        self,
+        file_id: str,
+        timeout: float,
+        *,
+        pages: Optional[int] = None,
+        size_bytes: Optional[int] = None,
+        base_url: Optional[str] = None,
+    ) -> tuple[dict, dict[str, Any]]:
+        """Wait for the OCR result using the configured completion mode.
+
+        ``base_url`` must be the node that accepted the upload.
 
+        ``callback`` waits for the OCR service to post the result,
+        ``long_poll`` holds a GET open server-side; both fall back to
+        polling when the server does not cooperate.
+
+        Returns:
+            Tuple of (last OCR response, stats: completion mode, polls and
+            the polling stats described in _poll_for_result)
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + timeout
+        resp: Optional[dict] = None
+        stats: dict[str, Any] = {"completion": self.completion_mode, "polls": 0}
+
+        base_url = base_url or self.base_url
+        if self.completion_mode == "callback":
+            resp = await self._wait_for_callback(file_id, deadline, stats, base_url)
+        elif (
+            self.completion_mode == "long_poll"
+            and base_url not in self._long_poll_unsupported
+        ):
+            resp = await self._long_poll(file_id, deadline, stats, base_url)
+
+        if resp is not None:
+            if _is_ready(resp):
+                get_ocr_latency_model().observe(
+                    pages, size_bytes, loop.time() - started
+                )
+            return resp, stats
+
+        stats["completion"] = "poll"
+        resp, poll_stats = await self._poll_for_result(
+            file_id,
+            max(0.0, deadline - loop.time()),
+            pages=pages,
+            size_bytes=size_bytes,
+            base_url=base_url,
+        )
+        poll_stats["polls"] += stats["polls"]
+        return resp, {**stats, **poll_stats}
+
+    async def _wait_for_callback(
+        self, file_id: str, deadline: float, stats: dict[str, Any], base_url: str
+    ) -> Optional[dict]:
+        """Wait for the completion callback, checking by GET every
+        ``callback_safety_poll`` seconds in case a callback is lost."""
+        loop = asyncio.get_running_loop()
+        registry = get_ocr_callback_registry()
+        await registry.expect(file_id)
+        try:
+            while True:
+                remaining = deadline - loop.time()
+                payload = await registry.wait(
+                    file_id, max(0.0, min(self.callback_safety_poll, remaining))
+                )
+                if payload is not None:
+                    return payload
+
+                stats["polls"] += 1
+                resp = await self.get_result(file_id, base_url=base_url)
+                if _is_ready(resp) or _is_failed(resp) or loop.time() >= deadline:
+                    if not _is_ready(resp):
+                        logger.warning(
+                            "OCR callback not received, file_id=%s, status=%s",
+                            file_id,
+                            resp.get("status"),
+                        )
+                    return resp
+        finally:
+            # A later callback is spooled unclaimed and pruned
+            await registry.forget(file_id)
+
+    async def _long_poll(
+        self, file_id: str, deadline: float, stats: dict[str, Any], base_url: str
+    ) -> Optional[dict]:
+        """Hold GETs open server-side until ready; None if unsupported."""
+        loop = asyncio.get_running_loop()
         while True:
-            attempts += 1
-            resp = await self.get_result(file_id)
-            status = str(resp.get("status", "")).lower()
-
-            if (
-                status in {"done", "completed", "success", "finished", "ready"}
-                or resp.get("result") is not None
-            ):
-                logger.debug("OCR ready after %d checks, file_id=%s", attempts, file_id)
+            wait = max(0.0, min(self.long_poll_wait, deadline - loop.time()))
+            sent_at = loop.time()
+            stats["polls"] += 1
+            resp = await self.get_result(file_id, wait=wait, base_url=base_url)
+            if _is_ready(resp) or _is_failed(resp) or loop.time() >= deadline:
                 return resp
-            if (
-                status in {"failed", "error"}
-                or asyncio.get_event_loop().time() >= deadline
-            ):
+            if loop.time() - sent_at < min(wait, 1.0) / 2:
+                # Answered "pending" without holding the request: the server
+                # ignores ?wait=, so stop trying and poll instead.
+                logger.info(f"OCR node {base_url} does not support long-poll, polling")
+                self._long_poll_unsupported.add(base_url)
+                return None
+
+    async def _poll_for_result(
+        self,
+        file_id: str,
+        timeout: float,
+        *,
+        pages: Optional[int] = None,
+        size_bytes: Optional[int] = None,
+        base_url: Optional[str] = None,
+    ) -> tuple[dict, dict[str, Any]]:
+        """Poll OCR service until result is ready.
+
+        Poll times come from the latency model for this page count and file
+        size (see ocr_latency.py); completion times feed back into it.
+
+        Returns:
+            Tuple of (last OCR response, poll stats: polls, predicted_seconds
+            and, when ready, ready_slack_seconds - an upper bound on how long
+            the result sat ready before it was noticed)
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + timeout
+        model = get_ocr_latency_model()
+        schedule = model.schedule(pages, size_bytes)
+        stats: dict[str, Any] = {
+            "polls": 0,
+            "predicted_seconds": schedule.predicted_seconds,
+        }
+        last_pending_at: Optional[float] = None
+
+        for delay in schedule.delays():
+            delay = min(delay, max(0.0, deadline - loop.time()))
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            stats["polls"] += 1
+            resp = await self.get_result(file_id, base_url=base_url)
+            elapsed = loop.time() - started
+
+            if _is_ready(resp):
+                since = last_pending_at or 0.0
+                stats["ready_slack_seconds"] = elapsed - since
+                # Ready somewhere in (since, elapsed]; the midpoint is unbiased
+                # unless the first check already hit, then elapsed is an upper
+                # bound and the next schedule starts earlier.
+                model.observe(
+                    pages,
+                    size_bytes,
+                    elapsed if last_pending_at is None else (since + elapsed) / 2,
+                )
+                logger.debug(
+                    "OCR ready after %d checks, file_id=%s", stats["polls"], file_id
+                )
+                return resp, stats
+            if _is_failed(resp) or loop.time() >= deadline:
                 logger.warning(
                     "OCR failed or timed out after %d checks, file_id=%s, status=%s",
-                    attempts,
+                    stats["polls"],
                     file_id,
-                    status,
+                    resp.get("status"),
                 )
-                return resp
+                return resp, stats
+
+            last_pending_at = elapsed
+
+        raise RuntimeError("unreachable: poll schedule is infinite")
+
+
+_default_client: Optional[TesseractAsyncClient] = None
+
+
+def set_default_ocr_client(client: Optional[TesseractAsyncClient]) -> None:
+    """Register the process-wide pooled OCR client (None to unregister)."""
+    global _default_client
+    _default_client = client
+
+
+def get_default_ocr_client() -> Optional[TesseractAsyncClient]:
+    return _default_client
 
-            await asyncio.sleep(interval)
-            interval = min(interval * backoff, max_interval)
+
+def create_ocr_client_from_settings() -> TesseractAsyncClient:
+    """Build the pooled OCR client from OCRSettings."""
+    return TesseractAsyncClient(
+        timeout=OCR_CLIENT_TIMEOUT_SECONDS,
+        max_connections=ocr_settings.OCR_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=ocr_settings.OCR_HTTP_MAX_KEEPALIVE,
+        keepalive_expiry=ocr_settings.OCR_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        http2=ocr_settings.OCR_HTTP2,
+        completion_mode=ocr_settings.OCR_COMPLETION_MODE,
+        callback_url=ocr_settings.OCR_CALLBACK_URL or None,
+        long_poll_wait=ocr_settings.OCR_LONG_POLL_WAIT_SECONDS,
+        callback_safety_poll=ocr_settings.OCR_CALLBACK_SAFETY_POLL_SECONDS,
+        base_urls=ocr_settings.base_urls,
+        failure_threshold=ocr_settings.OCR_ENDPOINT_FAILURE_THRESHOLD,
+        ejection_seconds=ocr_settings.OCR_ENDPOINT_EJECT_SECONDS,
+    )
+
+
+async def _upload_and_wait(
+    client: TesseractAsyncClient,
+    file_path: str,
+    wait: bool,
+    timeout: float,
+    pages: Optional[int] = None,
+) -> dict[str, Any]:
+    endpoint = client.endpoints.acquire()
+    # Only transport errors, timeouts and 5xx count against the node; a
+    # document-level OCR failure still means it answered. Cancellation,
+    # 4xx (bad request/document) and local errors leave its health as is.
+    healthy: Optional[bool] = None
+    try:
+        result = await _upload_and_wait_on(
+            client, endpoint.url, file_path, wait, timeout, pages
+        )
+        resp = result.get("result")
+        healthy = resp is None or _is_ready(resp) or _is_failed(resp)
+        return result
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code >= 500:
+            healthy = False
+        raise
+    except httpx.TransportError:
+        healthy = False
+        raise
+    finally:
+        client.endpoints.release(endpoint, success=healthy)
+
+
+async def _upload_and_wait_on(
+    client: TesseractAsyncClient,
+    base_url: str,
+    file_path: str,
+    wait: bool,
+    timeout: float,
+    pages: Optional[int],
+) -> dict[str, Any]:
+    upload_started_at = time.perf_counter()
+    upload_resp = await client.upload(file_path, base_url=base_url)
+    upload_seconds = time.perf_counter() - upload_started_at
+    file_id = upload_resp.get("id")
+
+    if not wait or not file_id:
+        return {
+            "success": bool(file_id),
+            "error": None if file_id else "Upload failed",
+            "id": file_id,
+            "endpoint": base_url,
+            "upload": upload_resp,
+            "result": None,
+            "timings": {
+                "upload_started_at": upload_started_at,
+                "upload_seconds": upload_seconds,
+            },
+        }
+
+    wait_started_at = time.perf_counter()
+    result, poll_stats = await client.wait_for_result(
+        file_id,
+        timeout,
+        pages=pages,
+        size_bytes=os.path.getsize(file_path),
+        base_url=base_url,
+    )
+    return {
+        "success": True,
+        "error": None,
+        "id": file_id,
+        "endpoint": base_url,
+        "upload": upload_resp,
+        "result": result,
+        "timings": {
+            "upload_started_at": upload_started_at,
+            "upload_seconds": upload_seconds,
+            "wait_started_at": wait_started_at,
+            "wait_seconds": time.perf_counter() - wait_started_at,
+            **poll_stats,
+        },
+    }
 
 
 async def ask_tesseract_async(
@@ -114,40 +463,39 @@ async def ask_tesseract_async(
     timeout: float = OCR_TIMEOUT_SECONDS,
     client_timeout: float = OCR_CLIENT_TIMEOUT_SECONDS,
     verify: bool = True,
+    client: Optional[TesseractAsyncClient] = None,
+    pages: Optional[int] = None,
 ) -> dict[str, Any]:
+    """Upload a PDF and (optionally) wait for its OCR result.
+
+    Uses ``client`` or the registered default pooled client when available;
+    otherwise opens a short-lived client for this call.
+    """
+    client = client or _default_client
+    if client is not None and base_url is None:
+        return await _upload_and_wait(client, file_path, wait, timeout, pages)
+
     async with TesseractAsyncClient(
         base_url=base_url, timeout=client_timeout, verify=verify
-    ) as client:
-        upload_resp = await client.upload(file_path)
-        file_id = upload_resp.get("id")
-
-        if not wait or not file_id:
-            return {
-                "success": bool(file_id),
-                "error": None if file_id else "Upload failed",
-                "id": file_id,
-                "upload": upload_resp,
-                "result": None,
-            }
-
-        result = await client.wait_for_result(file_id, timeout)
-        return {
-            "success": True,
-            "error": None,
-            "id": file_id,
-            "upload": upload_resp,
-            "result": result,
-        }
+    ) as own_client:
+        return await _upload_and_wait(own_client, file_path, wait, timeout, pages)
 
 
-def ask_tesseract(
+async def ask_tesseract(
     pdf_path: str,
     output_dir: str = "output",
     save_json: bool = True,
     *,
     base_url: Optional[str] = None,
     verify: bool = True,
+    client: Optional[TesseractAsyncClient] = None,
+    pages: Optional[int] = None,
 ) -> dict[str, Any]:
+    """Run OCR for a PDF or image on the caller's event loop.
+
+    Image-to-PDF conversion is CPU-bound and is off-loaded to a worker
+    thread; upload and polling are awaited directly.
+    """
     result = detect_file_type_from_path(pdf_path)
     if result is None:
         raise ValueError(f"Unsupported file type: {pdf_path}")
@@ -156,13 +504,19 @@ def ask_tesseract(
 
     if detected_type in ("jpeg", "png", "tiff"):
         converted_pdf = f"{os.path.splitext(pdf_path)[0]}_converted.pdf"
-        work_path = convert_image_to_pdf(pdf_path, output_path=converted_pdf)
+        work_path = await asyncio.to_thread(
+            convert_image_to_pdf, pdf_path, output_path=converted_pdf
+        )
     else:
         work_path = pdf_path
         converted_pdf = None
 
-    async_result = asyncio.run(
-        ask_tesseract_async(file_path=work_path, base_url=base_url, verify=verify)
+    async_result = await ask_tesseract_async(
+        file_path=work_path,
+        base_url=base_url,
+        verify=verify,
+        client=client,
+        pages=pages,
     )
 
     success, error, raw = parse_ocr_result(async_result)
@@ -179,4 +533,5 @@ def ask_tesseract(
         "raw_obj": raw,
         "raw_path": raw_path,
         "converted_pdf": converted_pdf,
+        "timings": async_result.get("timings", {}),
     }
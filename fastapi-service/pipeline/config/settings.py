@@ -7,9 +7,12 @@ UTC_OFFSET_HOURS = 5
 
 # File names for run artifacts
 INPUT_FILE = "00_input{ext}"
+OCR_INPUT_FILE = "00_input_ocr.jpg"  # preprocessed photo sent to OCR
+OCR_INPUT_PDF_FILE = "00_input_ocr.pdf"  # input without blank/duplicate pages
 OCR_RESULT_FILE = "01_ocr.json"
 LLM_DTC_RESULT_FILE = "02_llm_dtc.json"
 LLM_EXT_RESULT_FILE = "03_llm_ext.json"
+LLM_COMBINED_RESULT_FILE = "02_llm_combined.json"
 FINAL_RESULT_FILE = "04_final.json"
 
 # =============================================================================
@@ -22,6 +25,18 @@ OCR_TIMEOUT_SECONDS = 300  # Total timeout for OCR processing (5 min)
 OCR_CLIENT_TIMEOUT_SECONDS = 60  # HTTP client timeout for OCR requests
 
 
+# Text layer fast path (born-digital PDFs skip OCR when every page passes)
+TEXT_LAYER_MIN_PAGE_CHARS = 40  # Non-whitespace characters per page
+TEXT_LAYER_MIN_CYRILLIC_RATIO = 0.5  # Cyrillic letters / all letters
+TEXT_LAYER_MAX_GARBAGE_RATIO = 0.05  # Control/private-use/odd symbols / chars
+
+# Blank/duplicate page elimination (scanned pages only)
+BLANK_PAGE_MAX_INK_RATIO = 0.0005  # Share of ink pixels below which a page is blank
+DUPLICATE_PAGE_MAX_HASH_DISTANCE = 0.02  # Differing dHash bits (of 1024) for a duplicate
+
+# Job status long-poll
+JOB_STATUS_MAX_WAIT_SECONDS = 30  # Upper bound for GET /v2/jobs/{run_id}?wait=
+
 # =============================================================================
 # Retry Configuration
 # =============================================================================
@@ -52,6 +67,9 @@ NAME_MAX_LENGTH = 100  # Maximum length for first/last/second name
 # S3 paths
 S3_PATH_MAX_LENGTH = 1024  # Maximum length for S3 object paths
 
+# Batch verification
+KAFKA_BATCH_MAX_ITEMS = 50  # Maximum events per /v2/kafka/verify-batch request
+
 # =============================================================================
 # Error Handling
 # =============================================================================
@@ -17,6 +17,101 @@ from pipeline.utils.retry import retry_on_db_error
 logger = logging.getLogger(__name__)
 
 
+async def _insert_stage_timings(
+    conn, run_id: str | None, stage_timings: list[dict[str, Any]]
+) -> None:
+    """Insert per-stage timings for a run into verification_run_stages.
+
+    Failures are logged and swallowed so that a missing child table (e.g.
+    before `migrate_stage_timings.py` has run) never blocks the run insert.
+    """
+    if not stage_timings:
+        return
+
+    query = """
+        INSERT INTO verification_run_stages (
+            run_id, stage, started_offset_seconds, wall_seconds, cpu_seconds, outcome
+        ) VALUES ($1, $2, $3, $4, $5, $6)
+    """
+    try:
+        await conn.executemany(
+            query,
+            [
+                (
+                    run_id,
+                    t.get("stage"),
+                    t.get("started_offset_seconds"),
+                    t.get("wall_seconds"),
+                    t.get("cpu_seconds"),
+                    t.get("outcome"),
+                )
+                for t in stage_timings
+            ],
+        )
+    except Exception as e:
+        logger.warning(f"Failed to insert stage timings for run_id={run_id}: {e}")
+
+
+_INSERT_RUN_SQL = """
+    INSERT INTO verification_runs (
+        run_id, trace_id, created_at, completed_at, processing_time_seconds,
+        external_request_id, external_s3_path, external_iin,
+        external_first_name, external_last_name, external_second_name,
+        status,
+        pipeline_error_code, pipeline_error_message, pipeline_error_category, pipeline_error_retryable,
+        extracted_fio, extracted_doc_date, extracted_single_doc_type,
+        extracted_doc_type_known, extracted_doc_type,
+        rule_fio_match, rule_doc_date_valid, rule_doc_type_known,
+        rule_single_doc_type, rule_verdict, rule_errors
+    ) VALUES (
+        $1, $2, $3, $4, $5,
+        $6, $7, $8, $9, $10, $11,
+        $12,
+        $13, $14, $15, $16,
+        $17, $18, $19, $20, $21,
+        $22, $23, $24, $25, $26, $27
+    )
+"""
+
+
+def _run_row(final_json: dict[str, Any]) -> tuple:
+    """Map final.json to the positional parameters of _INSERT_RUN_SQL."""
+    return (
+        final_json.get("run_id"),
+        final_json.get("trace_id"),
+        parse_iso_timestamp(final_json.get("created_at")),
+        parse_iso_timestamp(final_json.get("completed_at")),
+        final_json.get("processing_time_seconds"),
+        # External metadata
+        final_json.get("external_request_id"),
+        final_json.get("external_s3_path"),
+        final_json.get("external_iin"),
+        final_json.get("external_first_name"),
+        final_json.get("external_last_name"),
+        final_json.get("external_second_name"),
+        # Status
+        final_json.get("status"),
+        # Pipeline error fields
+        final_json.get("pipeline_error_code"),
+        final_json.get("pipeline_error_message"),
+        final_json.get("pipeline_error_category"),
+        final_json.get("pipeline_error_retryable"),
+        # Extracted data
+        final_json.get("extracted_fio"),
+        final_json.get("extracted_doc_date"),
+        final_json.get("extracted_single_doc_type"),
+        final_json.get("extracted_doc_type_known"),
+        final_json.get("extracted_doc_type"),
+        # Rule checks
+        final_json.get("rule_fio_match"),
+        final_json.get("rule_doc_date_valid"),
+        final_json.get("rule_doc_type_known"),
+        final_json.get("rule_single_doc_type"),
+        final_json.get("rule_verdict"),
+        json.dumps(final_json.get("rule_errors", [])),  # Convert list to JSON string
+    )
+
+
 @retry_on_db_error(max_retries=3)
 async def insert_verification_run(
     final_json: dict[str, Any], db_manager: DatabaseManager
@@ -34,110 +129,58 @@ async def insert_verification_run(
         Exception: If all retries exhausted
     """
     pool = await db_manager.get_pool()
-
-    # Extract fields from final_json using centralized timestamp parser
     run_id = final_json.get("run_id")
-    trace_id = final_json.get("trace_id")
-    created_at = parse_iso_timestamp(final_json.get("created_at"))
-    completed_at = parse_iso_timestamp(final_json.get("completed_at"))
-    processing_time = final_json.get("processing_time_seconds")
-
-    # External metadata
-    ext_request_id = final_json.get("external_request_id")
-    ext_s3_path = final_json.get("external_s3_path")
-    ext_iin = final_json.get("external_iin")
-    ext_first_name = final_json.get("external_first_name")
-    ext_last_name = final_json.get("external_last_name")
-    ext_second_name = final_json.get("external_second_name")
-
-    # Status
-    status = final_json.get("status")
-
-    # Pipeline error fields
-    pipeline_error_code = final_json.get("pipeline_error_code")
-    pipeline_error_message = final_json.get("pipeline_error_message")
-    pipeline_error_category = final_json.get("pipeline_error_category")
-    pipeline_error_retryable = final_json.get("pipeline_error_retryable")
-
-    # Extracted data
-    extracted_fio = final_json.get("extracted_fio")
-    extracted_doc_date = final_json.get("extracted_doc_date")
-    extracted_single_doc_type = final_json.get("extracted_single_doc_type")
-    extracted_doc_type_known = final_json.get("extracted_doc_type_known")
-    extracted_doc_type = final_json.get("extracted_doc_type")
-
-    # Rule checks
-    rule_fio_match = final_json.get("rule_fio_match")
-    rule_doc_date_valid = final_json.get("rule_doc_date_valid")
-    rule_doc_type_known = final_json.get("rule_doc_type_known")
-    rule_single_doc_type = final_json.get("rule_single_doc_type")
-    rule_verdict = final_json.get("rule_verdict")
-    rule_errors = json.dumps(
-        final_json.get("rule_errors", [])
-    )  # Convert list to JSON string
-
-    query = """
-        INSERT INTO verification_runs (
-            run_id, trace_id, created_at, completed_at, processing_time_seconds,
-            external_request_id, external_s3_path, external_iin,
-            external_first_name, external_last_name, external_second_name,
-            status,
-            pipeline_error_code, pipeline_error_message, pipeline_error_category, pipeline_error_retryable,
-            extracted_fio, extracted_doc_date, extracted_single_doc_type,
-            extracted_doc_type_known, extracted_doc_type,
-            rule_fio_match, rule_doc_date_valid, rule_doc_type_known,
-            rule_single_doc_type, rule_verdict, rule_errors
-        ) VALUES (
-            $1, $2, $3, $4, $5,
-            $6, $7, $8, $9, $10, $11,
-            $12,
-            $13, $14, $15, $16,
-            $17, $18, $19, $20, $21,
-            $22, $23, $24, $25, $26, $27
-        )
-    """
 
     async with pool.acquire() as conn:
-        await conn.execute(
-            query,
-            run_id,
-            trace_id,
-            created_at,
-            completed_at,
-            processing_time,
-            ext_request_id,
-            ext_s3_path,
-            ext_iin,
-            ext_first_name,
-            ext_last_name,
-            ext_second_name,
-            status,
-            pipeline_error_code,
-            pipeline_error_message,
-            pipeline_error_category,
-            pipeline_error_retryable,
-            extracted_fio,
-            extracted_doc_date,
-            extracted_single_doc_type,
-            extracted_doc_type_known,
-            extracted_doc_type,
-            rule_fio_match,
-            rule_doc_date_valid,
-            rule_doc_type_known,
-            rule_single_doc_type,
-            rule_verdict,
-            rule_errors,
+        await conn.execute(_INSERT_RUN_SQL, *_run_row(final_json))
+        await _insert_stage_timings(
+            conn, run_id, final_json.get("stage_timings") or []
         )
 
     logger.info(
         f"✅ DB INSERT SUCCESS | "
         f"run_id={run_id} | "
-        f"status={status} | "
-        f"verdict={rule_verdict}"
+        f"status={final_json.get('status')} | "
+        f"verdict={final_json.get('rule_verdict')}"
     )
     return True
 
 
+@retry_on_db_error(max_retries=3)
+async def insert_verification_runs_batch(
+    final_jsons: list[dict[str, Any]], db_manager: DatabaseManager
+) -> bool:
+    """Insert many verification runs in one transaction (executemany).
+
+    Args:
+        final_jsons: List of final.json dicts
+        db_manager: Database manager instance
+
+    Returns:
+        True if insert succeeded
+
+    Raises:
+        Exception: If all retries exhausted
+    """
+    if not final_jsons:
+        return True
+
+    pool = await db_manager.get_pool()
+
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            await conn.executemany(
+                _INSERT_RUN_SQL, [_run_row(fj) for fj in final_jsons]
+            )
+        for fj in final_jsons:
+            await _insert_stage_timings(
+                conn, fj.get("run_id"), fj.get("stage_timings") or []
+            )
+
+    logger.info(f"✅ DB BATCH INSERT SUCCESS | runs={len(final_jsons)}")
+    return True
+
+
 @retry_on_db_error(max_retries=3)
 async def update_webhook_status(
     run_id: str,
@@ -192,3 +235,20 @@ async def update_webhook_status(
             f"Failed to update webhook status for {run_id}: {e}", exc_info=True
         )
         return False
+
+
+async def fetch_webhook_status(
+    run_id: str, db_manager: DatabaseManager
+) -> dict[str, Any] | None:
+    """Return ``{"webhook_status": ...}`` for a stored run, or None if absent.
+
+    Used by job retries to tell whether a previous attempt already inserted
+    the run (and delivered its webhook) before the worker died.
+    """
+    pool = await db_manager.get_pool()
+    async with pool.acquire() as conn:
+        row = await conn.fetchrow(
+            "SELECT webhook_status FROM verification_runs WHERE run_id = $1",
+            run_id,
+        )
+    return dict(row) if row is not None else None
@@ -141,6 +141,42 @@ class FinalJsonBuilder:
         )
         return self
 
+    def with_llm_usage(
+        self, mode: str, usage: dict[str, dict[str, int]]
+    ) -> "FinalJsonBuilder":
+        """Add LLM execution mode and per-call token usage (diagnostics only)."""
+        self.data.update({"llm_mode": mode, "llm_usage": usage})
+        return self
+
+    def with_stage_timings(self, stage_timings: list[dict]) -> "FinalJsonBuilder":
+        """Add per-stage wall/CPU time and outcome records."""
+        self.data["stage_timings"] = stage_timings
+        return self
+
+    def with_ocr_info(
+        self,
+        cache_status: str | None,
+        source: str | None = None,
+        preprocess: dict | None = None,
+        page_filter: dict | None = None,
+    ) -> "FinalJsonBuilder":
+        """Add OCR diagnostics.
+
+        Args:
+            cache_status: OCR cache hit/miss; None when cache disabled or unused
+            source: Where page text came from ("text_layer" or "ocr");
+                None when the pipeline stopped before the OCR stage
+            preprocess: Image preprocessing variant and before/after sizes;
+                None when preprocessing is disabled or not applicable
+            page_filter: Kept pages and dropped blank/duplicate pages;
+                None when no page was dropped
+        """
+        self.data["ocr_cache"] = cache_status
+        self.data["ocr_source"] = source
+        self.data["ocr_preprocess"] = preprocess
+        self.data["ocr_page_filter"] = page_filter
+        return self
+
     def build(self) -> dict[str, Any]:
         """Return final JSON dict."""
         return self.data
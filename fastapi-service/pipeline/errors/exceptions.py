@@ -202,3 +202,26 @@ class ExternalServiceError(ServerError):
             details=additional_details,
             **kwargs,
         )
+
+
+class ServiceOverloadedError(ServerError):
+    """Service is at capacity (503 Service Unavailable).
+
+    Raised when new work is rejected because queues or in-flight limits
+    are full. Retryable; ``retry_after`` (seconds) is sent to the client
+    as the ``Retry-After`` header.
+
+    Args:
+        resource: What is at capacity (e.g., "Job queue")
+        retry_after: Suggested delay before retrying, in seconds
+    """
+
+    def __init__(self, resource: str, retry_after: Optional[int] = None):
+        super().__init__(
+            message=f"{resource} is at capacity",
+            error_code="SERVICE_OVERLOADED",
+            http_status=503,
+            retryable=True,
+            details={"resource": resource, "retry_after_seconds": retry_after},
+        )
+        self.retry_after = retry_after
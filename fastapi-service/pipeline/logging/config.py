@@ -62,6 +62,9 @@ class StructuredFormatter(logging.Formatter):
             "duration_ms",
             "http_status",
             "retry_attempt",
+            "metric",
+            "metric_value",
+            "metric_tags",
         ]:
             if hasattr(record, key):
                 log_data[key] = getattr(record, key)
@@ -0,0 +1 @@
+"""Pipeline metrics module."""
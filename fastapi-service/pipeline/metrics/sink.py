@@ -0,0 +1,88 @@
+"""
+Pluggable metrics sink for pipeline instrumentation.
+
+Pipeline code reports measurements through `get_metrics_sink()`; the
+default sink writes them as structured log records, which the log
+aggregation stack can turn into metrics. Deployments with a real
+metrics backend (StatsD, Prometheus, ...) install their own sink at
+startup via `set_metrics_sink()`.
+"""
+
+import logging
+from typing import Optional, Protocol
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsSink(Protocol):
+    """Interface every metrics sink must implement."""
+
+    def timing(
+        self, name: str, seconds: float, tags: Optional[dict[str, str]] = None
+    ) -> None:
+        """Record a duration in seconds."""
+
+    def increment(
+        self, name: str, value: int = 1, tags: Optional[dict[str, str]] = None
+    ) -> None:
+        """Increment a counter."""
+
+    def gauge(
+        self, name: str, value: float, tags: Optional[dict[str, str]] = None
+    ) -> None:
+        """Record a point-in-time value."""
+
+
+class LoggingMetricsSink:
+    """Emit every measurement as a structured log record."""
+
+    def _emit(self, kind: str, name: str, value: float, tags: Optional[dict]) -> None:
+        logger.info(
+            "metric %s %s=%s",
+            kind,
+            name,
+            value,
+            extra={"metric": name, "metric_value": value, "metric_tags": tags or {}},
+        )
+
+    def timing(
+        self, name: str, seconds: float, tags: Optional[dict[str, str]] = None
+    ) -> None:
+        self._emit("timing", name, round(seconds, 6), tags)
+
+    def increment(
+        self, name: str, value: int = 1, tags: Optional[dict[str, str]] = None
+    ) -> None:
+        self._emit("counter", name, value, tags)
+
+    def gauge(
+        self, name: str, value: float, tags: Optional[dict[str, str]] = None
+    ) -> None:
+        self._emit("gauge", name, value, tags)
+
+
+class NullMetricsSink:
+    """Discard all measurements."""
+
+    def timing(self, name, seconds, tags=None) -> None:
+        pass
+
+    def increment(self, name, value=1, tags=None) -> None:
+        pass
+
+    def gauge(self, name, value, tags=None) -> None:
+        pass
+
+
+_sink: MetricsSink = LoggingMetricsSink()
+
+
+def get_metrics_sink() -> MetricsSink:
+    """Return the process-wide metrics sink."""
+    return _sink
+
+
+def set_metrics_sink(sink: MetricsSink) -> None:
+    """Replace the process-wide metrics sink."""
+    global _sink
+    _sink = sink
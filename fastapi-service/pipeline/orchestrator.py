@@ -1,17 +1,28 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import shutil
 import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from functools import wraps
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Awaitable, Callable, Optional
 
-from pipeline.clients.tesseract_async_client import ask_tesseract
+from core.settings import llm_settings, ocr_settings
+from pipeline.cache.ocr_cache import get_ocr_cache
+from pipeline.clients.tesseract_async_client import (
+    TesseractAsyncClient,
+    ask_tesseract,
+)
 from pipeline.config.settings import (
     FINAL_RESULT_FILE,
     INPUT_FILE,
+    OCR_INPUT_FILE,
+    OCR_INPUT_PDF_FILE,
+    LLM_COMBINED_RESULT_FILE,
     LLM_DTC_RESULT_FILE,
     LLM_EXT_RESULT_FILE,
     MAX_PDF_PAGES,
@@ -19,14 +30,30 @@ from pipeline.config.settings import (
     UTC_OFFSET_HOURS,
 )
 from pipeline.errors.codes import ErrorCode, make_error
+from pipeline.metrics.sink import get_metrics_sink
 from pipeline.models.dto import DocTypeCheck, ExtractorResult
+from pipeline.processors.agent_combined import classify_and_extract
 from pipeline.processors.agent_doc_type_checker import check_single_doc_type
 from pipeline.processors.agent_extractor import extract_doc_data
+from pipeline.processors.image_preprocess import preprocess_image, preprocess_variant
+from pipeline.processors.page_filter import (
+    filter_pdf_pages,
+    filter_tiff_frames,
+    page_filter_variant,
+)
+from pipeline.processors.pdf_splitter import split_pdf_pages
+from pipeline.processors.text_layer import extract_text_layer
 from pipeline.processors.validator import validate_run
 from pipeline.utils.file_detection import detect_file_type_from_path
-from pipeline.utils.io_utils import copy_file as util_copy_file
+from pipeline.utils.io_utils import adopt_file, link_or_copy, sha256_file
 from pipeline.utils.io_utils import write_json as util_write_json
-from pipeline.utils.parsers import parse_llm_output, parse_ocr_output
+from pipeline.utils.pdf_pages import count_pdf_pages
+from pipeline.utils.parsers import (
+    parse_llm_output,
+    parse_llm_usage,
+    parse_ocr_output,
+    split_combined_llm_output,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -48,38 +75,6 @@ def _now_iso() -> str:
     return datetime.now(timezone(timedelta(hours=UTC_OFFSET_HOURS))).isoformat()
 
 
-def _count_pdf_pages(pdf_path: str) -> Optional[int]:
-    """Count PDF pages using pypdf or PyPDF2.
-
-    Args:
-        pdf_path: Path to PDF file
-
-    Returns:
-        Number of pages or None if counting fails
-    """
-    try:
-        import pypdf as _pypdf  # type: ignore
-
-        reader = _pypdf.PdfReader(pdf_path)
-        page_count = len(reader.pages)
-        logger.debug(f"PDF page count: {page_count} pages for {pdf_path}")
-        return page_count
-    except Exception:
-        logger.debug("pypdf failed to count pages", exc_info=True)
-
-    try:
-        import PyPDF2 as _pypdf2  # type: ignore
-
-        reader = _pypdf2.PdfReader(pdf_path)
-        page_count = len(reader.pages)
-        logger.debug(f"PDF page count (PyPDF2): {page_count} for {pdf_path}")
-        return page_count
-    except Exception:
-        logger.debug("PyPDF2 failed to count pages", exc_info=True)
-
-    return None
-
-
 @dataclass
 class PipelineContext:
     fio: Optional[str]
@@ -93,7 +88,15 @@ class PipelineContext:
     # populated during run
     dirs: dict[str, Path] = field(default_factory=dict)
     saved_path: Optional[Path] = None
+    # what is sent to OCR when it differs from saved_path (preprocessed photo)
+    ocr_input_path: Optional[Path] = None
+    ocr_variant: str = ""
+    # original page numbers of the pages sent to OCR (blank/duplicate dropped)
+    page_map: Optional[list[int]] = None
     size_bytes: Optional[int] = None
+    page_count: Optional[int] = None
+    input_sha256: Optional[str] = None
+    adopt_source: bool = False
     pages_obj: Optional[list] = None
     doc_type_result: Optional[dict] = None
     extractor_result: Optional[dict] = None
@@ -121,14 +124,113 @@ def _mk_run_dirs(runs_root: Path, run_id: str) -> dict[str, Path]:
     return {"base": base_dir}
 
 
+def _record_stage(
+    ctx: PipelineContext,
+    name: str,
+    started_at: float,
+    wall_seconds: float,
+    cpu_seconds: Optional[float],
+    outcome: str,
+) -> None:
+    """Append a stage timing to ``ctx.artifacts`` and report it to metrics."""
+    ctx.artifacts.setdefault("stage_timings", []).append(
+        {
+            "stage": name,
+            "started_offset_seconds": round(started_at - ctx.t0, 6),
+            "wall_seconds": round(wall_seconds, 6),
+            "cpu_seconds": round(cpu_seconds, 6) if cpu_seconds is not None else None,
+            "outcome": outcome,
+        }
+    )
+    tags = {"stage": name, "outcome": outcome}
+    sink = get_metrics_sink()
+    sink.timing("pipeline.stage.wall_seconds", wall_seconds, tags)
+    if cpu_seconds is not None:
+        sink.timing("pipeline.stage.cpu_seconds", cpu_seconds, tags)
+
+
+async def _timed_phase(ctx: PipelineContext, name: str, awaitable: Awaitable) -> Any:
+    """Await ``awaitable`` and record it as a sub-phase timing (no CPU time)."""
+    outcome = "ok"
+    started_at = time.perf_counter()
+    try:
+        return await awaitable
+    except asyncio.CancelledError:
+        outcome = "cancelled"
+        raise
+    except Exception as exc:
+        outcome = type(exc).__name__
+        raise
+    finally:
+        _record_stage(
+            ctx, name, started_at, time.perf_counter() - started_at, None, outcome
+        )
+
+
+def _merge_ocr_timings(per_page: Any) -> dict[str, Any]:
+    """Combine per-page OCR timings into one span per phase.
+
+    Each phase runs from its earliest start to its latest end across
+    pages; poll counts are summed.
+    """
+    merged: dict[str, Any] = {}
+    per_page = [t for t in per_page if t]
+    for phase in ("upload", "wait"):
+        spans = [
+            (t[f"{phase}_started_at"], t[f"{phase}_started_at"] + t[f"{phase}_seconds"])
+            for t in per_page
+            if t.get(f"{phase}_started_at") is not None
+            and t.get(f"{phase}_seconds") is not None
+        ]
+        if spans:
+            started_at = min(start for start, _ in spans)
+            merged[f"{phase}_started_at"] = started_at
+            merged[f"{phase}_seconds"] = max(end for _, end in spans) - started_at
+    polls = [t["polls"] for t in per_page if t.get("polls") is not None]
+    if polls:
+        merged["polls"] = sum(polls)
+    return merged
+
+
 def stage(name: str) -> Callable:
-    """Decorator for pipeline stage functions."""
+    """Decorator for async pipeline stage coroutines.
+
+    Records wall time, CPU time and outcome of every stage invocation in
+    ``ctx.artifacts["stage_timings"]`` and reports them to the metrics
+    sink. CPU time is measured process-wide, so with concurrent stages
+    (or other requests on the same worker) it is an upper bound.
+    Outcome is ``ok``, the ``StageError`` code, ``cancelled`` or the name
+    of an unexpected exception type.
+    """
 
     def deco(
-        fn: Callable[[Any, PipelineContext], Any],
-    ) -> Callable[[Any, PipelineContext], Any]:
-        def wrapper(self, ctx: PipelineContext) -> Any:
-            return fn(self, ctx)
+        fn: Callable[..., Awaitable[Any]],
+    ) -> Callable[..., Awaitable[Any]]:
+        @wraps(fn)
+        async def wrapper(self, ctx: PipelineContext, *args, **kwargs) -> Any:
+            outcome = "ok"
+            started_at = time.perf_counter()
+            cpu_started_at = time.process_time()
+            try:
+                return await fn(self, ctx, *args, **kwargs)
+            except StageError as se:
+                outcome = se.code
+                raise
+            except asyncio.CancelledError:
+                outcome = "cancelled"
+                raise
+            except Exception as exc:
+                outcome = type(exc).__name__
+                raise
+            finally:
+                _record_stage(
+                    ctx,
+                    name,
+                    started_at,
+                    time.perf_counter() - started_at,
+                    time.process_time() - cpu_started_at,
+                    outcome,
+                )
 
         return wrapper
 
@@ -136,13 +238,22 @@ def stage(name: str) -> Callable:
 
 
 class PipelineRunner:
-    def __init__(self, runs_root: Path) -> None:
+    def __init__(
+        self, runs_root: Path, ocr_client: Optional[TesseractAsyncClient] = None
+    ) -> None:
         self.runs_root = runs_root
+        # None uses the process-wide pooled client registered at startup
+        self.ocr_client = ocr_client
         self.logger = logger
 
     def _finalize_timing_artifacts(self, ctx: PipelineContext) -> None:
         ctx.artifacts["duration_seconds"] = time.perf_counter() - ctx.t0
 
+    def _record_llm_usage(self, ctx: PipelineContext, call: str, raw: str) -> None:
+        usage = parse_llm_usage(raw)
+        if usage:
+            ctx.artifacts.setdefault("llm_usage", {})[call] = usage
+
     def _build_external_metadata_obj(self, ctx: PipelineContext):
         from pipeline.database.models import ExternalMetadata
 
@@ -172,6 +283,16 @@ class PipelineRunner:
                 error_spec.retryable,
             )
             .with_timing(completed_at, processing_time)
+            .with_llm_usage(
+                llm_settings.LLM_EXECUTION_MODE, ctx.artifacts.get("llm_usage", {})
+            )
+            .with_stage_timings(ctx.artifacts.get("stage_timings", []))
+            .with_ocr_info(
+                cache_status=ctx.artifacts.get("ocr_cache"),
+                source=ctx.artifacts.get("ocr_source"),
+                preprocess=ctx.artifacts.get("preprocess"),
+                page_filter=ctx.artifacts.get("page_filter"),
+            )
             .build()
         )
 
@@ -208,6 +329,16 @@ class PipelineRunner:
                 rule_errors=rule_errors,
             )
             .with_timing(completed_at, processing_time)
+            .with_llm_usage(
+                llm_settings.LLM_EXECUTION_MODE, ctx.artifacts.get("llm_usage", {})
+            )
+            .with_stage_timings(ctx.artifacts.get("stage_timings", []))
+            .with_ocr_info(
+                cache_status=ctx.artifacts.get("ocr_cache"),
+                source=ctx.artifacts.get("ocr_source"),
+                preprocess=ctx.artifacts.get("preprocess"),
+                page_filter=ctx.artifacts.get("page_filter"),
+            )
             .build()
         )
 
@@ -218,7 +349,7 @@ class PipelineRunner:
         return str(final_path)
 
     @stage("acquire")
-    def _stage_acquire(self, ctx: PipelineContext) -> None:
+    async def _stage_acquire(self, ctx: PipelineContext) -> None:
         # Try filename extension first
         ext = Path(ctx.original_filename).suffix
 
@@ -239,37 +370,190 @@ class PipelineRunner:
                 ext = ".bin"
 
         ctx.saved_path = ctx.base_dir / INPUT_FILE.format(ext=ext)
+        # Owned sources are moved in; others are reflinked/hardlinked when
+        # runs/ shares their filesystem. Bytes are copied only across devices.
+        place = adopt_file if ctx.adopt_source else link_or_copy
         try:
-            util_copy_file(ctx.source_file_path, ctx.saved_path)
+            method = await asyncio.to_thread(
+                place, ctx.source_file_path, ctx.saved_path
+            )
         except Exception as exc:
             raise StageError("FILE_SAVE_FAILED", str(exc))
+        ctx.artifacts["acquire_method"] = method
+        get_metrics_sink().increment("pipeline.acquire.method", tags={"method": method})
 
         try:
             ctx.size_bytes = ctx.saved_path.stat().st_size
         except Exception:
             ctx.size_bytes = None
 
+        if ctx.input_sha256 is None:
+            try:
+                ctx.input_sha256 = await asyncio.to_thread(sha256_file, ctx.saved_path)
+            except Exception:
+                logger.warning("Failed to hash input file", exc_info=True)
+
         if ctx.saved_path.suffix.lower() == ".pdf":
-            pages = _count_pdf_pages(str(ctx.saved_path))
+            pages = await asyncio.to_thread(count_pdf_pages, str(ctx.saved_path))
+            ctx.page_count = pages
             if pages is not None and pages > MAX_PDF_PAGES:
                 raise StageError("PDF_TOO_MANY_PAGES", None)
+        else:
+            ctx.page_count = 1
+
+    @stage("preprocess")
+    async def _stage_preprocess(self, ctx: PipelineContext) -> None:
+        """Downscale/grayscale photos before OCR (PDFs are sent as is)."""
+        if not ocr_settings.OCR_PREPROCESS_ENABLED or ctx.saved_path is None:
+            return
+        if ctx.saved_path.suffix.lower() not in (".jpg", ".jpeg", ".png", ".tif", ".tiff"):
+            return
+
+        variant = preprocess_variant(
+            ocr_settings.OCR_PREPROCESS_MAX_LONG_EDGE,
+            ocr_settings.OCR_PREPROCESS_GRAYSCALE,
+            ocr_settings.OCR_PREPROCESS_JPEG_QUALITY,
+        )
+        result = await asyncio.to_thread(
+            preprocess_image,
+            str(ctx.saved_path),
+            str(ctx.base_dir / OCR_INPUT_FILE),
+            ocr_settings.OCR_PREPROCESS_MAX_LONG_EDGE,
+            ocr_settings.OCR_PREPROCESS_GRAYSCALE,
+            ocr_settings.OCR_PREPROCESS_JPEG_QUALITY,
+        )
+        if result is None:
+            ctx.artifacts["preprocess"] = {"variant": variant, "applied": False}
+            return
+
+        ctx.ocr_input_path = Path(result.output_path)
+        ctx.ocr_variant = variant
+        ctx.artifacts["preprocess"] = {
+            "variant": variant,
+            "applied": True,
+            **result.as_dict(),
+        }
+        get_metrics_sink().gauge(
+            "pipeline.preprocess.bytes_ratio", result.bytes_after / result.bytes_before
+        )
+        logger.info(
+            f"Preprocessed image for OCR: {result.bytes_before} -> "
+            f"{result.bytes_after} bytes, {result.size_before} -> {result.size_after}",
+            extra={"trace_id": ctx.trace_id, "run_id": ctx.run_id},
+        )
+
+    @stage("page_filter")
+    async def _stage_page_filter(self, ctx: PipelineContext) -> None:
+        """Drop blank and duplicate scanned pages before OCR."""
+        if not ocr_settings.OCR_PAGE_FILTER_ENABLED or ctx.saved_path is None:
+            return
+        suffix = ctx.saved_path.suffix.lower()
+        if suffix == ".pdf" and (ctx.page_count or 0) > 1:
+            filter_fn = filter_pdf_pages
+        elif suffix in (".tif", ".tiff"):
+            filter_fn = filter_tiff_frames
+        else:
+            return
 
-    @stage("ocr")
-    def _stage_ocr(self, ctx: PipelineContext) -> None:
         try:
-            ocr_result = ask_tesseract(
-                str(ctx.saved_path), output_dir=str(ctx.base_dir), save_json=False
+            result = await asyncio.to_thread(
+                filter_fn, str(ctx.saved_path), str(ctx.base_dir / OCR_INPUT_PDF_FILE)
             )
+        except Exception:
+            logger.warning("Page filter failed, sending all pages", exc_info=True)
+            return
+        if result is None:
+            return
+
+        ctx.ocr_input_path = Path(result.output_path)
+        ctx.page_map = result.kept_pages
+        ctx.ocr_variant = "+".join(v for v in (ctx.ocr_variant, page_filter_variant()) if v)
+        ctx.artifacts["page_filter"] = result.as_dict()
+        sink = get_metrics_sink()
+        for reason in ("blank", "duplicate"):
+            count = sum(1 for d in result.dropped if d["reason"] == reason)
+            if count:
+                sink.increment("pipeline.page_filter.dropped", count, {"reason": reason})
+        logger.info(
+            f"Dropped {len(result.dropped)} of "
+            f"{len(result.dropped) + len(result.kept_pages)} pages before OCR: "
+            f"{result.dropped}",
+            extra={"trace_id": ctx.trace_id, "run_id": ctx.run_id},
+        )
+
+    @staticmethod
+    def _ocr_path(ctx: PipelineContext) -> Path:
+        return ctx.ocr_input_path or ctx.saved_path
+
+    @staticmethod
+    def _restore_page_numbers(ctx: PipelineContext, pages: list) -> list:
+        """Map OCR page numbers (1..kept) back to the original document."""
+        if not ctx.page_map:
+            return pages
+        restored = []
+        for page in pages:
+            number = page.get("page_number")
+            if isinstance(number, int) and 1 <= number <= len(ctx.page_map):
+                page = {**page, "page_number": ctx.page_map[number - 1]}
+            restored.append(page)
+        return restored
+
+    @stage("text_layer")
+    async def _stage_text_layer(self, ctx: PipelineContext) -> bool:
+        """Take page text from a born-digital PDF's text layer instead of OCR.
+
+        Runs before the page filter, so a PDF that needs no OCR is not
+        filtered either. Returns True when the text layer was used.
+        """
+        if not self._use_text_layer(ctx):
+            return False
+        text_pages = await asyncio.to_thread(extract_text_layer, str(ctx.saved_path))
+        if not text_pages:
+            return False
+        logger.info(
+            f"Using embedded text layer ({len(text_pages)} pages), OCR skipped",
+            extra={"trace_id": ctx.trace_id, "run_id": ctx.run_id},
+        )
+        self._set_ocr_pages(ctx, text_pages, "text_layer")
+        return True
+
+    @stage("ocr")
+    async def _stage_ocr(self, ctx: PipelineContext) -> None:
+        cache = get_ocr_cache() if ctx.input_sha256 else None
+        if cache is not None:
+            cached_pages = await cache.get(ctx.input_sha256, ctx.ocr_variant)
+            ctx.artifacts["ocr_cache"] = "hit" if cached_pages else "miss"
+            if cached_pages:
+                logger.info(
+                    f"OCR cache hit for sha256={ctx.input_sha256}",
+                    extra={"trace_id": ctx.trace_id, "run_id": ctx.run_id},
+                )
+                self._set_ocr_pages(ctx, cached_pages, "ocr")
+                return
+
+        try:
+            if self._use_page_parallel_ocr(ctx):
+                ocr_result = await self._ocr_page_parallel(ctx)
+            else:
+                ocr_result = await ask_tesseract(
+                    str(self._ocr_path(ctx)),
+                    output_dir=str(ctx.base_dir),
+                    save_json=False,
+                    client=self.ocr_client,
+                    pages=len(ctx.page_map) if ctx.page_map else ctx.page_count,
+                )
         except Exception as exc:
             raise StageError("OCR_FAILED", f"OCR request failed: {exc}")
 
+        self._record_ocr_phases(ctx, ocr_result.get("timings") or {})
+
         if not ocr_result.get("success"):
             raise StageError("OCR_FAILED", str(ocr_result.get("error")))
 
         try:
             pages = parse_ocr_output(ocr_result.get("raw_obj", {}))
-            util_write_json(ctx.base_dir / OCR_RESULT_FILE, {"pages": pages})
-            ctx.pages_obj = pages
+            pages = self._restore_page_numbers(ctx, pages)
+            self._set_ocr_pages(ctx, pages, "ocr")
             if not ctx.pages_obj:
                 raise StageError("OCR_EMPTY_PAGES", None)
         except StageError:
@@ -277,16 +561,117 @@ class PipelineRunner:
         except Exception as exc:
             raise StageError("OCR_FILTER_FAILED", str(exc))
 
+        if cache is not None:
+            await cache.put(ctx.input_sha256, ctx.pages_obj, ctx.ocr_variant)
+
+    @staticmethod
+    def _set_ocr_pages(ctx: PipelineContext, pages: list, source: str) -> None:
+        util_write_json(
+            ctx.base_dir / OCR_RESULT_FILE, {"pages": pages, "source": source}
+        )
+        ctx.pages_obj = pages
+        ctx.artifacts["ocr_source"] = source
+
+    @staticmethod
+    def _use_text_layer(ctx: PipelineContext) -> bool:
+        return (
+            ocr_settings.OCR_TEXT_LAYER_ENABLED
+            and ctx.saved_path is not None
+            and ctx.saved_path.suffix.lower() == ".pdf"
+        )
+
+    @classmethod
+    def _use_page_parallel_ocr(cls, ctx: PipelineContext) -> bool:
+        pages = len(ctx.page_map) if ctx.page_map else ctx.page_count
+        return (
+            ocr_settings.OCR_PAGE_PARALLEL
+            and ctx.saved_path is not None
+            and cls._ocr_path(ctx).suffix.lower() == ".pdf"
+            and (pages or 0) >= ocr_settings.OCR_PAGE_PARALLEL_MIN_PAGES
+        )
+
+    async def _ocr_page_parallel(self, ctx: PipelineContext) -> dict[str, Any]:
+        """OCR each page as its own job and merge into one ``ask_tesseract`` result.
+
+        Pages are submitted concurrently (at most
+        OCR_PAGE_PARALLEL_CONCURRENCY at a time) so that an OCR farm
+        processes them side by side. Merged pages keep document order and
+        are renumbered 1..N.
+        """
+        pages_dir = ctx.base_dir / "ocr_pages"
+        page_paths = await asyncio.to_thread(
+            split_pdf_pages, str(self._ocr_path(ctx)), str(pages_dir)
+        )
+        semaphore = asyncio.Semaphore(ocr_settings.OCR_PAGE_PARALLEL_CONCURRENCY)
+
+        async def _ocr_page(path: str) -> dict[str, Any]:
+            async with semaphore:
+                return await ask_tesseract(
+                    path,
+                    output_dir=str(pages_dir),
+                    save_json=False,
+                    client=self.ocr_client,
+                    pages=1,
+                )
+
+        try:
+            # Let every page finish before removing the split files
+            results = await asyncio.gather(
+                *(_ocr_page(p) for p in page_paths), return_exceptions=True
+            )
+        finally:
+            shutil.rmtree(pages_dir, ignore_errors=True)
+
+        timings = _merge_ocr_timings(
+            r.get("timings") for r in results if isinstance(r, dict)
+        )
+        merged_pages = []
+        for page_number, result in enumerate(results, start=1):
+            if isinstance(result, BaseException):
+                raise result
+            if not result.get("success"):
+                return {
+                    "success": False,
+                    "error": f"page {page_number}: {result.get('error')}",
+                    "timings": timings,
+                }
+            for page in parse_ocr_output(result.get("raw_obj") or {}):
+                merged_pages.append({**page, "page_number": page_number})
+
+        return {
+            "success": True,
+            "error": None,
+            "raw_obj": {"data": {"pages": merged_pages}},
+            "timings": timings,
+        }
+
+    def _record_ocr_phases(self, ctx: PipelineContext, timings: dict) -> None:
+        """Split the OCR stage into upload (queueing) and result-wait phases."""
+        for phase in ("upload", "wait"):
+            started_at = timings.get(f"{phase}_started_at")
+            seconds = timings.get(f"{phase}_seconds")
+            if started_at is not None and seconds is not None:
+                _record_stage(ctx, f"ocr_{phase}", started_at, seconds, None, "ok")
+        sink = get_metrics_sink()
+        if timings.get("polls") is not None:
+            sink.gauge("pipeline.ocr.polls", timings["polls"])
+        if timings.get("ready_slack_seconds") is not None:
+            sink.timing("pipeline.ocr.ready_slack", timings["ready_slack_seconds"])
+
     @stage("llm_doc_type")
-    def _stage_doc_type_check(self, ctx: PipelineContext) -> None:
+    async def _stage_doc_type_check(self, ctx: PipelineContext) -> None:
         try:
-            raw = check_single_doc_type(ctx.pages_obj)
+            raw = await check_single_doc_type(ctx.pages_obj)
+            self._record_llm_usage(ctx, "doc_type", raw or "")
             dtc_obj = parse_llm_output(raw or "")
             util_write_json(ctx.base_dir / LLM_DTC_RESULT_FILE, dtc_obj)
             ctx.doc_type_result = dtc_obj
         except Exception as exc:
             raise StageError("LLM_FILTER_PARSE_ERROR", str(exc))
 
+        self._check_doc_type_result(ctx)
+
+    def _check_doc_type_result(self, ctx: PipelineContext) -> None:
         try:
             dtc = DocTypeCheck.model_validate(ctx.doc_type_result)
         except Exception:
@@ -299,15 +684,27 @@ class PipelineRunner:
             raise StageError("MULTIPLE_DOCUMENTS", None)
 
     @stage("llm_extractor")
-    def _stage_extract(self, ctx: PipelineContext) -> None:
+    async def _stage_extract(
+        self,
+        ctx: PipelineContext,
+        pending_call: Optional[Awaitable[str]] = None,
+    ) -> None:
         try:
-            raw = extract_doc_data(ctx.pages_obj)
+            raw = await (
+                pending_call
+                if pending_call is not None
+                else extract_doc_data(ctx.pages_obj)
+            )
+            self._record_llm_usage(ctx, "extractor", raw or "")
             extractor_obj = parse_llm_output(raw or "")
             util_write_json(ctx.base_dir / LLM_EXT_RESULT_FILE, extractor_obj)
             ctx.extractor_result = extractor_obj
         except Exception as exc:
             raise StageError("LLM_FILTER_PARSE_ERROR", str(exc))
 
+        self._check_extractor_result(ctx)
+
+    def _check_extractor_result(self, ctx: PipelineContext) -> None:
         try:
             extractor_result = ExtractorResult.model_validate(ctx.extractor_result)
         except Exception as ve:
@@ -325,8 +722,55 @@ class PipelineRunner:
         ):
             raise StageError("EXTRACT_SCHEMA_INVALID", "Key doc_date has invalid type")
 
+    @stage("llm_combined")
+    async def _stage_combined(self, ctx: PipelineContext) -> None:
+        try:
+            raw = await classify_and_extract(ctx.pages_obj)
+            self._record_llm_usage(ctx, "combined", raw or "")
+            combined_obj = parse_llm_output(raw or "")
+            util_write_json(ctx.base_dir / LLM_COMBINED_RESULT_FILE, combined_obj)
+            ctx.doc_type_result, ctx.extractor_result = split_combined_llm_output(
+                combined_obj
+            )
+        except Exception as exc:
+            raise StageError("LLM_FILTER_PARSE_ERROR", str(exc))
+
+        self._check_doc_type_result(ctx)
+        self._check_extractor_result(ctx)
+
+    async def _run_llm_stages(self, ctx: PipelineContext) -> None:
+        """Run doc-type check and extraction per ``LLM_EXECUTION_MODE``.
+
+        Combined mode asks for both results in a single LLM call. In
+        concurrent mode the extractor call is started alongside the
+        doc-type check but its response is only consumed once the check
+        passes; on any doc-type failure (e.g. MULTIPLE_DOCUMENTS) the call
+        is cancelled, so error results and artifacts match sequential mode.
+        """
+        if llm_settings.LLM_EXECUTION_MODE == "combined":
+            await self._stage_combined(ctx)
+            return
+
+        if llm_settings.LLM_EXECUTION_MODE == "sequential":
+            await self._stage_doc_type_check(ctx)
+            await self._stage_extract(ctx)
+            return
+
+        extractor_call = asyncio.create_task(
+            _timed_phase(
+                ctx, "llm_extractor_call", extract_doc_data(ctx.pages_obj)
+            )
+        )
+        try:
+            await self._stage_doc_type_check(ctx)
+        except BaseException:
+            extractor_call.cancel()
+            await asyncio.gather(extractor_call, return_exceptions=True)
+            raise
+        await self._stage_extract(ctx, pending_call=extractor_call)
+
     @stage("validate")
-    def _stage_validate(self, ctx: PipelineContext) -> tuple[bool, dict]:
+    async def _stage_validate(self, ctx: PipelineContext) -> tuple[bool, dict]:
         try:
             validation = validate_run(
                 user_provided_fio={"fio": ctx.fio},
@@ -369,29 +813,43 @@ class PipelineRunner:
         ctx.errors.extend(check_errors)
         return verdict, checks or {}
 
-    def run(
+    def _fail(
+        self, ctx: PipelineContext, code: str, details: Optional[str] = None
+    ) -> dict:
+        ctx.errors.append(make_error(code, details=details))
+        self._finalize_timing_artifacts(ctx)
+        final_json = self._build_error_final_json(ctx, code)
+        final_path = self._write_final_json(ctx, final_json)
+        return {
+            "run_id": ctx.run_id,
+            "verdict": False,
+            "errors": ctx.errors,
+            "final_result_path": final_path,
+        }
+
+    def _new_context(
         self,
         fio: Optional[str],
         source_file_path: str,
         original_filename: str,
-        external_metadata: Optional[dict] = None,
-    ) -> dict:
-        """Execute pipeline end-to-end and return result dict."""
-        run_id = _generate_run_id()
-        request_created_at = _now_iso()
-        dirs = _mk_run_dirs(self.runs_root, run_id)
-
+        external_metadata: Optional[dict],
+        run_id: Optional[str],
+        input_sha256: Optional[str] = None,
+        adopt_source: bool = False,
+    ) -> PipelineContext:
+        run_id = run_id or _generate_run_id()
         ext_meta = external_metadata or {}
-
-        ctx = PipelineContext(
+        return PipelineContext(
             fio=fio,
             source_file_path=source_file_path,
             original_filename=original_filename,
             runs_root=self.runs_root,
             run_id=run_id,
-            request_created_at=request_created_at,
+            request_created_at=_now_iso(),
             trace_id=ext_meta.get("trace_id"),
-            dirs=dirs,
+            dirs=_mk_run_dirs(self.runs_root, run_id),
+            input_sha256=input_sha256,
+            adopt_source=adopt_source,
             external_request_id=ext_meta.get("external_request_id"),
             external_s3_path=ext_meta.get("external_s3_path"),
             external_iin=ext_meta.get("external_iin"),
@@ -400,12 +858,71 @@ class PipelineRunner:
             external_second_name=ext_meta.get("external_second_name"),
         )
 
+    def reject(
+        self,
+        code: str,
+        fio: Optional[str],
+        original_filename: str,
+        external_metadata: Optional[dict] = None,
+        run_id: Optional[str] = None,
+        details: Optional[str] = None,
+    ) -> dict:
+        """Record a run refused during ingestion, without running any stage.
+
+        Used when a document is known to fail (e.g. PDF_TOO_MANY_PAGES from
+        the ingestion page count) before it has been fully received. The
+        run gets the same error final.json and result dict as ``run``.
+        """
+        ctx = self._new_context(fio, "", original_filename, external_metadata, run_id)
+        self.logger.info(
+            f"Run rejected during ingestion: {code}",
+            extra={
+                "trace_id": ctx.trace_id,
+                "run_id": ctx.run_id,
+                "error_code": code,
+            },
+        )
+        return self._fail(ctx, code, details)
+
+    async def run(
+        self,
+        fio: Optional[str],
+        source_file_path: str,
+        original_filename: str,
+        external_metadata: Optional[dict] = None,
+        run_id: Optional[str] = None,
+        input_sha256: Optional[str] = None,
+        adopt_source: bool = False,
+    ) -> dict:
+        """Execute pipeline end-to-end and return result dict.
+
+        Runs on the caller's event loop: OCR and LLM calls are awaited and
+        only blocking file work (copy, PDF parsing, image conversion) is
+        off-loaded to worker threads. ``run_id`` may be pre-assigned by
+        callers that hand it out before the run starts (job API).
+
+        ``input_sha256`` skips re-hashing when the caller already hashed
+        the file; with ``adopt_source`` the source file is moved into the
+        run directory instead of copied.
+        """
+        ctx = self._new_context(
+            fio,
+            source_file_path,
+            original_filename,
+            external_metadata,
+            run_id,
+            input_sha256=input_sha256,
+            adopt_source=adopt_source,
+        )
+
         try:
-            self._stage_acquire(ctx)
-            self._stage_ocr(ctx)
-            self._stage_doc_type_check(ctx)
-            self._stage_extract(ctx)
-            verdict, checks = self._stage_validate(ctx)
+            await self._stage_acquire(ctx)
+            await self._stage_preprocess(ctx)
+            if not await self._stage_text_layer(ctx):
+                await self._stage_page_filter(ctx)
+                await self._stage_ocr(ctx)
+            await self._run_llm_stages(ctx)
+            verdict, checks = await self._stage_validate(ctx)
         except StageError as se:
             self.logger.error(
                 f"Pipeline stage failed: {se.code} - {se.details}",
@@ -415,28 +932,10 @@ class PipelineRunner:
                     "error_code": se.code,
                 },
             )
-            ctx.errors.append(make_error(se.code, details=se.details))
-            self._finalize_timing_artifacts(ctx)
-            final_json = self._build_error_final_json(ctx, se.code)
-            final_path = self._write_final_json(ctx, final_json)
-            return {
-                "run_id": ctx.run_id,
-                "verdict": False,
-                "errors": ctx.errors,
-                "final_result_path": final_path,
-            }
+            return self._fail(ctx, se.code, se.details)
         except Exception as exc:
             self.logger.error(f"Unexpected pipeline error: {exc}", exc_info=True)
-            ctx.errors.append(make_error("UNKNOWN_ERROR", details=str(exc)))
-            self._finalize_timing_artifacts(ctx)
-            final_json = self._build_error_final_json(ctx, "UNKNOWN_ERROR")
-            final_path = self._write_final_json(ctx, final_json)
-            return {
-                "run_id": ctx.run_id,
-                "verdict": False,
-                "errors": ctx.errors,
-                "final_result_path": final_path,
-            }
+            return self._fail(ctx, "UNKNOWN_ERROR", str(exc))
 
         self._finalize_timing_artifacts(ctx)
         final_json = self._build_success_final_json(ctx, verdict, checks)
@@ -0,0 +1,88 @@
+"""
+LLM-based combined classifier and extractor processor.
+
+Builds a single prompt from OCR pages that asks for both the
+document-type classification (see `agent_doc_type_checker`) and the
+core field extraction (see `agent_extractor`), so the OCR text is sent
+to the LLM once per document instead of twice. The prompt is composed
+from those agents' prompts plus a wrapper that merges their outputs.
+
+The template is expected to contain exactly one `{}` placeholder where
+the JSON representation of OCR pages will be injected.
+"""
+
+import json
+
+from pipeline.cache.llm_cache import register_prompt_template
+from pipeline.clients.llm_client import ask_llm
+from pipeline.processors.agent_doc_type_checker import DTC_PROMPT_V1
+from pipeline.processors.agent_extractor import EXTRACTOR_PROMPT_V1
+
+COMBINED_MAX_TOKENS = 700
+
+
+def _task_section(template: str, text_marker: str) -> str:
+    """Agent prompt without its trailing text-for-analysis placeholder."""
+    section = template[: template.rindex(text_marker)].rstrip()
+    if "{}" in section:
+        raise ValueError("Agent prompt must contain a single {} placeholder")
+    return section
+
+
+# Composed from the agent prompts so that edits to either carry over; only
+# the wrapper that merges their two JSON outputs into one lives here.
+COMBINED_PROMPT_V1 = f"""You will perform TWO tasks on the same noisy OCR text (it may contain both Kazakh and Russian fragments): PART A classifies the document type, PART B extracts fields.
+Each part below describes its own JSON output. Do NOT output them separately: follow both parts' rules, then output ONLY the single merged JSON object specified under COMBINED OUTPUT. Key counts mentioned inside a part refer to that part's keys only.
+
+---
+
+## PART A — DOCUMENT-TYPE CLASSIFICATION
+
+{_task_section(DTC_PROMPT_V1, "### TEXT FOR ANALYSIS")}
+
+---
+
+## PART B — FIELD EXTRACTION
+
+{_task_section(EXTRACTOR_PROMPT_V1, "Text for analysis:")}
+
+---
+
+## COMBINED OUTPUT
+
+Return exactly one valid JSON object with the keys of PART A and PART B together (exactly 7 keys), no extra text, no markdown, no ```json formatting:
+{{
+  "single_doc_type": true | false,
+  "confidence": number [0...100],
+  "detected_doc_types": [ "..." ],
+  "reasoning": "...",
+  "doc_type_known": true | false,
+  "fio": string | null,
+  "doc_date": string | null
+}}
+
+---
+
+### TEXT FOR ANALYSIS
+{{}}
+"""
+
+register_prompt_template("COMBINED_PROMPT_V1", COMBINED_PROMPT_V1)
+
+
+async def classify_and_extract(pages_obj: dict) -> str:
+    """
+    Run the combined LLM classifier + extractor for a set of OCR pages.
+
+    Args:
+      pages_obj: Normalized OCR pages object (as produced by filter_ocr_response).
+
+    Returns:
+      Raw LLM response string, expected to contain a single JSON object
+      with both `DocTypeCheck` and `ExtractorResult` fields.
+    """
+    pages_json_str = json.dumps(pages_obj, ensure_ascii=False)
+    if not pages_json_str:
+        return ""
+    prompt = COMBINED_PROMPT_V1.replace("{}", pages_json_str, 1)
+    return await ask_llm(prompt, max_tokens=COMBINED_MAX_TOKENS)
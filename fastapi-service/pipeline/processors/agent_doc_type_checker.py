@@ -12,6 +12,7 @@ injected.
 
 import json
 
+from pipeline.cache.llm_cache import register_prompt_template
 from pipeline.clients.llm_client import ask_llm
 
 DTC_PROMPT_V1 = """You are a deterministic OCR document-type classifier.
@@ -123,8 +124,10 @@ Otherwise, ignore repeated issuer mentions.
 {}
 """
 
+register_prompt_template("DTC_PROMPT_V1", DTC_PROMPT_V1)
 
-def check_single_doc_type(pages_obj: dict) -> str:
+
+async def check_single_doc_type(pages_obj: dict) -> str:
     """
     Run the LLM doc-type classifier for a set of OCR pages.
 
@@ -139,4 +142,4 @@ def check_single_doc_type(pages_obj: dict) -> str:
     if not pages_json_str:
         return ""
     prompt = DTC_PROMPT_V1.replace("{}", pages_json_str, 1)
-    return ask_llm(prompt)
+    return await ask_llm(prompt)
@@ -12,6 +12,7 @@ OCR pages will be injected.
 
 import json
 
+from pipeline.cache.llm_cache import register_prompt_template
 from pipeline.clients.llm_client import ask_llm
 
 EXTRACTOR_PROMPT_V1 = """You are an expert in multilingual document information extraction and normalization.
@@ -59,8 +60,10 @@ Text for analysis:
 {}
 """
 
+register_prompt_template("EXTRACTOR_PROMPT_V1", EXTRACTOR_PROMPT_V1)
 
-def extract_doc_data(pages_obj: dict) -> str:
+
+async def extract_doc_data(pages_obj: dict) -> str:
     """
     Run the LLM extractor to obtain structured fields from OCR pages.
 
@@ -75,4 +78,4 @@ def extract_doc_data(pages_obj: dict) -> str:
     if not pages_json_str:
         return ""
     prompt = EXTRACTOR_PROMPT_V1.replace("{}", pages_json_str, 1)
-    return ask_llm(prompt)
+    return await ask_llm(prompt)
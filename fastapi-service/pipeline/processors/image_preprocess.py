@@ -0,0 +1,98 @@
+"""Shrink photos before OCR.
+
+Phone photos arrive at 12-48 MP; OCR accuracy does not improve beyond
+roughly 300 DPI on an A4 page (~3500 px long edge), while upload size
+and OCR time grow with pixel count. The image is downscaled to a long
+edge cap, optionally converted to grayscale and re-encoded as JPEG.
+
+JPEGs are decoded in draft mode: libjpeg scales by 1/2, 1/4 or 1/8
+while decoding, so a 48 MP photo is never materialised at full
+resolution. The result is written upright (EXIF orientation applied),
+which lets the image-to-PDF step embed it without another re-encode.
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PreprocessResult:
+    output_path: str
+    bytes_before: int
+    bytes_after: int
+    size_before: tuple[int, int]
+    size_after: tuple[int, int]
+
+    def as_dict(self) -> dict:
+        """Sizes for run artifacts (the output path is run-local)."""
+        return {
+            "bytes_before": self.bytes_before,
+            "bytes_after": self.bytes_after,
+            "size_before": list(self.size_before),
+            "size_after": list(self.size_after),
+        }
+
+
+def preprocess_variant(max_long_edge: int, grayscale: bool, quality: int) -> str:
+    """Short identifier of the preprocessing parameters (cache key, artifacts)."""
+    return f"edge{max_long_edge}-{'gray' if grayscale else 'color'}-q{quality}"
+
+
+def preprocess_image(
+    image_path: str,
+    output_path: str,
+    max_long_edge: int,
+    grayscale: bool = True,
+    quality: int = 85,
+) -> Optional[PreprocessResult]:
+    """Downscale/convert ``image_path`` into a JPEG at ``output_path``.
+
+    Returns:
+        The result, or None when the image is left as is (multi-frame,
+        unreadable, or re-encoding would not make it smaller)
+    """
+    bytes_before = os.path.getsize(image_path)
+    try:
+        with Image.open(image_path) as image:
+            if getattr(image, "n_frames", 1) > 1:
+                return None
+            size_before = image.size
+            mode = "L" if grayscale else "RGB"
+
+            scale = min(1.0, max_long_edge / max(size_before))
+            if image.format == "JPEG":
+                # Draft size is a lower bound; libjpeg picks the largest
+                # power-of-two reduction that still covers it
+                image.draft(
+                    mode,
+                    (int(size_before[0] * scale), int(size_before[1] * scale)),
+                )
+
+            frame = ImageOps.exif_transpose(image)
+            if frame.mode != mode:
+                frame = frame.convert(mode)
+            frame.thumbnail((max_long_edge, max_long_edge), Image.LANCZOS)
+            frame.save(output_path, format="JPEG", quality=quality, optimize=True)
+            size_after = frame.size
+    except Exception:
+        logger.warning(f"Image preprocessing failed for {image_path}", exc_info=True)
+        return None
+
+    bytes_after = os.path.getsize(output_path)
+    if bytes_after >= bytes_before:
+        os.remove(output_path)
+        return None
+
+    return PreprocessResult(
+        output_path=output_path,
+        bytes_before=bytes_before,
+        bytes_after=bytes_after,
+        size_before=size_before,
+        size_after=size_after,
+    )
@@ -1,14 +1,106 @@
 import os
+import shutil
 
 from PIL import Image, ImageOps, ImageSequence
 
+_PDF_DPI = 300.0
+
+# EXIF orientation -> clockwise /Rotate of the page. Mirrored orientations
+# (2, 4, 5, 7) cannot be expressed with /Rotate and go through Pillow.
+_EXIF_ROTATE = {1: 0, 3: 180, 6: 90, 8: 270}
+_JPEG_COLORSPACES = {"RGB": "/DeviceRGB", "L": "/DeviceGray"}
+
+
+def _jpeg_passthrough_params(image_path: str) -> tuple[int, int, str, int] | None:
+    """Return (width, height, colorspace, rotate) if the JPEG can be embedded as is.
+
+    Only the header and EXIF are read; pixel data is not decoded.
+    """
+    try:
+        with Image.open(image_path) as image:
+            if image.format != "JPEG":
+                return None
+            colorspace = _JPEG_COLORSPACES.get(image.mode)
+            if colorspace is None:  # CMYK/YCCK: Adobe inversion quirks
+                return None
+            orientation = image.getexif().get(0x0112, 1)
+            rotate = _EXIF_ROTATE.get(orientation)
+            if rotate is None:
+                return None
+            width, height = image.size
+    except Exception:
+        return None
+    return width, height, colorspace, rotate
+
+
+def _write_jpeg_pdf(
+    image_path: str,
+    out_pdf: str,
+    width: int,
+    height: int,
+    colorspace: str,
+    rotate: int,
+) -> None:
+    """Write a one-page PDF embedding the JPEG bytes as a DCTDecode image."""
+    page_w = width * 72.0 / _PDF_DPI
+    page_h = height * 72.0 / _PDF_DPI
+    content = f"q {page_w:.4f} 0 0 {page_h:.4f} 0 0 cm /Im0 Do Q".encode("ascii")
+    jpeg_size = os.path.getsize(image_path)
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {page_w:.4f} {page_h:.4f}] "
+            f"/Rotate {rotate} /Resources << /XObject << /Im0 5 0 R >> >> "
+            f"/Contents 4 0 R >>"
+        ).encode("ascii"),
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content),
+    ]
+    image_header = (
+        f"<< /Type /XObject /Subtype /Image /Width {width} /Height {height} "
+        f"/ColorSpace {colorspace} /BitsPerComponent 8 /Filter /DCTDecode "
+        f"/Length {jpeg_size} >>\nstream\n"
+    ).encode("ascii")
+
+    offsets = []
+    with open(out_pdf, "wb") as out:
+        out.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        for number, body in enumerate(objects, start=1):
+            offsets.append(out.tell())
+            out.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+
+        offsets.append(out.tell())
+        out.write(b"5 0 obj\n" + image_header)
+        with open(image_path, "rb") as src:
+            shutil.copyfileobj(src, out, 1024 * 1024)
+        out.write(b"\nendstream\nendobj\n")
+
+        xref_offset = out.tell()
+        out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(offsets) + 1))
+        for offset in offsets:
+            out.write(b"%010d 00000 n \n" % offset)
+        out.write(
+            b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+            % (len(offsets) + 1, xref_offset)
+        )
+
 
 def convert_image_to_pdf(
     image_path: str,
     output_dir: str | None = None,
     output_path: str | None = None,
     overwrite: bool = False,
+    passthrough: bool = True,
 ) -> str:
+    """Convert an image to PDF.
+
+    Baseline/progressive RGB or grayscale JPEGs whose EXIF orientation is
+    a pure rotation are embedded without re-encoding (DCTDecode), with the
+    orientation applied through the page's /Rotate. Everything else (PNG,
+    TIFF, CMYK or mirrored JPEGs, ``passthrough=False``) is decoded and
+    re-encoded with Pillow.
+    """
     if not os.path.isfile(image_path):
         raise FileNotFoundError(image_path)
 
@@ -34,6 +126,12 @@ def convert_image_to_pdf(
 
     os.makedirs(out_dir, exist_ok=True)
 
+    if passthrough:
+        params = _jpeg_passthrough_params(image_path)
+        if params is not None:
+            _write_jpeg_pdf(image_path, out_pdf, *params)
+            return out_pdf
+
     # --- Frame preparation helper ---
     def _prepare_frame(frame):
         try:
@@ -56,12 +154,12 @@ def convert_image_to_pdf(
 
         # --- Save PDF ---
         if len(frames) == 1:
-            frames[0].save(out_pdf, format="PDF", resolution=300.0)
+            frames[0].save(out_pdf, format="PDF", resolution=_PDF_DPI)
         else:
             frames[0].save(
                 out_pdf,
                 format="PDF",
-                resolution=300.0,
+                resolution=_PDF_DPI,
                 save_all=True,
                 append_images=frames[1:],
             )
@@ -0,0 +1,195 @@
+"""Blank and duplicate page elimination before OCR.
+
+Scans often carry blank back sides or the same sheet scanned twice;
+every extra page costs OCR time and LLM prompt tokens. Pages are
+analysed on a small grayscale rendition:
+
+- blank: share of "ink" pixels (much darker than the paper tone) is
+  below ``BLANK_PAGE_MAX_INK_RATIO``;
+- duplicate: difference hash (33x32 -> 1024 bits) within
+  ``DUPLICATE_PAGE_MAX_HASH_DISTANCE`` (fraction of differing bits) of
+  an earlier kept page.
+
+For PDFs only scanned pages are analysed - a page whose content is a
+single embedded image and no text. Pages with a text layer or vector
+content are always kept, as are pages whose image cannot be decoded.
+Multi-frame TIFFs are analysed frame by frame. At least one page is
+always kept.
+"""
+
+import io
+import logging
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from PIL import Image, ImageSequence
+from pypdf import PdfReader, PdfWriter
+
+from pipeline.config.settings import (
+    BLANK_PAGE_MAX_INK_RATIO,
+    DUPLICATE_PAGE_MAX_HASH_DISTANCE,
+)
+
+logger = logging.getLogger(__name__)
+
+_ANALYSIS_LONG_EDGE = 1000
+_INK_DARKER_THAN_PAPER = 80  # gray levels below the paper tone
+_HASH_SIZE = 32
+
+
+@dataclass
+class PageFilterResult:
+    output_path: str
+    kept_pages: list[int]  # original 1-based page numbers, in order
+    dropped: list[dict] = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        return {
+            "pages_in": len(self.kept_pages) + len(self.dropped),
+            "kept_pages": self.kept_pages,
+            "dropped": self.dropped,
+        }
+
+
+def page_filter_variant() -> str:
+    """Identifier of the filter thresholds (OCR cache key)."""
+    return f"pf-ink{BLANK_PAGE_MAX_INK_RATIO}-dup{DUPLICATE_PAGE_MAX_HASH_DISTANCE}"
+
+
+def _analysis_image(image: Image.Image) -> Image.Image:
+    if image.format == "JPEG":
+        image.draft("L", (_ANALYSIS_LONG_EDGE, _ANALYSIS_LONG_EDGE))
+    gray = image.convert("L")
+    gray.thumbnail((_ANALYSIS_LONG_EDGE, _ANALYSIS_LONG_EDGE))
+    return gray
+
+
+def ink_ratio(gray: Image.Image) -> float:
+    """Share of pixels much darker than the paper (90th percentile tone)."""
+    histogram = gray.histogram()
+    total = sum(histogram)
+    running = 0
+    paper = 255
+    for value, count in enumerate(histogram):
+        running += count
+        if running >= total * 0.9:
+            paper = value
+            break
+    threshold = paper - _INK_DARKER_THAN_PAPER
+    if threshold <= 0:
+        return 1.0
+    return sum(histogram[:threshold]) / total
+
+
+def dhash(gray: Image.Image) -> int:
+    small = gray.resize((_HASH_SIZE + 1, _HASH_SIZE), Image.BILINEAR)
+    pixels = list(small.getdata())
+    bits = 0
+    for row in range(_HASH_SIZE):
+        offset = row * (_HASH_SIZE + 1)
+        for col in range(_HASH_SIZE):
+            bits = (bits << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return bits
+
+
+def _hash_distance(a: int, b: int) -> float:
+    return bin(a ^ b).count("1") / (_HASH_SIZE * _HASH_SIZE)
+
+
+def _scanned_page_image(page) -> Optional[Image.Image]:
+    """The page's only image if the page is a plain scan, else None."""
+    try:
+        if (page.extract_text() or "").strip():
+            return None
+        images = list(page.images)
+        if len(images) != 1:
+            return None
+        return Image.open(io.BytesIO(images[0].data))
+    except Exception:
+        logger.debug("Could not read page image", exc_info=True)
+        return None
+
+
+def _classify(
+    frames: Iterator[Optional[Image.Image]],
+) -> tuple[list[int], list[dict]]:
+    kept: list[int] = []
+    dropped: list[dict] = []
+    hashes: list[tuple[int, int]] = []  # (page_number, hash) of kept pages
+
+    for page_number, image in enumerate(frames, start=1):
+        if image is None:
+            kept.append(page_number)
+            continue
+        gray = _analysis_image(image)
+        ratio = ink_ratio(gray)
+        if ratio < BLANK_PAGE_MAX_INK_RATIO:
+            dropped.append(
+                {"page": page_number, "reason": "blank", "ink_ratio": round(ratio, 5)}
+            )
+            continue
+        page_hash = dhash(gray)
+        original = next(
+            (
+                number
+                for number, other in hashes
+                if _hash_distance(page_hash, other) <= DUPLICATE_PAGE_MAX_HASH_DISTANCE
+            ),
+            None,
+        )
+        if original is not None:
+            dropped.append({"page": page_number, "reason": "duplicate", "of": original})
+            continue
+        kept.append(page_number)
+        hashes.append((page_number, page_hash))
+
+    if not kept and dropped:
+        # Never send an empty document; OCR then reports OCR_EMPTY_PAGES
+        kept.append(dropped.pop(0)["page"])
+    return kept, dropped
+
+
+def filter_pdf_pages(pdf_path: str, output_path: str) -> Optional[PageFilterResult]:
+    """Write ``pdf_path`` without blank/duplicate pages to ``output_path``.
+
+    Returns:
+        The result, or None when no page was dropped (nothing is written)
+    """
+    reader = PdfReader(pdf_path)
+    kept, dropped = _classify(_scanned_page_image(page) for page in reader.pages)
+    if not dropped:
+        return None
+
+    writer = PdfWriter()
+    for page_number in kept:
+        writer.add_page(reader.pages[page_number - 1])
+    with open(output_path, "wb") as f:
+        writer.write(f)
+    return PageFilterResult(output_path, kept, dropped)
+
+
+def filter_tiff_frames(tiff_path: str, output_path: str) -> Optional[PageFilterResult]:
+    """Write the kept frames of a multi-frame TIFF as a PDF to ``output_path``.
+
+    Returns:
+        The result, or None for single-frame images or when nothing was dropped
+    """
+    with Image.open(tiff_path) as image:
+        if getattr(image, "n_frames", 1) < 2:
+            return None
+        frames = [frame.copy() for frame in ImageSequence.Iterator(image)]
+
+    kept, dropped = _classify(iter(frames))
+    if not dropped:
+        return None
+
+    pages = [frames[n - 1] for n in kept]
+    pages = [p.convert("RGB") if p.mode not in ("RGB", "L") else p for p in pages]
+    pages[0].save(
+        output_path,
+        format="PDF",
+        resolution=300.0,
+        save_all=True,
+        append_images=pages[1:],
+    )
+    return PageFilterResult(output_path, kept, dropped)
@@ -0,0 +1,22 @@
+import os
+
+from pypdf import PdfReader, PdfWriter
+
+
+def split_pdf_pages(pdf_path: str, output_dir: str) -> list[str]:
+    """Write every page of ``pdf_path`` to its own single-page PDF.
+
+    Returns:
+        Paths of the page PDFs in page order (``page_001.pdf``, ...)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    reader = PdfReader(pdf_path)
+    paths = []
+    for index, page in enumerate(reader.pages, start=1):
+        writer = PdfWriter()
+        writer.add_page(page)
+        out_path = os.path.join(output_dir, f"page_{index:03d}.pdf")
+        with open(out_path, "wb") as f:
+            writer.write(f)
+        paths.append(out_path)
+    return paths
@@ -0,0 +1,108 @@
+"""Embedded text layer extraction for born-digital PDFs.
+
+Employer orders and certificates generated by document systems carry a
+real text layer, so OCR can be skipped when that layer is usable. Each
+page is scored on:
+
+- character count (non-whitespace): scanned pages have none, or only a
+  few stray characters from stamps and headers;
+- Cyrillic ratio (Cyrillic letters / all letters): a broken font
+  encoding typically yields Latin mojibake ("Ïðèêàç") instead of Russian
+  or Kazakh text;
+- garbage ratio: replacement characters, control and private-use code
+  points and other symbols that are not letters, digits, punctuation or
+  whitespace.
+
+The text layer is used only when every page passes; otherwise the
+document goes to OCR as before.
+"""
+
+import logging
+import unicodedata
+from dataclasses import dataclass
+from typing import Optional
+
+from pypdf import PdfReader
+
+from pipeline.config.settings import (
+    TEXT_LAYER_MAX_GARBAGE_RATIO,
+    TEXT_LAYER_MIN_CYRILLIC_RATIO,
+    TEXT_LAYER_MIN_PAGE_CHARS,
+)
+
+logger = logging.getLogger(__name__)
+
+_ALLOWED_SYMBOLS = set("№§«»„“”‘’–—…°±×€₸$%&@#*+=/\\|<>^~_")
+
+
+@dataclass
+class PageTextScore:
+    chars: int
+    cyrillic_ratio: float
+    garbage_ratio: float
+
+    @property
+    def passed(self) -> bool:
+        return (
+            self.chars >= TEXT_LAYER_MIN_PAGE_CHARS
+            and self.cyrillic_ratio >= TEXT_LAYER_MIN_CYRILLIC_RATIO
+            and self.garbage_ratio <= TEXT_LAYER_MAX_GARBAGE_RATIO
+        )
+
+
+def _is_cyrillic(ch: str) -> bool:
+    return "Ѐ" <= ch <= "ӿ" or "Ԁ" <= ch <= "ԯ"
+
+
+def _is_garbage(ch: str) -> bool:
+    if ch.isalnum() or ch in _ALLOWED_SYMBOLS:
+        return False
+    category = unicodedata.category(ch)
+    # P* punctuation is fine; control, format, private-use, unassigned,
+    # surrogates and replacement characters are not
+    if category.startswith("P"):
+        return False
+    return True
+
+
+def score_page_text(text: str) -> PageTextScore:
+    chars = [ch for ch in text if not ch.isspace()]
+    if not chars:
+        return PageTextScore(chars=0, cyrillic_ratio=0.0, garbage_ratio=0.0)
+    letters = [ch for ch in chars if ch.isalpha()]
+    cyrillic = sum(1 for ch in letters if _is_cyrillic(ch))
+    garbage = sum(1 for ch in chars if _is_garbage(ch))
+    return PageTextScore(
+        chars=len(chars),
+        cyrillic_ratio=cyrillic / len(letters) if letters else 0.0,
+        garbage_ratio=garbage / len(chars),
+    )
+
+
+def extract_text_layer(pdf_path: str) -> Optional[list[dict]]:
+    """Return pages in ``parse_ocr_output`` format if the text layer is usable.
+
+    Returns:
+        List of dicts with page_number and text keys, or None when the PDF
+        has no usable text layer (scanned, broken encoding, unreadable)
+    """
+    try:
+        reader = PdfReader(pdf_path)
+        texts = [page.extract_text() or "" for page in reader.pages]
+    except Exception:
+        logger.debug("Text layer extraction failed", exc_info=True)
+        return None
+
+    if not texts:
+        return None
+
+    for page_number, text in enumerate(texts, start=1):
+        score = score_page_text(text)
+        if not score.passed:
+            logger.debug(f"Text layer rejected on page {page_number}: {score}")
+            return None
+
+    return [
+        {"page_number": page_number, "text": text}
+        for page_number, text in enumerate(texts, start=1)
+    ]
@@ -7,9 +7,12 @@ filenames, and reading/writing JSON payloads in UTF-8.
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import re
 import shutil
+import tempfile
 from pathlib import Path
 from typing import Any
 
@@ -44,6 +47,31 @@ def write_json(path: str | Path, obj: dict[str, Any]) -> None:
         json.dump(obj, f, ensure_ascii=False, indent=2)
 
 
+def write_json_atomic(path: str | Path, obj: dict[str, Any]) -> None:
+    """
+    Write a JSON object so that readers never observe a partial file.
+
+    Writes to a temporary file in the destination directory and renames
+    it over `path` with `os.replace`, which is atomic on POSIX.
+
+    Args:
+      path: Destination file path.
+      obj: JSON-serializable mapping to persist.
+    """
+    ensure_parent(path)
+    fd, tmp_path = tempfile.mkstemp(dir=Path(path).parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(obj, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def read_json(path: str | Path) -> Any:
     """
     Read and parse a JSON file using UTF-8 encoding.
@@ -77,6 +105,82 @@ def copy_file(src: str | Path, dst: str | Path) -> Path:
     return Path(dst)
 
 
+# Linux FICLONE ioctl: share extents between files on CoW filesystems
+_FICLONE = 0x40049409
+
+
+def adopt_file(src: str | Path, dst: str | Path) -> str:
+    """
+    Move `src` to `dst`, taking ownership of it.
+
+    Uses a rename when both are on the same filesystem and falls back to
+    copy + unlink across devices. `src` no longer exists afterwards.
+
+    Returns:
+      "rename" or "copy".
+    """
+    ensure_parent(dst)
+    try:
+        os.replace(str(src), str(dst))
+        return "rename"
+    except OSError:
+        shutil.copyfile(str(src), str(dst))
+        os.remove(str(src))
+        return "copy"
+
+
+def _reflink(src: str | Path, dst: str | Path) -> None:
+    import fcntl
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+
+
+def link_or_copy(src: str | Path, dst: str | Path) -> str:
+    """
+    Make `dst` a copy of `src` without duplicating data where possible.
+
+    Tries a reflink (btrfs, XFS), then a hardlink, then a plain copy. The
+    caller keeps `src`; neither file may be modified in place afterwards
+    (a hardlink shares the inode).
+
+    Returns:
+      "reflink", "hardlink" or "copy".
+    """
+    ensure_parent(dst)
+    try:
+        _reflink(src, dst)
+        return "reflink"
+    except (OSError, ImportError):
+        pass
+    try:
+        if os.path.lexists(dst):
+            os.remove(dst)
+        os.link(src, dst)
+        return "hardlink"
+    except OSError:
+        shutil.copyfile(str(src), str(dst))
+        return "copy"
+
+
+def sha256_file(path: str | Path, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Compute the hex SHA-256 digest of a file, reading it in chunks.
+
+    Args:
+      path: File to hash.
+      chunk_size: Read size in bytes.
+
+    Returns:
+      Lowercase hex digest string.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def build_fio(last_name: str, first_name: str, second_name: str | None = None) -> str:
     """
     Build Full Name (FIO) from components.
@@ -46,3 +46,38 @@ def parse_llm_output(raw: str) -> dict[str, Any]:
 
     except Exception:
         return {}
+
+
+def parse_llm_usage(raw: str) -> dict[str, int]:
+    """
+    Extract the token ``usage`` block from a raw LLM response, if present.
+
+    Returns:
+        Dict of integer token counters (e.g. prompt_tokens), otherwise empty dict.
+    """
+    if not raw:
+        return {}
+
+    try:
+        usage = json.loads(raw).get("usage")
+    except Exception:
+        return {}
+
+    if not isinstance(usage, dict):
+        return {}
+    return {k: v for k, v in usage.items() if isinstance(v, int)}
+
+
+def split_combined_llm_output(obj: dict[str, Any]) -> tuple[dict, dict]:
+    """
+    Split a combined classifier + extractor LLM result into its two parts.
+
+    Returns:
+        Tuple ``(doc_type_obj, extractor_obj)`` with the keys of
+        ``DocTypeCheck`` and ``ExtractorResult`` respectively.
+    """
+    from pipeline.models.dto import DocTypeCheck, ExtractorResult
+
+    doc_type_obj = {k: obj[k] for k in DocTypeCheck.model_fields if k in obj}
+    extractor_obj = {k: obj[k] for k in ExtractorResult.model_fields if k in obj}
+    return doc_type_obj, extractor_obj
@@ -0,0 +1,236 @@
+"""Fast PDF page counting.
+
+Only the few bytes that determine the page count are read, through a
+memory map:
+
+1. Linearized PDFs announce the page count in the linearization
+   dictionary within the first kilobyte (``/Linearized 1 ... /N 12``).
+   This is trusted when ``/L`` (the file length) matches the file.
+2. Otherwise ``startxref`` at the end of the file points to the classic
+   cross-reference table. The table chain (``/Prev``) gives the offsets
+   of the catalog (trailer ``/Root``) and of the page tree root
+   (catalog ``/Pages``), whose ``/Count`` is the page count.
+
+Cross-reference streams (PDF 1.5+ compressed xref / object streams),
+damaged tables and anything unexpected return None from the fast path.
+``count_pdf_pages`` then falls back to a full pypdf (or PyPDF2) parse.
+
+The parsing takes a ``read(offset, length)`` callable, so the same code
+runs over ranged GETs for objects that are not local yet (S3).
+"""
+
+import logging
+import mmap
+import re
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+LINEARIZED_HEADER_BYTES = 1024
+_TAIL_BYTES = 2048
+_XREF_WINDOW_BYTES = 256 * 1024
+_OBJECT_WINDOW_BYTES = 64 * 1024
+
+ReadAt = Callable[[int, int], bytes]
+
+_LINEARIZED_RE = re.compile(rb"\d+\s+\d+\s+obj\s*<<(.*?)>>", re.S)
+_STARTXREF_RE = re.compile(rb"startxref\s+(\d+)")
+_SUBSECTION_RE = re.compile(rb"\s*(\d+)\s+(\d+)\s*[\r\n]")
+_ENTRY_RE = re.compile(rb"\s*(\d{10})\s+(\d{5})\s+([nf])")
+_TRAILER_RE = re.compile(rb"\s*trailer\s*<<(.*?)>>\s*startxref", re.S)
+_ROOT_RE = re.compile(rb"/Root\s+(\d+)\s+\d+\s+R")
+_PREV_RE = re.compile(rb"/Prev\s+(\d+)")
+_PAGES_REF_RE = re.compile(rb"/Pages\s+(\d+)\s+\d+\s+R")
+_COUNT_RE = re.compile(rb"/Count\s+(\d+)(?:\s+\d+\s+R)?")
+_OBJ_HEADER_RE = re.compile(rb"(\d+)\s+\d+\s+obj")
+
+
+def _int_entry(dictionary: bytes, key: bytes) -> Optional[int]:
+    match = re.search(rb"/" + key + rb"\s+(\d+)(?![\d\s]*R)", dictionary)
+    return int(match.group(1)) if match else None
+
+
+def linearized_page_count(
+    head: bytes, file_size: Optional[int] = None
+) -> Optional[int]:
+    """Page count from the linearization dictionary at the start of a PDF.
+
+    Args:
+        head: At least the first LINEARIZED_HEADER_BYTES of the file
+        file_size: Total file size; when given it must match ``/L``
+    """
+    match = _LINEARIZED_RE.search(head[:LINEARIZED_HEADER_BYTES])
+    if not match or b"/Linearized" not in match.group(1):
+        return None
+    params = match.group(1)
+    pages = _int_entry(params, b"N")
+    length = _int_entry(params, b"L")
+    if pages is None:
+        return None
+    if file_size is not None and length != file_size:
+        return None  # incrementally updated since linearization
+    return pages
+
+
+def _read_xref_offsets(
+    read: ReadAt, size: int, start: int
+) -> Optional[tuple[dict[int, int], int]]:
+    """Walk the classic xref chain; return (object offsets, root object number)."""
+    offsets: dict[int, int] = {}
+    root: Optional[int] = None
+    section: Optional[int] = start
+    seen: set[int] = set()
+
+    while section is not None:
+        if section in seen or section >= size:
+            return None
+        seen.add(section)
+        # Table and trailer follow ``xref`` directly; 20 bytes per entry
+        buf = read(section, min(size - section, _XREF_WINDOW_BYTES))
+        if buf[:4] != b"xref":
+            return None
+        pos = 4
+        while True:
+            header = _SUBSECTION_RE.match(buf, pos)
+            if not header:
+                break
+            first, count = int(header.group(1)), int(header.group(2))
+            pos = header.end()
+            for number in range(first, first + count):
+                entry = _ENTRY_RE.match(buf, pos)
+                if not entry:
+                    return None
+                pos = entry.end()
+                # Newer sections come first in the chain; keep their entries
+                if entry.group(3) == b"n" and number not in offsets:
+                    offsets[number] = int(entry.group(1))
+
+        trailer = _TRAILER_RE.match(buf, pos)
+        if not trailer:
+            return None
+        trailer_dict = trailer.group(1)
+        if b"/XRefStm" in trailer_dict:
+            return None  # hybrid file: some objects only in the xref stream
+        if root is None:
+            root_match = _ROOT_RE.search(trailer_dict)
+            root = int(root_match.group(1)) if root_match else None
+        prev = _PREV_RE.search(trailer_dict)
+        section = int(prev.group(1)) if prev else None
+
+    if root is None:
+        return None
+    return offsets, root
+
+
+def _object_body(
+    read: ReadAt, offsets: dict[int, int], number: int, window: int
+) -> Optional[bytes]:
+    offset = offsets.get(number)
+    if offset is None:
+        return None
+    buf = read(offset, window)
+    header = _OBJ_HEADER_RE.match(buf)
+    if not header or int(header.group(1)) != number:
+        return None
+    body = buf[header.end() :]
+    end = body.find(b"endobj")
+    return body if end < 0 else body[:end]
+
+
+def count_pages_from_trailer(
+    read: ReadAt,
+    size: int,
+    tail: Optional[bytes] = None,
+    object_window: int = _OBJECT_WINDOW_BYTES,
+) -> Optional[int]:
+    """Page count via startxref -> xref chain -> /Root -> /Pages -> /Count.
+
+    Args:
+        read: ``read(offset, length)`` returning bytes of the file
+        size: File size in bytes
+        tail: Last bytes of the file if already at hand
+        object_window: Bytes read per object (catalog, page tree root)
+    """
+    if tail is None:
+        tail = read(max(0, size - _TAIL_BYTES), min(size, _TAIL_BYTES))
+    matches = list(_STARTXREF_RE.finditer(tail))
+    if not matches:
+        return None
+    xref = _read_xref_offsets(read, size, int(matches[-1].group(1)))
+    if xref is None:
+        return None
+    offsets, root = xref
+
+    catalog = _object_body(read, offsets, root, object_window)
+    pages_ref = _PAGES_REF_RE.search(catalog) if catalog else None
+    if not pages_ref:
+        return None
+    page_tree = _object_body(read, offsets, int(pages_ref.group(1)), object_window)
+    if not page_tree:
+        return None
+    count = _COUNT_RE.search(page_tree)
+    if not count:
+        return None
+    if count.group(0).rstrip().endswith(b"R"):
+        # /Count stored as an indirect object
+        body = _object_body(read, offsets, int(count.group(1)), object_window)
+        value = re.match(rb"\s*(\d+)", body) if body else None
+        return int(value.group(1)) if value else None
+    return int(count.group(1))
+
+
+def _count_from_buffer(buf) -> Optional[int]:
+    size = len(buf)
+    pages = linearized_page_count(buf[:LINEARIZED_HEADER_BYTES], file_size=size)
+    if pages is not None:
+        return pages
+    return count_pages_from_trailer(
+        lambda offset, length: buf[offset : offset + length], size
+    )
+
+
+def count_pdf_pages_fast(pdf_path: str) -> Optional[int]:
+    """Page count from trailer/xref/page tree root; None if not determinable."""
+    try:
+        with open(pdf_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                return _count_from_buffer(buf)
+    except (OSError, ValueError):
+        return None
+
+
+def count_pdf_pages(pdf_path: str) -> Optional[int]:
+    """Count PDF pages: fast path first, then pypdf or PyPDF2.
+
+    Args:
+        pdf_path: Path to PDF file
+
+    Returns:
+        Number of pages or None if counting fails
+    """
+    page_count = count_pdf_pages_fast(pdf_path)
+    if page_count is not None:
+        logger.debug(f"PDF page count (fast): {page_count} for {pdf_path}")
+        return page_count
+
+    try:
+        import pypdf as _pypdf  # type: ignore
+
+        reader = _pypdf.PdfReader(pdf_path)
+        page_count = len(reader.pages)
+        logger.debug(f"PDF page count: {page_count} pages for {pdf_path}")
+        return page_count
+    except Exception:
+        logger.debug("pypdf failed to count pages", exc_info=True)
+
+    try:
+        import PyPDF2 as _pypdf2  # type: ignore
+
+        reader = _pypdf2.PdfReader(pdf_path)
+        page_count = len(reader.pages)
+        logger.debug(f"PDF page count (PyPDF2): {page_count} for {pdf_path}")
+        return page_count
+    except Exception:
+        logger.debug("PyPDF2 failed to count pages", exc_info=True)
+
+    return None
@@ -0,0 +1,107 @@
+"""Benchmark disk bytes written per run by input ingestion + acquire.
+
+Simulates one run: the incoming document is written to a temporary
+location (upload/S3 download), then placed into the run directory by the
+acquire stage and the temporary file is removed. Compared strategies:
+
+    copy      shutil.copyfile into the run dir (previous behaviour)
+    adopt     adopt_file - rename, the pipeline owns the source
+    link      link_or_copy - reflink or hardlink, the caller keeps the source
+
+Bytes written are read from /proc/self/io (``write_bytes``), so this
+needs Linux. Without arguments a 50 MB uncompressed TIFF is generated.
+
+Usage:
+    python scripts/bench_acquire.py
+    python scripts/bench_acquire.py scan.tiff --runs-dir ./runs --repeat 5
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image  # noqa: E402
+
+from pipeline.utils.io_utils import adopt_file, link_or_copy  # noqa: E402
+
+
+def _write_bytes() -> int:
+    with open("/proc/self/io") as f:
+        for line in f:
+            if line.startswith("write_bytes:"):
+                return int(line.split()[1])
+    raise RuntimeError("write_bytes not available")
+
+
+def _make_tiff(path: str) -> None:
+    # 4096 x 4096 RGB, uncompressed: ~50 MB
+    Image.frombytes("RGB", (4096, 4096), os.urandom(4096 * 4096 * 3)).save(path)
+
+
+def _one_run(source: str, runs_dir: str, strategy: str) -> tuple[int, float]:
+    incoming = os.path.join(runs_dir, ".incoming", f"{uuid.uuid4()}.tiff")
+    run_input = os.path.join(runs_dir, "bench", str(uuid.uuid4()), "00_input.tiff")
+    os.makedirs(os.path.dirname(incoming), exist_ok=True)
+    os.makedirs(os.path.dirname(run_input), exist_ok=True)
+
+    os.sync()
+    before = _write_bytes()
+    started = time.perf_counter()
+
+    shutil.copyfile(source, incoming)  # ingestion: upload/download lands here
+    if strategy == "copy":
+        shutil.copyfile(incoming, run_input)
+        os.remove(incoming)
+    elif strategy == "adopt":
+        adopt_file(incoming, run_input)
+    else:
+        link_or_copy(incoming, run_input)
+        os.remove(incoming)
+    os.sync()
+
+    elapsed = time.perf_counter() - started
+    written = _write_bytes() - before
+    os.remove(run_input)
+    return written, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", nargs="?")
+    parser.add_argument("--runs-dir", default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    runs_dir = args.runs_dir or tempfile.mkdtemp(prefix="bench_runs_")
+    source = args.input
+    if source is None:
+        source = os.path.join(tempfile.gettempdir(), "bench_acquire.tiff")
+        _make_tiff(source)
+    size = os.path.getsize(source)
+
+    print(f"input {size / 1e6:.1f} MB, runs dir {runs_dir}")
+    print(f"{'strategy':10} {'MB written':>11} {'x input':>8} {'median s':>9}")
+    for strategy in ("copy", "adopt", "link"):
+        results = [_one_run(source, runs_dir, strategy) for _ in range(args.repeat)]
+        written = statistics.median(r[0] for r in results)
+        seconds = statistics.median(r[1] for r in results)
+        print(
+            f"{strategy:10} {written / 1e6:11.1f} {written / size:8.2f} {seconds:9.3f}"
+        )
+
+    shutil.rmtree(os.path.join(runs_dir, "bench"), ignore_errors=True)
+    if args.input is None:
+        os.remove(source)
+    if args.runs_dir is None:
+        shutil.rmtree(runs_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Benchmark JPEG passthrough against Pillow re-encoding in image-to-PDF conversion.
+
+Without arguments a synthetic 12 MP phone photo (4032x3024, EXIF
+orientation 6, quality 90) is generated; pass real photos to measure on
+actual traffic. Each file is converted ``--repeat`` times per path in a
+fresh subprocess so peak RSS is attributable to one path.
+
+Usage:
+    python scripts/bench_image_to_pdf.py
+    python scripts/bench_image_to_pdf.py photo1.jpg photo2.jpg --repeat 5
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image  # noqa: E402
+
+from pipeline.processors.image_to_pdf_converter import convert_image_to_pdf  # noqa: E402
+
+
+def _make_phone_photo(path: str) -> None:
+    width, height = 4032, 3024
+    # Noise compresses like a real photo instead of a flat colour
+    small = Image.frombytes(
+        "RGB", (width // 8, height // 8), random.randbytes(width * height * 3 // 64)
+    )
+    image = small.resize((width, height), Image.BILINEAR)
+    exif = image.getexif()
+    exif[0x0112] = 6
+    image.save(path, format="JPEG", quality=90, exif=exif)
+
+
+def _run_one(image_path: str, passthrough: bool, repeat: int) -> dict:
+    out_dir = tempfile.mkdtemp(prefix="bench_pdf_")
+    out_pdf = os.path.join(out_dir, "out.pdf")
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        convert_image_to_pdf(
+            image_path, output_path=out_pdf, overwrite=True, passthrough=passthrough
+        )
+        timings.append(time.perf_counter() - started)
+    result = {
+        "median_seconds": statistics.median(timings),
+        "output_bytes": os.path.getsize(out_pdf),
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+    os.remove(out_pdf)
+    os.rmdir(out_dir)
+    return result
+
+
+def _measure(image_path: str, passthrough: bool, repeat: int) -> dict:
+    """Run one path in a subprocess and return its measurements."""
+    proc = subprocess.run(
+        [
+            sys.executable,
+            __file__,
+            "--worker",
+            image_path,
+            "--repeat",
+            str(repeat),
+            "--passthrough" if passthrough else "--pillow",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(proc.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("images", nargs="*")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--passthrough", action="store_true", help=argparse.SUPPRESS)
+    mode.add_argument("--pillow", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(_run_one(args.images[0], args.passthrough, args.repeat)))
+        return
+
+    images = args.images
+    tmp_photo = None
+    if not images:
+        tmp_photo = os.path.join(tempfile.gettempdir(), "bench_phone_photo.jpg")
+        _make_phone_photo(tmp_photo)
+        images = [tmp_photo]
+
+    print(f"{'image':40} {'path':12} {'median s':>9} {'out MB':>8} {'peak RSS MB':>12}")
+    for image_path in images:
+        input_mb = os.path.getsize(image_path) / 1e6
+        print(f"{os.path.basename(image_path):40} {'input':12} {'':>9} {input_mb:8.2f}")
+        for name, passthrough in (("pillow", False), ("passthrough", True)):
+            r = _measure(image_path, passthrough, args.repeat)
+            print(
+                f"{'':40} {name:12} {r['median_seconds']:9.3f} "
+                f"{r['output_bytes'] / 1e6:8.2f} {r['peak_rss_mb']:12.1f}"
+            )
+
+    if tmp_photo:
+        os.remove(tmp_photo)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark S3 download: single stream vs concurrent byte ranges.
+
+Downloads one object repeatedly with each configuration and reports the
+median time and throughput. S3 connection settings come from the
+environment / .env like the service (S3_ENDPOINT, S3_ACCESS_KEY, ...).
+
+    stream        one GET (parallel threshold above the object size)
+    ranges xN     byte ranges of --part-mb, N in flight
+
+Usage:
+    python scripts/bench_s3_download.py scans/big.tiff
+    python scripts/bench_s3_download.py scans/big.tiff --concurrency 2 4 8 --part-mb 8
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.settings import s3_settings  # noqa: E402
+from services.s3_client import S3Client  # noqa: E402
+
+
+def _client(concurrency: int, part_mb: int, parallel: bool) -> S3Client:
+    return S3Client(
+        endpoint=s3_settings.S3_ENDPOINT,
+        access_key=s3_settings.S3_ACCESS_KEY,
+        secret_key=s3_settings.S3_SECRET_KEY.get_secret_value(),
+        bucket=s3_settings.S3_BUCKET,
+        secure=s3_settings.S3_SECURE,
+        max_pool_connections=max(concurrency, s3_settings.S3_MAX_POOL_CONNECTIONS),
+        parallel_threshold_mb=0 if parallel else 1 << 20,
+        part_size_mb=part_mb,
+        download_concurrency=concurrency,
+    )
+
+
+def _time_download(client: S3Client, key: str, size: int, etag: str) -> float:
+    fd, path = tempfile.mkstemp(prefix="bench_s3_")
+    os.close(fd)
+    try:
+        started = time.perf_counter()
+        client.download_file(key, path, etag=etag, size=size)
+        return time.perf_counter() - started
+    finally:
+        os.remove(path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("object_key")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--part-mb", type=int, default=s3_settings.S3_DOWNLOAD_PART_SIZE_MB)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    probe = _client(1, args.part_mb, parallel=False).probe_object(args.object_key)
+    size, etag = probe["size"], probe["etag"]
+    print(f"object {args.object_key}: {size / 1e6:.1f} MB, etag {etag}")
+    print(f"{'mode':12} {'median s':>9} {'MB/s':>8}")
+
+    configs = [("stream", 1, False)] + [
+        (f"ranges x{n}", n, True) for n in args.concurrency
+    ]
+    for label, concurrency, parallel in configs:
+        client = _client(concurrency, args.part_mb, parallel)
+        seconds = statistics.median(
+            _time_download(client, args.object_key, size, etag)
+            for _ in range(args.repeat)
+        )
+        print(f"{label:12} {seconds:9.3f} {size / 1e6 / seconds:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Local stand-in for the Tesseract OCR service.
+
+Implements the endpoints the pipeline uses, with a simulated processing
+time, so OCR completion modes can be exercised without the real service:
+
+    POST /pdf                upload (multipart ``file``, optional ``callback_url``)
+    GET  /result/{id}        result or {"status": "processing"};
+                             ``?wait=N`` holds the request up to N seconds
+    GET  /stats              upload / result-request counters
+
+Usage:
+    python scripts/fake_ocr_server.py --port 8001 --base-seconds 1.0 --per-page 0.5
+    OCR_BASE_URL=http://localhost:8001 uvicorn main:app
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Optional
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, File, Form, Query, UploadFile
+
+logger = logging.getLogger("fake_ocr")
+
+DEFAULT_TEXT = "Пример распознанного текста"
+
+
+@dataclass
+class _Job:
+    pages: int
+    ready_at: float
+    callback_url: Optional[str]
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+def _count_pages(data: bytes) -> int:
+    return max(1, data.count(b"/Type /Page") - data.count(b"/Type /Pages"))
+
+
+def create_app(base_seconds: float, per_page: float, text: str) -> FastAPI:
+    app = FastAPI(title="Fake OCR")
+    jobs: dict[str, _Job] = {}
+    stats = {"uploads": 0, "result_requests": 0, "callbacks": 0}
+
+    def _result(file_id: str) -> dict:
+        job = jobs[file_id]
+        return {
+            "id": file_id,
+            "status": "done",
+            "success": True,
+            "result": {
+                "data": {
+                    "pages": [
+                        {"page_number": n, "text": text}
+                        for n in range(1, job.pages + 1)
+                    ]
+                }
+            },
+        }
+
+    async def _process(file_id: str) -> None:
+        job = jobs[file_id]
+        await asyncio.sleep(max(0.0, job.ready_at - time.monotonic()))
+        job.done.set()
+        if job.callback_url:
+            stats["callbacks"] += 1
+            try:
+                async with httpx.AsyncClient(timeout=10) as client:
+                    await client.post(job.callback_url, json=_result(file_id))
+            except httpx.HTTPError as e:
+                logger.warning(f"Callback for {file_id} failed: {e}")
+
+    @app.post("/pdf")
+    async def upload(
+        file: UploadFile = File(...), callback_url: Optional[str] = Form(None)
+    ):
+        data = await file.read()
+        stats["uploads"] += 1
+        pages = _count_pages(data)
+        file_id = str(uuid.uuid4())
+        jobs[file_id] = _Job(
+            pages=pages,
+            ready_at=time.monotonic() + base_seconds + per_page * pages,
+            callback_url=callback_url,
+        )
+        asyncio.create_task(_process(file_id))
+        return {"id": file_id}
+
+    @app.get("/result/{file_id}")
+    async def result(file_id: str, wait: float = Query(0, ge=0, le=60)):
+        stats["result_requests"] += 1
+        job = jobs.get(file_id)
+        if job is None:
+            return {"id": file_id, "status": "failed", "error": "Unknown file id"}
+        if wait and not job.done.is_set():
+            try:
+                await asyncio.wait_for(job.done.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+        if not job.done.is_set():
+            return {"id": file_id, "status": "processing"}
+        return _result(file_id)
+
+    @app.get("/stats")
+    async def get_stats():
+        return stats
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--base-seconds", type=float, default=1.0)
+    parser.add_argument("--per-page", type=float, default=0.5)
+    parser.add_argument("--text", default=DEFAULT_TEXT)
+    args = parser.parse_args()
+
+    app = create_app(args.base_seconds, args.per_page, args.text)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
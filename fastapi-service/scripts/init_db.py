@@ -1,4 +1,4 @@
-"""Database setup script - creates verification_runs table."""
+"""Database setup script - creates verification_runs and child tables."""
 
 import asyncio
 import sys
@@ -61,6 +61,50 @@ CREATE TABLE IF NOT EXISTS verification_runs (
 );
 """
 
+# Per-stage timings (child of verification_runs)
+CREATE_STAGES_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS verification_run_stages (
+    id BIGSERIAL PRIMARY KEY,
+    run_id VARCHAR(255) NOT NULL REFERENCES verification_runs(run_id) ON DELETE CASCADE,
+    stage VARCHAR(100) NOT NULL,
+    started_offset_seconds NUMERIC(10, 6),
+    wall_seconds NUMERIC(10, 6) NOT NULL,
+    cpu_seconds NUMERIC(10, 6),
+    outcome VARCHAR(100) NOT NULL,
+    inserted_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+"""
+
+# Durable work queue for /v2/jobs (JOB_BACKEND=postgres)
+CREATE_JOBS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS pipeline_jobs (
+    run_id VARCHAR(255) PRIMARY KEY,
+    kind VARCHAR(20) NOT NULL,
+    payload JSONB NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    lease_owner VARCHAR(255),
+    lease_expires_at TIMESTAMPTZ,
+    available_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    submitted_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    started_at TIMESTAMPTZ,
+    finished_at TIMESTAMPTZ,
+    result JSONB,
+    error JSONB
+);
+"""
+
+# Jobs running on an expired lease, or queued for too long
+CREATE_JOBS_STUCK_VIEW_SQL = """
+CREATE OR REPLACE VIEW pipeline_jobs_stuck AS
+SELECT run_id, kind, status, attempts, max_attempts, lease_owner,
+       lease_expires_at, available_at, submitted_at, error
+FROM pipeline_jobs
+WHERE (status = 'running' AND lease_expires_at < NOW())
+   OR (status = 'queued' AND available_at < NOW() - INTERVAL '15 minutes');
+"""
+
 # Create indexes (run_id excluded - UNIQUE constraint already creates index)
 CREATE_INDEXES_SQL = [
     "CREATE INDEX IF NOT EXISTS idx_verification_runs_trace_id ON verification_runs(trace_id);",
@@ -69,6 +113,10 @@ CREATE_INDEXES_SQL = [
     "CREATE INDEX IF NOT EXISTS idx_verification_runs_external_iin ON verification_runs(external_iin);",
     "CREATE INDEX IF NOT EXISTS idx_verification_runs_status ON verification_runs(status);",
     "CREATE INDEX IF NOT EXISTS idx_verification_runs_inserted_at ON verification_runs(inserted_at DESC);",
+    "CREATE INDEX IF NOT EXISTS idx_verification_run_stages_run_id ON verification_run_stages(run_id);",
+    "CREATE INDEX IF NOT EXISTS idx_verification_run_stages_stage ON verification_run_stages(stage, inserted_at DESC);",
+    "CREATE INDEX IF NOT EXISTS idx_pipeline_jobs_queued ON pipeline_jobs(available_at) WHERE status = 'queued';",
+    "CREATE INDEX IF NOT EXISTS idx_pipeline_jobs_running ON pipeline_jobs(lease_expires_at) WHERE status = 'running';",
 ]
 
 # Add comments
@@ -79,6 +127,12 @@ ADD_COMMENTS_SQL = [
     "COMMENT ON COLUMN verification_runs.status IS 'Pipeline outcome: success or error';",
     "COMMENT ON COLUMN verification_runs.rule_verdict IS 'Final business rule verdict (true=approved, false=rejected)';",
     "COMMENT ON COLUMN verification_runs.rule_errors IS 'Array of rule error codes (e.g., [\"FIO_MISMATCH\"])';",
+    "COMMENT ON TABLE verification_run_stages IS 'Per-stage wall/CPU time and outcome for each pipeline run';",
+    "COMMENT ON COLUMN verification_run_stages.outcome IS 'ok, pipeline error code, cancelled, or exception type';",
+    "COMMENT ON TABLE pipeline_jobs IS 'Durable queue of /v2/jobs verification jobs (claimed with FOR UPDATE SKIP LOCKED)';",
+    "COMMENT ON COLUMN pipeline_jobs.status IS 'queued, running, completed or failed';",
+    "COMMENT ON COLUMN pipeline_jobs.lease_expires_at IS 'Running job is reclaimed by another worker after this time';",
+    "COMMENT ON COLUMN pipeline_jobs.result IS 'Pipeline result summary, checkpointed before DB insert and webhook';",
 ]
 
 
@@ -106,6 +160,15 @@ async def setup_database():
         await conn.execute(CREATE_TABLE_SQL)
         print("✅ Table created!")
 
+        print("\nCreating table 'verification_run_stages'...")
+        await conn.execute(CREATE_STAGES_TABLE_SQL)
+        print("✅ Table created!")
+
+        print("\nCreating table 'pipeline_jobs'...")
+        await conn.execute(CREATE_JOBS_TABLE_SQL)
+        await conn.execute(CREATE_JOBS_STUCK_VIEW_SQL)
+        print("✅ Table created!")
+
         # Create indexes
         print("\nCreating indexes...")
         for idx_sql in CREATE_INDEXES_SQL:
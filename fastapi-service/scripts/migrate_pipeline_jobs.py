@@ -0,0 +1,65 @@
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import core modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from pipeline.database.manager import create_database_manager_from_env
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def migrate():
+    logger.info("Starting schema migration...")
+    db_manager = create_database_manager_from_env()
+    await db_manager.connect()
+    pool = await db_manager.get_pool()
+
+    queries = [
+        """
+        CREATE TABLE IF NOT EXISTS pipeline_jobs (
+            run_id VARCHAR(255) PRIMARY KEY,
+            kind VARCHAR(20) NOT NULL,
+            payload JSONB NOT NULL,
+            status VARCHAR(20) NOT NULL DEFAULT 'queued',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            max_attempts INTEGER NOT NULL DEFAULT 3,
+            lease_owner VARCHAR(255),
+            lease_expires_at TIMESTAMPTZ,
+            available_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            submitted_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            started_at TIMESTAMPTZ,
+            finished_at TIMESTAMPTZ,
+            result JSONB,
+            error JSONB
+        );
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_pipeline_jobs_queued ON pipeline_jobs(available_at) WHERE status = 'queued';",
+        "CREATE INDEX IF NOT EXISTS idx_pipeline_jobs_running ON pipeline_jobs(lease_expires_at) WHERE status = 'running';",
+        """
+        CREATE OR REPLACE VIEW pipeline_jobs_stuck AS
+        SELECT run_id, kind, status, attempts, max_attempts, lease_owner,
+               lease_expires_at, available_at, submitted_at, error
+        FROM pipeline_jobs
+        WHERE (status = 'running' AND lease_expires_at < NOW())
+           OR (status = 'queued' AND available_at < NOW() - INTERVAL '15 minutes');
+        """,
+    ]
+
+    async with pool.acquire() as conn:
+        for query in queries:
+            logger.info(f"Executing: {query}")
+            await conn.execute(query)
+
+    logger.info("Migration completed successfully.")
+    await db_manager.disconnect()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(migrate())
+    except Exception as e:
+        logger.error(f"Migration failed: {e}")
+        sys.exit(1)
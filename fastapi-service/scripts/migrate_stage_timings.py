@@ -0,0 +1,51 @@
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import core modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from pipeline.database.manager import create_database_manager_from_env
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def migrate():
+    logger.info("Starting schema migration...")
+    db_manager = create_database_manager_from_env()
+    await db_manager.connect()
+    pool = await db_manager.get_pool()
+
+    queries = [
+        """
+        CREATE TABLE IF NOT EXISTS verification_run_stages (
+            id BIGSERIAL PRIMARY KEY,
+            run_id VARCHAR(255) NOT NULL REFERENCES verification_runs(run_id) ON DELETE CASCADE,
+            stage VARCHAR(100) NOT NULL,
+            started_offset_seconds NUMERIC(10, 6),
+            wall_seconds NUMERIC(10, 6) NOT NULL,
+            cpu_seconds NUMERIC(10, 6),
+            outcome VARCHAR(100) NOT NULL,
+            inserted_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        );
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_verification_run_stages_run_id ON verification_run_stages(run_id);",
+        "CREATE INDEX IF NOT EXISTS idx_verification_run_stages_stage ON verification_run_stages(stage, inserted_at DESC);",
+    ]
+
+    async with pool.acquire() as conn:
+        for query in queries:
+            logger.info(f"Executing: {query}")
+            await conn.execute(query)
+
+    logger.info("Migration completed successfully.")
+    await db_manager.disconnect()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(migrate())
+    except Exception as e:
+        logger.error(f"Migration failed: {e}")
+        sys.exit(1)
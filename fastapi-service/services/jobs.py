@@ -0,0 +1,852 @@
+"""Asynchronous verification jobs: submit now, fetch the result later.
+
+`POST /v2/jobs` stores a job record and returns its run_id immediately;
+a bounded pool of worker tasks in each process runs the pipeline. This
+decouples HTTP concurrency (and gunicorn's request timeout) from
+pipeline concurrency and lets short bursts queue instead of timing out.
+
+Two backends share one interface:
+
+- `JobQueue`: in-process asyncio queue; job records are JSON files under
+  `<runs_root>/.jobs/`. Queued jobs are lost if the process dies; on a
+  graceful stop they are marked failed (`SHUTDOWN`).
+- `PostgresJobQueue`: durable queue on the `pipeline_jobs` table with
+  leases and attempt counters (at-least-once, shared by all workers).
+
+Uploaded inputs live under `<runs_root>/.jobs/inputs` on the shared runs
+volume in both cases.
+
+Only jobs submitted here are durable. The synchronous routes (/v1/verify
+and the kafka verify routes) still persist runs and send webhooks in
+FastAPI background tasks, which a worker restart loses.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+import socket
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from pipeline.config.settings import UTC_OFFSET_HOURS
+from pipeline.database.client import fetch_webhook_status
+from pipeline.database.manager import DatabaseManager
+from pipeline.errors.exceptions import BaseError, ServiceOverloadedError
+from pipeline.utils.io_utils import read_json, write_json_atomic
+from services.processor import DocumentProcessor
+from services.tasks import persist_verification_run, send_webhook_and_persist
+from services.webhook_client import WebhookClient
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+TERMINAL_STATUSES = frozenset({JOB_COMPLETED, JOB_FAILED})
+
+JOB_KIND_KAFKA = "kafka"
+JOB_KIND_UPLOAD = "upload"
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone(timedelta(hours=UTC_OFFSET_HOURS))).isoformat()
+
+
+def _error_info(exc: Exception) -> dict[str, Any]:
+    if isinstance(exc, BaseError):
+        return {"code": exc.error_code, "message": exc.message}
+    return {"code": "INTERNAL_SERVER_ERROR", "message": str(exc)}
+
+
+@dataclass
+class Job:
+    """A submitted verification job and its outcome."""
+
+    run_id: str
+    kind: str
+    payload: dict[str, Any]
+    status: str = JOB_QUEUED
+    submitted_at: str = field(default_factory=_now_iso)
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    attempts: int = 0
+    result: Optional[dict[str, Any]] = None
+    error: Optional[dict[str, Any]] = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Job":
+        return cls(**{k: data[k] for k in cls.__dataclass_fields__ if k in data})
+
+    @property
+    def request_id(self) -> Optional[int]:
+        if self.kind == JOB_KIND_KAFKA:
+            return self.payload["event_data"].get("request_id")
+        return None
+
+
+async def _run_pipeline(processor: DocumentProcessor, job: Job) -> dict:
+    """Run the pipeline for a job and return the processor result."""
+    if job.payload.get("rejected"):
+        # Refused while the upload streamed in; only the run is recorded
+        return await processor.reject_document(
+            job.payload["rejected"],
+            original_filename=job.payload["original_filename"],
+            fio=job.payload["fio"],
+            run_id=job.run_id,
+        )
+    if job.kind == JOB_KIND_KAFKA:
+        return await processor.process_kafka_event(
+            event_data=job.payload["event_data"],
+            external_metadata=job.payload.get("external_metadata"),
+            run_id=job.run_id,
+        )
+    return await processor.process_document(
+        file_path=job.payload["file_path"],
+        original_filename=job.payload["original_filename"],
+        fio=job.payload["fio"],
+        run_id=job.run_id,
+    )
+
+
+def _summarize(job: Job, result: dict, elapsed: float) -> dict[str, Any]:
+    """Job-record view of a processor result."""
+    return {
+        "verdict": result.get("verdict", False),
+        "errors": [e["code"] for e in result.get("errors", [])],
+        "request_id": job.request_id,
+        "processing_time_seconds": round(elapsed, 2),
+        "final_result_path": result.get("final_result_path"),
+    }
+
+
+def _result_from_summary(job: Job) -> dict:
+    """Rebuild the processor result persisted by a previous attempt."""
+    summary = job.result or {}
+    return {
+        "run_id": job.run_id,
+        "verdict": summary.get("verdict", False),
+        "errors": [{"code": code} for code in summary.get("errors", [])],
+        "final_result_path": summary.get("final_result_path"),
+    }
+
+
+async def _wait_for_job(get, run_id: str, timeout: float, poll_interval: float):
+    deadline = time.monotonic() + timeout
+    job = await get(run_id)
+    while (
+        job is not None
+        and job.status not in TERMINAL_STATUSES
+        and time.monotonic() < deadline
+    ):
+        await asyncio.sleep(min(poll_interval, max(0.0, deadline - time.monotonic())))
+        job = await get(run_id)
+    return job
+
+
+def _upload_payload(
+    file_path: Optional[Path],
+    original_filename: str,
+    fio: str,
+    rejected: Optional[str],
+) -> dict[str, Any]:
+    payload = {
+        "file_path": str(file_path) if file_path is not None else None,
+        "original_filename": original_filename,
+        "fio": fio,
+    }
+    if rejected:
+        payload["rejected"] = rejected
+    return payload
+
+
+async def _adopt_upload(
+    store: "JobStore",
+    run_id: str,
+    upload_path: Path,
+    original_filename: str,
+    rejected: Optional[str],
+) -> Optional[Path]:
+    """Move a streamed upload to the job's input path (None if rejected)."""
+    if rejected:
+        return None
+    file_path = store.input_path(run_id, original_filename)
+    await asyncio.to_thread(os.replace, upload_path, file_path)
+    return file_path
+
+
+def _remove_input(job: Job) -> None:
+    if job.kind == JOB_KIND_UPLOAD and job.payload.get("file_path"):
+        try:
+            os.remove(job.payload["file_path"])
+        except OSError:
+            pass
+
+
+class JobStore:
+    """Job records as JSON files under `<runs_root>/.jobs`."""
+
+    def __init__(self, runs_root: Path) -> None:
+        self.root = Path(runs_root) / ".jobs"
+        self.inputs_dir = self.root / "inputs"
+        self.inputs_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def is_valid_run_id(run_id: str) -> bool:
+        try:
+            return str(uuid.UUID(run_id)) == run_id
+        except ValueError:
+            return False
+
+    def _path(self, run_id: str) -> Path:
+        return self.root / f"{run_id}.json"
+
+    def input_path(self, run_id: str, filename: str) -> Path:
+        """Location for a job's uploaded input (kept until the job finishes)."""
+        return self.inputs_dir / f"{run_id}{Path(filename).suffix}"
+
+    def incoming_path(self) -> Path:
+        """Fresh path to stream an upload to; renamed to ``input_path`` on submit."""
+        return self.inputs_dir / f".{uuid.uuid4()}.part"
+
+    async def save(self, job: Job) -> None:
+        await asyncio.to_thread(write_json_atomic, self._path(job.run_id), asdict(job))
+
+    async def load(self, run_id: str) -> Optional[Job]:
+        if not self.is_valid_run_id(run_id):
+            return None
+        try:
+            data = await asyncio.to_thread(read_json, self._path(run_id))
+        except FileNotFoundError:
+            return None
+        return Job.from_dict(data)
+
+
+class JobQueue:
+    """Bounded in-process job queue served by a fixed pool of worker tasks."""
+
+    def __init__(
+        self,
+        processor: DocumentProcessor,
+        store: JobStore,
+        db_manager: Optional[DatabaseManager],
+        webhook_client: Optional[WebhookClient],
+        workers: int,
+        max_pending: int,
+    ) -> None:
+        self.processor = processor
+        self.store = store
+        self.db_manager = db_manager
+        self.webhook_client = webhook_client
+        self.workers = workers
+        self._queue: asyncio.Queue[Job] = asyncio.Queue(maxsize=max_pending)
+        self._tasks: list[asyncio.Task] = []
+        self._running: dict[str, Job] = {}
+        self._avg_job_seconds = 30.0
+
+    async def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._worker(i), name=f"job-worker-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info(
+            f"Job queue started: workers={self.workers}, "
+            f"max_pending={self._queue.maxsize}"
+        )
+
+    async def stop(self) -> None:
+        """Cancel the workers and fail the jobs they will never finish.
+
+        Queued and interrupted jobs are marked failed with ``SHUTDOWN`` so
+        that clients polling them get a final status instead of one stuck
+        at queued/running.
+        """
+        interrupted = list(self._running.values())
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        while not self._queue.empty():
+            interrupted.append(self._queue.get_nowait())
+        failed = 0
+        for job in interrupted:
+            # A job may have finished between the snapshot and the cancel
+            current = await self.store.load(job.run_id)
+            if current is not None and current.status in TERMINAL_STATUSES:
+                continue
+            job.status = JOB_FAILED
+            job.finished_at = _now_iso()
+            job.error = {
+                "code": "SHUTDOWN",
+                "message": "Service stopped before the job finished",
+            }
+            _remove_input(job)
+            await self.store.save(job)
+            failed += 1
+        if failed:
+            logger.warning(f"Job queue stopped: {failed} unfinished jobs marked failed")
+
+    def _retry_after(self) -> int:
+        backlog = self._queue.qsize() + self.workers
+        return max(1, math.ceil(backlog * self._avg_job_seconds / self.workers))
+
+    async def _submit(self, job: Job) -> Job:
+        if self._queue.full():
+            raise ServiceOverloadedError("Job queue", retry_after=self._retry_after())
+        await self.store.save(job)
+        self._queue.put_nowait(job)
+        logger.info(
+            f"Job queued: run_id={job.run_id} kind={job.kind} "
+            f"queued={self._queue.qsize()}",
+            extra={"run_id": job.run_id},
+        )
+        return job
+
+    async def submit_kafka(
+        self, event_data: dict, external_metadata: dict
+    ) -> Job:
+        run_id = str(uuid.uuid4())
+        return await self._submit(
+            Job(
+                run_id=run_id,
+                kind=JOB_KIND_KAFKA,
+                payload={
+                    "event_data": event_data,
+                    "external_metadata": external_metadata,
+                },
+            )
+        )
+
+    async def submit_upload(
+        self,
+        upload_path: Path,
+        original_filename: str,
+        fio: str,
+        rejected: Optional[str] = None,
+    ) -> Job:
+        """Queue a streamed upload; the file at ``upload_path`` is moved in."""
+        if self._queue.full():
+            raise ServiceOverloadedError("Job queue", retry_after=self._retry_after())
+        run_id = str(uuid.uuid4())
+        file_path = await _adopt_upload(
+            self.store, run_id, upload_path, original_filename, rejected
+        )
+        job = Job(
+            run_id=run_id,
+            kind=JOB_KIND_UPLOAD,
+            payload=_upload_payload(file_path, original_filename, fio, rejected),
+        )
+        try:
+            return await self._submit(job)
+        except Exception:
+            _remove_input(job)
+            raise
+
+    async def get(self, run_id: str) -> Optional[Job]:
+        return await self.store.load(run_id)
+
+    async def wait(self, run_id: str, timeout: float) -> Optional[Job]:
+        """Return the job once it is finished or ``timeout`` elapses."""
+        return await _wait_for_job(self.get, run_id, timeout, poll_interval=0.5)
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            job = await self._queue.get()
+            self._running[job.run_id] = job
+            try:
+                await self.execute(job)
+            except Exception:
+                logger.error(f"Job worker {index} crashed on {job.run_id}", exc_info=True)
+            finally:
+                self._running.pop(job.run_id, None)
+                self._queue.task_done()
+
+    async def execute(self, job: Job) -> Job:
+        """Run one job through the pipeline and persist its outcome."""
+        started = time.perf_counter()
+        job.status = JOB_RUNNING
+        job.started_at = _now_iso()
+        job.attempts += 1
+        await self.store.save(job)
+
+        result = None
+        try:
+            result = await _run_pipeline(self.processor, job)
+            job.status = JOB_COMPLETED
+        except Exception as exc:
+            logger.error(f"Job {job.run_id} failed: {exc}", exc_info=True)
+            job.status = JOB_FAILED
+            job.error = _error_info(exc)
+        finally:
+            _remove_input(job)
+
+        elapsed = time.perf_counter() - started
+        self._avg_job_seconds = 0.8 * self._avg_job_seconds + 0.2 * elapsed
+        job.finished_at = _now_iso()
+        if result is not None:
+            job.result = _summarize(job, result, elapsed)
+        await self.store.save(job)
+
+        if result is not None:
+            await persist_verification_run(
+                result, self.db_manager, self.webhook_client, request_id=job.request_id
+            )
+        return job
+
+
+# ==============================================================================
+# Durable backend (PostgreSQL)
+# ==============================================================================
+
+_JOB_COLUMNS = """
+    run_id, kind, payload, status, attempts, submitted_at, started_at,
+    finished_at, result, error
+"""
+
+_CLAIM_SQL = f"""
+    UPDATE pipeline_jobs
+    SET status = 'running',
+        attempts = attempts + 1,
+        lease_owner = $1,
+        lease_expires_at = NOW() + make_interval(secs => $2),
+        started_at = NOW()
+    WHERE run_id = (
+        SELECT run_id FROM pipeline_jobs
+        WHERE (status = 'queued' AND available_at <= NOW())
+           OR (status = 'running' AND lease_expires_at < NOW()
+               AND attempts < max_attempts)
+        ORDER BY available_at
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING {_JOB_COLUMNS}
+"""
+
+_REAP_SQL = """
+    UPDATE pipeline_jobs
+    SET status = 'failed',
+        finished_at = NOW(),
+        lease_owner = NULL,
+        lease_expires_at = NULL,
+        error = jsonb_build_object(
+            'code', 'LEASE_EXPIRED',
+            'message', 'Worker lease expired after ' || attempts || ' attempts'
+        )
+    WHERE status = 'running'
+      AND lease_expires_at < NOW()
+      AND attempts >= max_attempts
+    RETURNING run_id, kind, payload
+"""
+
+_RETRY_BACKOFF_BASE_SECONDS = 5.0
+_RETRY_BACKOFF_MAX_SECONDS = 60.0
+_REAP_INTERVAL_SECONDS = 30.0
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    if value is None:
+        return None
+    return value.astimezone(timezone(timedelta(hours=UTC_OFFSET_HOURS))).isoformat()
+
+
+def _row_to_job(row) -> Job:
+    return Job(
+        run_id=row["run_id"],
+        kind=row["kind"],
+        payload=json.loads(row["payload"]),
+        status=row["status"],
+        submitted_at=_iso(row["submitted_at"]),
+        started_at=_iso(row["started_at"]),
+        finished_at=_iso(row["finished_at"]),
+        attempts=row["attempts"],
+        result=json.loads(row["result"]) if row["result"] else None,
+        error=json.loads(row["error"]) if row["error"] else None,
+    )
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, BaseError):
+        return exc.retryable
+    return True
+
+
+class PostgresJobQueue:
+    """Durable job queue on the `pipeline_jobs` table.
+
+    Workers claim jobs with ``SELECT ... FOR UPDATE SKIP LOCKED`` and hold a
+    lease that is renewed while the pipeline runs. A job whose lease expires
+    (worker restart, OOM kill) is claimed again by any worker until
+    ``max_attempts`` is reached, after which it is marked failed. The
+    pipeline result is checkpointed on the job row, so a retry after a crash
+    during persistence skips the pipeline and only finishes the DB insert
+    and webhook.
+    """
+
+    def __init__(
+        self,
+        processor: DocumentProcessor,
+        store: JobStore,
+        db_manager: DatabaseManager,
+        webhook_client: Optional[WebhookClient],
+        workers: int,
+        max_pending: int,
+        lease_seconds: float,
+        max_attempts: int,
+        poll_interval: float,
+    ) -> None:
+        self.processor = processor
+        self.store = store
+        self.db_manager = db_manager
+        self.webhook_client = webhook_client
+        self.workers = workers
+        self.max_pending = max_pending
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+        self._avg_job_seconds = 30.0
+
+    async def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._worker(i), name=f"job-worker-{i}")
+            for i in range(self.workers)
+        ]
+        self._tasks.append(asyncio.create_task(self._reaper(), name="job-reaper"))
+        logger.info(
+            f"Postgres job queue started: worker_id={self.worker_id}, "
+            f"workers={self.workers}, lease={self.lease_seconds}s, "
+            f"max_attempts={self.max_attempts}"
+        )
+
+    async def stop(self) -> None:
+        # Jobs interrupted here keep their lease and are reclaimed by
+        # another worker once it expires.
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def _retry_after(self, pending: int) -> int:
+        return max(1, math.ceil(pending * self._avg_job_seconds / self.workers))
+
+    async def _submit(self, job: Job) -> Job:
+        pool = await self.db_manager.get_pool()
+        async with pool.acquire() as conn:
+            pending = await conn.fetchval(
+                "SELECT count(*) FROM pipeline_jobs WHERE status = 'queued'"
+            )
+            if pending >= self.max_pending:
+                raise ServiceOverloadedError(
+                    "Job queue", retry_after=self._retry_after(pending)
+                )
+            row = await conn.fetchrow(
+                f"""
+                INSERT INTO pipeline_jobs (run_id, kind, payload, max_attempts)
+                VALUES ($1, $2, $3::jsonb, $4)
+                RETURNING {_JOB_COLUMNS}
+                """,
+                job.run_id,
+                job.kind,
+                json.dumps(job.payload, ensure_ascii=False),
+                self.max_attempts,
+            )
+        self._wakeup.set()
+        logger.info(
+            f"Job queued: run_id={job.run_id} kind={job.kind} pending={pending + 1}",
+            extra={"run_id": job.run_id},
+        )
+        return _row_to_job(row)
+
+    async def submit_kafka(self, event_data: dict, external_metadata: dict) -> Job:
+        return await self._submit(
+            Job(
+                run_id=str(uuid.uuid4()),
+                kind=JOB_KIND_KAFKA,
+                payload={
+                    "event_data": event_data,
+                    "external_metadata": external_metadata,
+                },
+            )
+        )
+
+    async def submit_upload(
+        self,
+        upload_path: Path,
+        original_filename: str,
+        fio: str,
+        rejected: Optional[str] = None,
+    ) -> Job:
+        """Queue a streamed upload; the file at ``upload_path`` is moved in."""
+        run_id = str(uuid.uuid4())
+        file_path = await _adopt_upload(
+            self.store, run_id, upload_path, original_filename, rejected
+        )
+        job = Job(
+            run_id=run_id,
+            kind=JOB_KIND_UPLOAD,
+            payload=_upload_payload(file_path, original_filename, fio, rejected),
+        )
+        try:
+            return await self._submit(job)
+        except Exception:
+            _remove_input(job)
+            raise
+
+    async def get(self, run_id: str) -> Optional[Job]:
+        if not JobStore.is_valid_run_id(run_id):
+            return None
+        pool = await self.db_manager.get_pool()
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(
+                f"SELECT {_JOB_COLUMNS} FROM pipeline_jobs WHERE run_id = $1", run_id
+            )
+        return _row_to_job(row) if row is not None else None
+
+    async def wait(self, run_id: str, timeout: float) -> Optional[Job]:
+        """Return the job once it is finished or ``timeout`` elapses."""
+        return await _wait_for_job(self.get, run_id, timeout, poll_interval=1.0)
+
+    async def _claim(self) -> Optional[Job]:
+        pool = await self.db_manager.get_pool()
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(_CLAIM_SQL, self.worker_id, self.lease_seconds)
+        return _row_to_job(row) if row is not None else None
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            try:
+                job = await self._claim()
+            except Exception as e:
+                logger.error(f"Job worker {index} failed to claim: {e}", exc_info=True)
+                job = None
+
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            try:
+                await self.execute(job)
+            except Exception:
+                logger.error(f"Job worker {index} crashed on {job.run_id}", exc_info=True)
+
+    async def _reaper(self) -> None:
+        """Fail jobs whose lease expired on their last attempt (dropping their
+        uploaded inputs); report stuck jobs."""
+        while True:
+            await asyncio.sleep(_REAP_INTERVAL_SECONDS)
+            try:
+                pool = await self.db_manager.get_pool()
+                async with pool.acquire() as conn:
+                    reaped = await conn.fetch(_REAP_SQL)
+                    stuck = await conn.fetchval("SELECT count(*) FROM pipeline_jobs_stuck")
+                for row in reaped:
+                    logger.warning(
+                        f"Job {row['run_id']} failed: lease expired on final attempt",
+                        extra={"run_id": row["run_id"]},
+                    )
+                    _remove_input(
+                        Job(
+                            run_id=row["run_id"],
+                            kind=row["kind"],
+                            payload=json.loads(row["payload"]),
+                        )
+                    )
+                if stuck:
+                    logger.warning(f"{stuck} pipeline jobs are stuck (see pipeline_jobs_stuck)")
+            except Exception as e:
+                logger.error(f"Job reaper failed: {e}", exc_info=True)
+
+    async def _renew_lease(self, run_id: str) -> bool:
+        """Extend this worker's lease; False if the job is no longer ours."""
+        pool = await self.db_manager.get_pool()
+        async with pool.acquire() as conn:
+            status = await conn.execute(
+                """
+                UPDATE pipeline_jobs
+                SET lease_expires_at = NOW() + make_interval(secs => $3)
+                WHERE run_id = $1 AND lease_owner = $2 AND status = 'running'
+                """,
+                run_id,
+                self.worker_id,
+                self.lease_seconds,
+            )
+        return not status.endswith(" 0")
+
+    async def _heartbeat(
+        self, run_id: str, work: asyncio.Task, lease_lost: asyncio.Event
+    ) -> None:
+        """Renew the lease; on losing it, stop the job's work."""
+        interval = self.lease_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await self._renew_lease(run_id):
+                    logger.warning(
+                        f"Lost lease on job {run_id}, abandoning it",
+                        extra={"run_id": run_id},
+                    )
+                    lease_lost.set()
+                    work.cancel()
+                    return
+            except Exception as e:
+                logger.error(f"Lease renewal failed for {run_id}: {e}", exc_info=True)
+
+    async def _update_owned(self, query: str, run_id: str, *args) -> Optional[str]:
+        pool = await self.db_manager.get_pool()
+        async with pool.acquire() as conn:
+            return await conn.fetchval(query, run_id, self.worker_id, *args)
+
+    async def _persist(self, job: Job, result: dict) -> None:
+        """Insert the run and send its webhook, skipping steps already done."""
+        if job.attempts > 1:
+            stored = await fetch_webhook_status(job.run_id, self.db_manager)
+            if stored is not None:
+                logger.info(
+                    f"Job {job.run_id} run already inserted by a previous attempt",
+                    extra={"run_id": job.run_id},
+                )
+                if (
+                    job.request_id is not None
+                    and self.webhook_client is not None
+                    and stored["webhook_status"] != "SUCCESS"
+                ):
+                    await send_webhook_and_persist(
+                        job.request_id,
+                        result.get("verdict", False),
+                        [e["code"] for e in result.get("errors", [])],
+                        job.run_id,
+                        self.db_manager,
+                        self.webhook_client,
+                    )
+                return
+
+        await persist_verification_run(
+            result, self.db_manager, self.webhook_client, request_id=job.request_id
+        )
+
+    async def execute(self, job: Job) -> None:
+        """Run a claimed job while holding its lease.
+
+        If the lease is lost (expired and reclaimed by another worker), the
+        work is cancelled: the other worker now owns the run, its result,
+        the webhook and the input file.
+        """
+        lease_lost = asyncio.Event()
+        work = asyncio.create_task(self._execute_owned(job))
+        heartbeat = asyncio.create_task(self._heartbeat(job.run_id, work, lease_lost))
+        try:
+            await work
+        except asyncio.CancelledError:
+            if not lease_lost.is_set():
+                work.cancel()  # worker shutdown
+                raise
+            logger.warning(
+                f"Job {job.run_id} abandoned after losing its lease",
+                extra={"run_id": job.run_id},
+            )
+        finally:
+            heartbeat.cancel()
+
+    def _log_lease_lost(self, job: Job, step: str) -> None:
+        logger.warning(
+            f"Job {job.run_id} no longer owned, skipping {step}",
+            extra={"run_id": job.run_id},
+        )
+
+    async def _execute_owned(self, job: Job) -> None:
+        """Run the pipeline, checkpoint its result, persist it and finish it."""
+        try:
+            if job.result and job.result.get("final_result_path"):
+                logger.info(
+                    f"Job {job.run_id} resuming after pipeline (attempt {job.attempts})",
+                    extra={"run_id": job.run_id},
+                )
+                result = _result_from_summary(job)
+            else:
+                started = time.perf_counter()
+                result = await _run_pipeline(self.processor, job)
+                elapsed = time.perf_counter() - started
+                self._avg_job_seconds = 0.8 * self._avg_job_seconds + 0.2 * elapsed
+                job.result = _summarize(job, result, elapsed)
+                status = await self._update_owned(
+                    """
+                    UPDATE pipeline_jobs SET result = $3::jsonb
+                    WHERE run_id = $1 AND lease_owner = $2
+                    RETURNING status
+                    """,
+                    job.run_id,
+                    json.dumps(job.result),
+                )
+                if status is None:
+                    self._log_lease_lost(job, "persistence")
+                    return
+
+            # Insert and webhook must come from the lease owner only; renewing
+            # also gives them a full lease period
+            if not await self._renew_lease(job.run_id):
+                self._log_lease_lost(job, "persistence")
+                return
+            await self._persist(job, result)
+            status = await self._update_owned(
+                """
+                UPDATE pipeline_jobs
+                SET status = 'completed', finished_at = NOW(),
+                    lease_owner = NULL, lease_expires_at = NULL
+                WHERE run_id = $1 AND lease_owner = $2
+                RETURNING status
+                """,
+                job.run_id,
+            )
+            if status is None:
+                # Reclaimed while persisting: the new owner may be reading it
+                self._log_lease_lost(job, "input removal")
+                return
+            _remove_input(job)
+        except Exception as exc:
+            retryable = _is_retryable(exc)
+            backoff = min(
+                _RETRY_BACKOFF_MAX_SECONDS,
+                _RETRY_BACKOFF_BASE_SECONDS * 2 ** (job.attempts - 1),
+            )
+            logger.error(
+                f"Job {job.run_id} attempt {job.attempts} failed: {exc}",
+                exc_info=True,
+                extra={"run_id": job.run_id},
+            )
+            status = await self._update_owned(
+                """
+                UPDATE pipeline_jobs
+                SET status = CASE WHEN $3 AND attempts < max_attempts
+                                  THEN 'queued' ELSE 'failed' END,
+                    available_at = NOW() + make_interval(secs => $4),
+                    finished_at = CASE WHEN $3 AND attempts < max_attempts
+                                       THEN NULL ELSE NOW() END,
+                    error = $5::jsonb,
+                    lease_owner = NULL,
+                    lease_expires_at = NULL
+                WHERE run_id = $1 AND lease_owner = $2
+                RETURNING status
+                """,
+                job.run_id,
+                retryable,
+                backoff,
+                json.dumps(_error_info(exc), ensure_ascii=False),
+            )
+            if status == JOB_FAILED:
+                _remove_input(job)
+
+
+AnyJobQueue = JobQueue | PostgresJobQueue
@@ -1,6 +1,11 @@
 """Response mapping utilities for API endpoints."""
 
-from api.schemas import KafkaEventRequest, KafkaResponse, VerifyResponse
+from api.schemas import (
+    JobStatusResponse,
+    KafkaEventRequest,
+    KafkaResponse,
+    VerifyResponse,
+)
 
 
 def build_verify_response(
@@ -58,3 +63,25 @@ def build_kafka_response(
         status="success" if verdict else "fail",
         err_codes=[e["code"] for e in errors],
     )
+
+
+def build_job_status_response(job: dict) -> JobStatusResponse:
+    """Map a stored job record to JobStatusResponse."""
+    result = job.get("result") or {}
+    request_id = result.get("request_id")
+    if request_id is None and job.get("kind") == "kafka":
+        request_id = job["payload"]["event_data"].get("request_id")
+    return JobStatusResponse(
+        run_id=job["run_id"],
+        kind=job["kind"],
+        status=job["status"],
+        submitted_at=job["submitted_at"],
+        started_at=job.get("started_at"),
+        finished_at=job.get("finished_at"),
+        attempts=job.get("attempts", 0),
+        request_id=request_id,
+        verdict=result.get("verdict"),
+        errors=result.get("errors", []),
+        processing_time_seconds=result.get("processing_time_seconds"),
+        error=job.get("error"),
+    )
@@ -3,11 +3,12 @@
 import asyncio
 import logging
 import os
-import tempfile
+import uuid
 from pathlib import Path
 
 from core.settings import s3_settings
-from fastapi import UploadFile
+from pipeline.clients.tesseract_async_client import TesseractAsyncClient
+from pipeline.config.settings import MAX_FILE_SIZE_MB, MAX_PDF_PAGES
 from pipeline.errors.exceptions import ExternalServiceError
 from pipeline.orchestrator import PipelineRunner
 from pipeline.utils.io_utils import build_fio
@@ -16,20 +17,6 @@ from services.s3_client import S3Client
 logger = logging.getLogger(__name__)
 
 
-async def _save_upload_to_temp(file: UploadFile) -> str:
-    """Save uploaded file to temporary location.
-
-    Returns:
-        Absolute path to temporary file
-    """
-    with tempfile.NamedTemporaryFile(
-        delete=False, suffix=f"_{file.filename}"
-    ) as temp_file:
-        content = await file.read()
-        temp_file.write(content)
-        return temp_file.name
-
-
 def _extract_event_fields(event_data: dict) -> tuple[str, str, str]:
     """Extract request_id, s3_path, and filename from event data."""
     from pathlib import Path
@@ -49,44 +36,73 @@ def _build_fio_from_event(event_data: dict) -> str:
     )
 
 
+async def _probe_s3_async(s3_client: S3Client, s3_path: str) -> dict:
+    """Check size, type and PDF page count of an S3 object asynchronously."""
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(
+        None,
+        lambda: s3_client.probe_object(
+            s3_path, max_size_bytes=MAX_FILE_SIZE_MB * 1024 * 1024
+        ),
+    )
+
+
 async def _download_from_s3_async(
-    s3_client: S3Client, s3_path: str, tmp_path: str
+    s3_client: S3Client,
+    s3_path: str,
+    tmp_path: str,
+    etag: str | None = None,
+    size: int | None = None,
 ) -> dict:
-    """Download file from S3 to temp path asynchronously."""
+    """Download file from S3 to a local path asynchronously."""
     loop = asyncio.get_event_loop()
     return await loop.run_in_executor(
-        None, lambda: s3_client.download_file(s3_path, tmp_path)
+        None,
+        lambda: s3_client.download_file(
+            s3_path,
+            tmp_path,
+            max_size_bytes=MAX_FILE_SIZE_MB * 1024 * 1024,
+            etag=etag,
+            size=size,
+        ),
     )
 
 
 async def _run_pipeline_async(
+    runner: PipelineRunner,
     fio: str,
     tmp_path: str,
     filename: str,
-    runs_root: Path,
     external_metadata: dict | None,
+    run_id: str | None = None,
+    input_sha256: str | None = None,
 ) -> dict:
-    """Execute pipeline in thread pool executor."""
-    loop = asyncio.get_event_loop()
-    runner = PipelineRunner(runs_root)
-    return await loop.run_in_executor(
-        None,
-        lambda: runner.run(
-            fio=fio,
-            source_file_path=tmp_path,
-            original_filename=filename,
-            external_metadata=external_metadata,
-        ),
+    """Execute pipeline on the running event loop.
+
+    The downloaded file is handed over to the run (moved, not copied).
+    """
+    return await runner.run(
+        fio=fio,
+        source_file_path=tmp_path,
+        original_filename=filename,
+        external_metadata=external_metadata,
+        run_id=run_id,
+        input_sha256=input_sha256,
+        adopt_source=True,
     )
 
 
 class DocumentProcessor:
     """Processes documents through the RB-OCR pipeline."""
 
-    def __init__(self, runs_root: str = "./runs"):
+    def __init__(
+        self,
+        runs_root: str = "./runs",
+        ocr_client: TesseractAsyncClient | None = None,
+    ):
         self.runs_root = Path(runs_root)
         self.runs_root.mkdir(parents=True, exist_ok=True)
-        self.runner = PipelineRunner(self.runs_root)
+        self.runner = PipelineRunner(self.runs_root, ocr_client=ocr_client)
 
         try:
             self.s3_client = S3Client(
@@ -95,6 +111,10 @@ class DocumentProcessor:
                 secret_key=s3_settings.S3_SECRET_KEY.get_secret_value(),
                 bucket=s3_settings.S3_BUCKET,
                 secure=s3_settings.S3_SECURE,
+                max_pool_connections=s3_settings.S3_MAX_POOL_CONNECTIONS,
+                parallel_threshold_mb=s3_settings.S3_PARALLEL_DOWNLOAD_THRESHOLD_MB,
+                part_size_mb=s3_settings.S3_DOWNLOAD_PART_SIZE_MB,
+                download_concurrency=s3_settings.S3_DOWNLOAD_CONCURRENCY,
             )
         except Exception as e:
             logger.error(
@@ -104,11 +124,24 @@ class DocumentProcessor:
 
         logger.info(f"DocumentProcessor initialized. runs_root={self.runs_root}")
 
+    def incoming_path(self, suffix: str = "") -> Path:
+        """Fresh path for an incoming document next to the run directories.
+
+        Being on the same filesystem as the runs, the pipeline adopts the
+        file with a rename instead of a copy (``adopt_source``).
+        """
+        incoming_dir = self.runs_root / ".incoming"
+        incoming_dir.mkdir(parents=True, exist_ok=True)
+        return incoming_dir / f"{uuid.uuid4()}{suffix}"
+
     async def process_document(
         self,
         file_path: str,
         original_filename: str,
         fio: str,
+        run_id: str | None = None,
+        input_sha256: str | None = None,
+        adopt_source: bool = False,
     ) -> dict:
         """
         Process a document through the pipeline.
@@ -117,6 +150,9 @@ class DocumentProcessor:
             file_path: Temporary file path
             original_filename: Original uploaded filename
             fio: Applicant's full name
+            run_id: Optional pre-assigned run ID
+            input_sha256: SHA-256 of the file if already computed
+            adopt_source: Move ``file_path`` into the run instead of copying
 
         Returns:
             dict with run_id, verdict, errors
@@ -125,14 +161,13 @@ class DocumentProcessor:
 
         self.runs_root.mkdir(parents=True, exist_ok=True)
 
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,
-            lambda: self.runner.run(
-                fio=fio,
-                source_file_path=file_path,
-                original_filename=original_filename,
-            ),
+        result = await self.runner.run(
+            fio=fio,
+            source_file_path=file_path,
+            original_filename=original_filename,
+            run_id=run_id,
+            input_sha256=input_sha256,
+            adopt_source=adopt_source,
         )
 
         logger.info(
@@ -146,10 +181,43 @@ class DocumentProcessor:
             "final_result_path": result.get("final_result_path"),
         }
 
+    async def reject_document(
+        self,
+        code: str,
+        original_filename: str,
+        fio: str | None,
+        run_id: str | None = None,
+        external_metadata: dict | None = None,
+    ) -> dict:
+        """Record a document refused during ingestion (no pipeline stages run).
+
+        Returns:
+            dict with run_id, verdict, errors, as ``process_document``
+        """
+        logger.info(f"Rejected during ingestion: {original_filename} ({code})")
+
+        self.runs_root.mkdir(parents=True, exist_ok=True)
+
+        result = await asyncio.to_thread(
+            self.runner.reject,
+            code,
+            fio,
+            original_filename,
+            external_metadata=external_metadata,
+            run_id=run_id,
+        )
+        return {
+            "run_id": result.get("run_id"),
+            "verdict": False,
+            "errors": result.get("errors", []),
+            "final_result_path": result.get("final_result_path"),
+        }
+
     async def process_kafka_event(
         self,
         event_data: dict,
         external_metadata: dict | None = None,
+        run_id: str | None = None,
     ) -> dict:
         """
         Process a Kafka event containing S3 file reference.
@@ -157,6 +225,7 @@ class DocumentProcessor:
         Args:
             event_data: Kafka event body as dict
             external_metadata: Optional dict with trace_id and external metadata
+            run_id: Optional pre-assigned run ID
 
         Returns:
             dict with run_id, verdict, errors
@@ -172,8 +241,7 @@ class DocumentProcessor:
         )
         logger.info(f"Built FIO: {fio}")
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f"_{filename}") as tmp:
-            tmp_path = tmp.name
+        tmp_path = str(self.incoming_path(Path(filename).suffix))
 
         try:
             if not self.s3_client:
@@ -185,15 +253,37 @@ class DocumentProcessor:
                     },
                 )
 
+            # Size, signature and page count from a few KB of ranged GETs;
+            # invalid objects are refused before the full download
+            probe = await _probe_s3_async(self.s3_client, s3_path)
+            if probe["page_count"] is not None and probe["page_count"] > MAX_PDF_PAGES:
+                return await self.reject_document(
+                    "PDF_TOO_MANY_PAGES",
+                    original_filename=filename,
+                    fio=fio,
+                    run_id=run_id,
+                    external_metadata=external_metadata,
+                )
+
             s3_metadata = await _download_from_s3_async(
-                self.s3_client, s3_path, tmp_path
+                self.s3_client,
+                s3_path,
+                tmp_path,
+                etag=probe["etag"] or None,
+                size=probe["size"],
             )
             logger.info(
                 f"Downloaded from S3: {s3_path} -> {tmp_path} ({s3_metadata['size']} bytes)"
             )
 
             result = await _run_pipeline_async(
-                fio, tmp_path, filename, self.runs_root, external_metadata
+                self.runner,
+                fio,
+                tmp_path,
+                filename,
+                external_metadata,
+                run_id,
+                input_sha256=s3_metadata["sha256"],
             )
             logger.info(
                 f"Pipeline completed: run_id={result.get('run_id')}, verdict={result.get('verdict')}"
@@ -206,8 +296,11 @@ class DocumentProcessor:
                 "final_result_path": result.get("final_result_path"),
             }
         finally:
+            # Normally already moved into the run directory
             try:
                 os.remove(tmp_path)
                 logger.debug(f"Removed temp file: {tmp_path}")
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 logger.warning(f"Failed to remove temp file {tmp_path}: {e}")
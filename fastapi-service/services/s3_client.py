@@ -1,16 +1,143 @@
 """S3 client for MinIO operations."""
 
+import hashlib
 import logging
+import os
+import re
 import ssl
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
 import urllib3
 from minio import Minio
 from minio.error import S3Error
-from pipeline.errors.exceptions import ExternalServiceError, ResourceNotFoundError
+from pipeline.errors.exceptions import (
+    BaseError,
+    ExternalServiceError,
+    PayloadTooLargeError,
+    ResourceNotFoundError,
+    ValidationError,
+)
+from pipeline.utils.file_detection import detect_file_type_from_bytes
+from pipeline.utils.pdf_pages import (
+    LINEARIZED_HEADER_BYTES,
+    count_pages_from_trailer,
+    linearized_page_count,
+)
 
 logger = logging.getLogger(__name__)
 
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+_SIGNATURE_BYTES = 8
+_HTTP_TIMEOUT_SECONDS = 300
+# Single-part uploads have the content MD5 as ETag; multipart ETags
+# ("<md5>-<parts>") cannot be checked without the part layout
+_PLAIN_ETAG_RE = re.compile(r"^[0-9a-f]{32}$")
+# Catalog / page tree root dictionaries are small; a flat /Kids array of
+# a document within MAX_PDF_PAGES fits easily
+_PROBE_OBJECT_WINDOW_BYTES = 4096
+# Below this the trailer probe would cost about as much as the download;
+# the pipeline counts pages after it
+_PROBE_TRAILER_MIN_BYTES = 64 * 1024
+
+
+def _check_signature(header: bytes, object_key: str) -> str:
+    detected = detect_file_type_from_bytes(header)
+    if detected is None:
+        raise ValidationError(
+            message="Unsupported file type (expected PDF, JPEG, PNG or TIFF)",
+            field="s3_path",
+            details={"object_key": object_key},
+        )
+    return detected[0]
+
+
+def _too_large(max_size_bytes: int, size: int) -> PayloadTooLargeError:
+    return PayloadTooLargeError(
+        max_size_mb=max_size_bytes // (1024 * 1024),
+        actual_size_mb=size / (1024 * 1024),
+    )
+
+
+def _s3_error(e: S3Error, object_key: str) -> BaseError:
+    if e.code == "NoSuchKey":
+        logger.warning(f"S3 object not found: {object_key}")
+        return ResourceNotFoundError(resource_type="S3 object", resource_id=object_key)
+    # Other S3 errors (permission denied, object changed, etc.)
+    logger.error(f"S3 error reading {object_key}: {e}")
+    return ExternalServiceError(
+        service_name="S3",
+        error_type="error",
+        details={"object_key": object_key, "error_code": e.code},
+    )
+
+
+def _object_size(headers) -> int:
+    # Ranged responses: "Content-Range: bytes 0-1023/52428800"
+    content_range = headers.get("Content-Range")
+    if content_range and "/" in content_range:
+        return int(content_range.rsplit("/", 1)[1])
+    return int(headers.get("Content-Length") or 0)
+
+
+def _if_match(etag: str | None) -> dict | None:
+    return {"If-Match": f'"{etag}"'} if etag else None
+
+
+@lru_cache(maxsize=None)
+def _shared_http_client(secure: bool, max_connections: int) -> urllib3.PoolManager:
+    """One connection pool per process and scheme, shared by all S3Clients."""
+    # TLS options only apply to HTTPS pools (HTTP pools reject them)
+    tls = {"cert_reqs": ssl.CERT_NONE, "assert_hostname": False} if secure else {}
+    return urllib3.PoolManager(
+        maxsize=max_connections,
+        timeout=urllib3.Timeout(
+            connect=_HTTP_TIMEOUT_SECONDS, read=_HTTP_TIMEOUT_SECONDS
+        ),
+        retries=urllib3.Retry(
+            total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]
+        ),
+        **tls,
+    )
+
+
+def _preallocate(fd: int, size: int) -> None:
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except (AttributeError, OSError):
+        # Not supported by the platform/filesystem: sparse file of full size
+        os.ftruncate(fd, size)
+
+
+def _pwrite_all(fd: int, data: bytes, offset: int) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+
+
+def _file_digests(path: str, with_md5: bool) -> tuple[str, str | None]:
+    sha256 = hashlib.sha256()
+    md5 = hashlib.md5(usedforsecurity=False) if with_md5 else None
+    with open(path, "rb") as f:
+        while chunk := f.read(_DOWNLOAD_CHUNK_SIZE):
+            sha256.update(chunk)
+            if md5 is not None:
+                md5.update(chunk)
+    return sha256.hexdigest(), md5.hexdigest() if md5 is not None else None
+
+
+def _remove_partial(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Failed to remove partial download {path}: {e}")
+
 
 class S3Client:
     """Client for interacting with MinIO S3 storage."""
@@ -22,6 +149,10 @@ class S3Client:
         secret_key: str,
         bucket: str,
         secure: bool = True,
+        max_pool_connections: int = 16,
+        parallel_threshold_mb: int = 16,
+        part_size_mb: int = 8,
+        download_concurrency: int = 4,
     ):
         """
         Initialize S3 client.
@@ -32,13 +163,19 @@ class S3Client:
             secret_key: S3 secret key
             bucket: S3 bucket name
             secure: Use HTTPS (default: True)
+            max_pool_connections: Size of the shared connection pool
+            parallel_threshold_mb: Download objects of at least this size
+                as concurrent byte ranges
+            part_size_mb: Byte range size for parallel downloads
+            download_concurrency: Ranges in flight per download
         """
         self.bucket = bucket
         self.endpoint = endpoint
+        self.parallel_threshold_bytes = parallel_threshold_mb * 1024 * 1024
+        self.part_size_bytes = part_size_mb * 1024 * 1024
+        self.download_concurrency = max(1, download_concurrency)
 
-        http_client = urllib3.PoolManager(
-            cert_reqs=ssl.CERT_NONE, assert_hostname=False
-        )
+        http_client = _shared_http_client(secure, max_pool_connections)
 
         self.client = Minio(
             endpoint,
@@ -51,73 +188,349 @@ class S3Client:
 
         logger.info(f"S3Client initialized: endpoint={endpoint}, bucket={bucket}")
 
-    def download_file(self, object_key: str, destination_path: str) -> dict:
+    def _read_range(
+        self, object_key: str, offset: int, length: int, etag: str | None = None
+    ) -> tuple[bytes, dict]:
+        response = self.client.get_object(
+            self.bucket,
+            object_key,
+            offset=offset,
+            length=length,
+            request_headers=_if_match(etag),
+        )
+        try:
+            # A server ignoring Range would send the whole object
+            return response.read(length), response.headers
+        finally:
+            response.close()
+            response.release_conn()
+
+    def probe_object(
+        self,
+        object_key: str,
+        max_size_bytes: int | None = None,
+    ) -> dict:
         """
-        Download a file from S3.
+        Check an object with ranged GETs before downloading it.
+
+        The first kilobyte gives size, content type, ETag (response headers)
+        and the file signature. For PDFs the page count comes from the
+        linearization dictionary in that kilobyte or, failing that (and
+        for objects of at least 64 KB), from the trailer, xref table and
+        page tree root, each fetched with a small ranged GET. An oversized or unsupported object costs a single
+        1 KB request instead of the full download.
 
         Args:
             object_key: S3 object key/path
-            destination_path: Local file path to save the downloaded file
+            max_size_bytes: Reject objects larger than this
 
         Returns:
             dict with metadata: {
                 "size": int,
                 "content_type": str,
                 "etag": str,
-                "local_path": str
+                "file_type": str,
+                "page_count": int | None
             }
 
         Raises:
             ResourceNotFoundError: If S3 object not found (404)
+            ValidationError: If the object is empty or not a PDF/JPEG/PNG/TIFF
+            PayloadTooLargeError: If the object exceeds ``max_size_bytes``
             ExternalServiceError: If S3 operation fails
         """
         try:
-            # Get object metadata
-            stat = self.client.stat_object(self.bucket, object_key)
-            logger.info(
-                f"Found S3 object: key={object_key}, "
-                f"size={stat.size} bytes, content_type={stat.content_type}"
+            head, headers = self._read_range(object_key, 0, LINEARIZED_HEADER_BYTES)
+        except S3Error as e:
+            if e.code == "InvalidRange":
+                # Only an empty object has no byte 0
+                _check_signature(b"", object_key)
+            raise _s3_error(e, object_key)
+        except Exception as e:
+            logger.error(f"Unexpected error probing {object_key}: {e}")
+            raise ExternalServiceError(
+                service_name="S3",
+                error_type="error",
+                details={"object_key": object_key},
             )
 
-            # Download file
-            response = self.client.get_object(self.bucket, object_key)
-            file_data = response.read()
-            response.close()
-            response.release_conn()
+        size = _object_size(headers)
+        content_type = headers.get("Content-Type")
+        etag = (headers.get("ETag") or "").strip('"')
+        if max_size_bytes is not None and size > max_size_bytes:
+            raise _too_large(max_size_bytes, size)
+        file_type = _check_signature(head[:_SIGNATURE_BYTES], object_key)
 
-            # Save to local file
-            Path(destination_path).parent.mkdir(parents=True, exist_ok=True)
-            with open(destination_path, "wb") as f:
-                f.write(file_data)
+        page_count = None
+        if file_type == "pdf":
+            page_count = linearized_page_count(head, file_size=size)
+            if page_count is None and size >= _PROBE_TRAILER_MIN_BYTES:
+                page_count = self._probe_pdf_trailer(object_key, size, etag, head)
+
+        logger.info(
+            f"Probed S3 object: key={object_key}, size={size} bytes, "
+            f"content_type={content_type}, type={file_type}, pages={page_count}"
+        )
+        return {
+            "size": size,
+            "content_type": content_type,
+            "etag": etag,
+            "file_type": file_type,
+            "page_count": page_count,
+        }
+
+    def _probe_pdf_trailer(
+        self, object_key: str, size: int, etag: str, head: bytes
+    ) -> int | None:
+        def read(offset: int, length: int) -> bytes:
+            length = min(length, size - offset)
+            if length <= 0:
+                return b""
+            if offset + length <= len(head):
+                return head[offset : offset + length]
+            return self._read_range(object_key, offset, length, etag)[0]
+
+        try:
+            return count_pages_from_trailer(
+                read, size, object_window=_PROBE_OBJECT_WINDOW_BYTES
+            )
+        except Exception:
+            # Best effort; the pipeline counts pages after the download
+            logger.debug(f"PDF page probe failed for {object_key}", exc_info=True)
+            return None
+
+    def download_file(
+        self,
+        object_key: str,
+        destination_path: str,
+        max_size_bytes: int | None = None,
+        etag: str | None = None,
+        size: int | None = None,
+    ) -> dict:
+        """
+        Download a file from S3 to disk.
+
+        Objects below the parallel threshold (or of unknown ``size``) are
+        streamed with a single GET: chunks go straight to
+        ``destination_path`` (no in-memory copy, no extra ``stat_object``
+        round trip - size, type and ETag come from the GET response
+        headers), the first bytes are checked against the supported file
+        signatures and the SHA-256 is computed while writing.
+
+        Larger objects of known ``size`` are split into byte ranges fetched
+        concurrently over the shared pool and written at their offsets into
+        a preallocated file. Every range carries ``If-Match``; afterwards a
+        single-part ETag is compared with the MD5 of the file.
 
-            logger.info(f"Downloaded S3 file to: {destination_path}")
+        Args:
+            object_key: S3 object key/path
+            destination_path: Local file path to save the downloaded file
+            max_size_bytes: Abort once the object exceeds this size
+            etag: Expected ETag (``If-Match``), e.g. from ``probe_object``
+            size: Object size if known (``probe_object``); enables ranges
 
-            return {
-                "size": len(file_data),
-                "content_type": stat.content_type,
-                "etag": stat.etag,
-                "local_path": destination_path,
+        Returns:
+            dict with metadata: {
+                "size": int,
+                "content_type": str,
+                "etag": str,
+                "local_path": str,
+                "sha256": str,
+                "file_type": str,
+                "parts": int
             }
 
-        except S3Error as e:
-            # Check if it's a "file not found" error
-            if e.code == "NoSuchKey":
-                logger.warning(f"S3 object not found: {object_key}")
-                raise ResourceNotFoundError(
-                    resource_type="S3 object", resource_id=object_key
+        Raises:
+            ResourceNotFoundError: If S3 object not found (404)
+            ValidationError: If the object is not a PDF/JPEG/PNG/TIFF
+            PayloadTooLargeError: If the object exceeds ``max_size_bytes``
+            ExternalServiceError: If S3 operation fails or the ETag mismatches
+        """
+        try:
+            Path(destination_path).parent.mkdir(parents=True, exist_ok=True)
+            if size is not None and size >= self.parallel_threshold_bytes:
+                if max_size_bytes is not None and size > max_size_bytes:
+                    raise _too_large(max_size_bytes, size)
+                result = self._download_ranges(
+                    object_key, destination_path, size, etag
                 )
             else:
-                # Other S3 errors (permission denied, etc.)
-                logger.error(f"S3 error downloading {object_key}: {e}")
-                raise ExternalServiceError(
-                    service_name="S3",
-                    error_type="error",
-                    details={"object_key": object_key, "error_code": e.code},
+                result = self._download_stream(
+                    object_key, destination_path, max_size_bytes, etag
                 )
+        except BaseError:
+            _remove_partial(destination_path)
+            raise
+        except S3Error as e:
+            _remove_partial(destination_path)
+            raise _s3_error(e, object_key)
         except Exception as e:
+            _remove_partial(destination_path)
             logger.error(f"Unexpected error downloading {object_key}: {e}")
             raise ExternalServiceError(
                 service_name="S3",
                 error_type="error",
                 details={"object_key": object_key},
             )
+
+        logger.info(
+            f"Downloaded S3 file to: {destination_path} "
+            f"({result['size']} bytes, {result['parts']} part(s))"
+        )
+        return result
+
+    def _download_stream(
+        self,
+        object_key: str,
+        destination_path: str,
+        max_size_bytes: int | None,
+        etag: str | None,
+    ) -> dict:
+        response = self.client.get_object(
+            self.bucket, object_key, request_headers=_if_match(etag)
+        )
+        try:
+            content_type = response.headers.get("Content-Type")
+            etag = (response.headers.get("ETag") or "").strip('"')
+            declared_size = int(response.headers.get("Content-Length") or 0)
+            logger.info(
+                f"Found S3 object: key={object_key}, "
+                f"size={declared_size} bytes, content_type={content_type}"
+            )
+            if max_size_bytes is not None and declared_size > max_size_bytes:
+                raise _too_large(max_size_bytes, declared_size)
+
+            digest = hashlib.sha256()
+            size = 0
+            header = b""
+            file_type = None
+            with open(destination_path, "wb") as f:
+                for chunk in response.stream(_DOWNLOAD_CHUNK_SIZE):
+                    if file_type is None:
+                        header += chunk[: _SIGNATURE_BYTES - len(header)]
+                        if len(header) >= _SIGNATURE_BYTES:
+                            file_type = _check_signature(header, object_key)
+                    size += len(chunk)
+                    if max_size_bytes is not None and size > max_size_bytes:
+                        raise _too_large(max_size_bytes, size)
+                    digest.update(chunk)
+                    f.write(chunk)
+            if file_type is None:
+                file_type = _check_signature(header, object_key)
+        finally:
+            response.close()
+            response.release_conn()
+
+        return {
+            "size": size,
+            "content_type": content_type,
+            "etag": etag,
+            "local_path": destination_path,
+            "sha256": digest.hexdigest(),
+            "file_type": file_type,
+            "parts": 1,
+        }
+
+    def _download_ranges(
+        self,
+        object_key: str,
+        destination_path: str,
+        size: int,
+        etag: str | None,
+    ) -> dict:
+        if not etag:
+            # Ranges must all come from the same object version
+            etag = self.client.stat_object(self.bucket, object_key).etag
+        etag = etag.strip('"')
+        ranges = [
+            (offset, min(self.part_size_bytes, size - offset))
+            for offset in range(0, size, self.part_size_bytes)
+        ]
+        logger.info(
+            f"Found S3 object: key={object_key}, size={size} bytes, "
+            f"downloading {len(ranges)} ranges x{self.download_concurrency}"
+        )
+
+        stop = threading.Event()
+        fd = os.open(destination_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            _preallocate(fd, size)
+            with ThreadPoolExecutor(
+                max_workers=min(self.download_concurrency, len(ranges)),
+                thread_name_prefix="s3-range",
+            ) as pool:
+                futures = [
+                    pool.submit(
+                        self._fetch_range, object_key, fd, offset, length, etag, stop
+                    )
+                    for offset, length in ranges
+                ]
+                try:
+                    headers = [future.result() for future in as_completed(futures)]
+                except BaseException:
+                    stop.set()
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            os.close(fd)
+
+        with open(destination_path, "rb") as f:
+            file_type = _check_signature(f.read(_SIGNATURE_BYTES), object_key)
+        check_md5 = bool(_PLAIN_ETAG_RE.match(etag))
+        sha256, md5 = _file_digests(destination_path, with_md5=check_md5)
+        if check_md5 and md5 != etag:
+            logger.error(f"ETag mismatch for {object_key}: etag={etag} md5={md5}")
+            raise ExternalServiceError(
+                service_name="S3",
+                error_type="error",
+                details={"object_key": object_key, "reason": "etag_mismatch"},
+            )
+
+        return {
+            "size": size,
+            "content_type": headers[0].get("Content-Type"),
+            "etag": etag,
+            "local_path": destination_path,
+            "sha256": sha256,
+            "file_type": file_type,
+            "parts": len(ranges),
+        }
+
+    def _fetch_range(
+        self,
+        object_key: str,
+        fd: int,
+        offset: int,
+        length: int,
+        etag: str,
+        stop: threading.Event,
+    ):
+        response = self.client.get_object(
+            self.bucket,
+            object_key,
+            offset=offset,
+            length=length,
+            request_headers=_if_match(etag),
+        )
+        try:
+            position = offset
+            for chunk in response.stream(_DOWNLOAD_CHUNK_SIZE):
+                if stop.is_set():
+                    return response.headers
+                _pwrite_all(fd, chunk, position)
+                position += len(chunk)
+            if position - offset != length:
+                raise ExternalServiceError(
+                    service_name="S3",
+                    error_type="error",
+                    details={
+                        "object_key": object_key,
+                        "reason": "short_range",
+                        "offset": offset,
+                    },
+                )
+            return response.headers
+        finally:
+            response.close()
+            response.release_conn()
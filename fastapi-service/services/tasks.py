@@ -2,7 +2,11 @@ import asyncio
 import logging
 
 from fastapi import BackgroundTasks
-from pipeline.database.client import insert_verification_run, update_webhook_status
+from pipeline.database.client import (
+    insert_verification_run,
+    insert_verification_runs_batch,
+    update_webhook_status,
+)
 from pipeline.database.manager import DatabaseManager
 from services.webhook_client import WebhookClient
 
@@ -155,6 +159,77 @@ async def insert_verification_run_from_path(
         return False
 
 
+async def insert_verification_runs_from_paths(
+    paths: list[str], db_manager: DatabaseManager
+) -> bool:
+    """Load several final.json files and insert them in one batch.
+
+    Args:
+        paths: Paths to final.json files
+        db_manager: Database manager instance
+    """
+    from pipeline.utils.io_utils import read_json as util_read_json
+
+    final_jsons = []
+    for path in paths:
+        try:
+            final_jsons.append(await asyncio.to_thread(util_read_json, path))
+        except Exception as e:
+            logger.error(f"Failed to load {path}: {e}", exc_info=True)
+
+    try:
+        return await insert_verification_runs_batch(final_jsons, db_manager)
+    except Exception as e:
+        logger.error(
+            f"Batch insert of {len(final_jsons)} runs failed: {e}", exc_info=True
+        )
+        return False
+
+
+async def persist_verification_run(
+    result: dict,
+    db_manager: DatabaseManager | None,
+    webhook_client: WebhookClient | None,
+    request_id: int | None = None,
+) -> None:
+    """Insert run and optionally send webhook, awaiting completion.
+
+    Same behaviour as enqueue_verification_run, for callers that run
+    outside a request (e.g. job workers) and have no BackgroundTasks.
+
+    Args:
+        result: Pipeline result dictionary
+        db_manager: Database manager instance (skipped if None)
+        webhook_client: Webhook client instance
+        request_id: Optional request ID for webhook
+    """
+    final_json_path = result.get("final_result_path")
+    if not final_json_path or db_manager is None:
+        logger.warning("No final_result_path or database, skipping persistence")
+        return
+
+    if request_id is not None and webhook_client is not None:
+        from pipeline.utils.io_utils import read_json as util_read_json
+
+        try:
+            final_json = await asyncio.to_thread(util_read_json, final_json_path)
+        except Exception as e:
+            logger.error(f"Failed to load {final_json_path}: {e}", exc_info=True)
+            return
+
+        await insert_run_then_webhook(
+            final_json=final_json,
+            request_id=request_id,
+            success=result.get("verdict", False),
+            errors=_extract_error_codes(result),
+            run_id=result.get("run_id"),
+            db_manager=db_manager,
+            webhook_client=webhook_client,
+        )
+    else:
+        await insert_verification_run_from_path(final_json_path, db_manager)
+
+
 # ==============================================================================
 # Main Enqueueing Function
 # ==============================================================================
@@ -211,3 +286,23 @@ def enqueue_verification_run(
 
     except Exception as e:
         logger.error(f"Failed to enqueue background tasks: {e}", exc_info=True)
+
+
+def enqueue_verification_runs_batch(
+    background_tasks: BackgroundTasks,
+    results: list[dict],
+    db_manager: DatabaseManager,
+) -> None:
+    """Queue a single batched database insertion for several runs (no webhooks).
+
+    Args:
+        background_tasks: FastAPI background tasks
+        results: Pipeline result dictionaries
+        db_manager: Database manager instance
+    """
+    paths = [r["final_result_path"] for r in results if r.get("final_result_path")]
+    if not paths:
+        logger.warning("No final_result_path in batch results, skipping persistence")
+        return
+
+    background_tasks.add_task(insert_verification_runs_from_paths, paths, db_manager)
@@ -0,0 +1,24 @@
+"""Test setup: import path and the settings required at import time."""
+
+import os
+import sys
+
+SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SERVICE_DIR)
+
+# Required settings without defaults; the values are never connected to
+for _name, _value in {
+    "DB_HOST": "localhost",
+    "DB_NAME": "test",
+    "DB_USER": "test",
+    "DB_PASSWORD": "test",
+    "S3_ENDPOINT": "localhost:9000",
+    "S3_ACCESS_KEY": "test",
+    "S3_SECRET_KEY": "test",
+    "S3_BUCKET": "test",
+    "LLM_ENDPOINT_URL": "http://llm.invalid/",
+    "WEBHOOK_URL": "http://webhook.invalid/",
+    "WEBHOOK_USERNAME": "test",
+    "WEBHOOK_PASSWORD": "test",
+}.items():
+    os.environ.setdefault(_name, _value)
@@ -0,0 +1,127 @@
+"""Success/failure accounting of the OCR endpoint pool."""
+
+import asyncio
+
+import httpx
+import pytest
+from pipeline.clients import tesseract_async_client
+from pipeline.clients.ocr_balancer import OcrEndpointPool
+from pipeline.clients.tesseract_async_client import (
+    TesseractAsyncClient,
+    _upload_and_wait,
+)
+
+
+def _pool(threshold: int = 2) -> OcrEndpointPool:
+    return OcrEndpointPool(
+        ["http://a", "http://b"], failure_threshold=threshold, ejection_seconds=30
+    )
+
+
+def test_ejects_after_consecutive_failures():
+    pool = _pool(threshold=2)
+    a = pool.endpoints[0]
+    a.outstanding = 2
+
+    pool.release(a, success=False)
+    assert a.consecutive_failures == 1 and a.ejected_until is None
+
+    pool.release(a, success=False)
+    assert a.ejected_until is not None
+    assert all(pool.acquire().url == "http://b" for _ in range(3))
+
+
+def test_success_resets_failures_and_ejection():
+    pool = _pool(threshold=1)
+    a = pool.endpoints[0]
+    a.outstanding = 2
+    pool.release(a, success=False)
+    assert a.ejected_until is not None
+    pool.release(a, success=True)
+    assert a.consecutive_failures == 0
+    assert a.ejected_until is None and a.ejection_seconds == 0.0
+
+
+def test_neutral_release_only_frees_the_slot():
+    pool = _pool(threshold=2)
+    a = pool.endpoints[0]
+    a.outstanding = 2
+    pool.release(a, success=False)
+    pool.release(a, success=None)
+    assert a.outstanding == 0
+    assert a.consecutive_failures == 1 and a.ejected_until is None
+
+
+def _client() -> TesseractAsyncClient:
+    return TesseractAsyncClient(base_urls=["http://ocr-a"], failure_threshold=1)
+
+
+def _status_error(code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "http://ocr-a/pdf")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(code, request=request)
+    )
+
+
+def _run(monkeypatch, client, outcome):
+    async def fake_upload_and_wait_on(*args, **kwargs):
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(
+        tesseract_async_client, "_upload_and_wait_on", fake_upload_and_wait_on
+    )
+    return asyncio.run(_upload_and_wait(client, "doc.pdf", True, 1.0))
+
+
+@pytest.mark.parametrize(
+    "outcome",
+    [
+        asyncio.CancelledError(),
+        _status_error(400),
+        _status_error(404),
+        RuntimeError("local failure"),
+    ],
+)
+def test_cancellation_and_client_errors_do_not_count(monkeypatch, outcome):
+    client = _client()
+    endpoint = client.endpoints.endpoints[0]
+    with pytest.raises(type(outcome)):
+        _run(monkeypatch, client, outcome)
+    assert endpoint.outstanding == 0
+    assert endpoint.consecutive_failures == 0 and endpoint.ejected_until is None
+
+
+@pytest.mark.parametrize(
+    "outcome",
+    [
+        _status_error(503),
+        httpx.ConnectError("refused"),
+        httpx.ReadTimeout("timed out"),
+    ],
+)
+def test_server_and_transport_errors_count(monkeypatch, outcome):
+    client = _client()
+    endpoint = client.endpoints.endpoints[0]
+    with pytest.raises(type(outcome)):
+        _run(monkeypatch, client, outcome)
+    assert endpoint.outstanding == 0
+    assert endpoint.consecutive_failures == 1 and endpoint.ejected_until is not None
+
+
+@pytest.mark.parametrize(
+    "result, healthy",
+    [
+        ({"status": "done"}, True),
+        ({"status": "failed"}, True),
+        ({"status": "processing"}, False),  # timed out waiting
+    ],
+)
+def test_result_status_accounting(monkeypatch, result, healthy):
+    client = _client()
+    endpoint = client.endpoints.endpoints[0]
+    endpoint.consecutive_failures = 0
+    _run(monkeypatch, client, {"result": result})
+    assert endpoint.outstanding == 0
+    assert (endpoint.consecutive_failures == 0) is healthy
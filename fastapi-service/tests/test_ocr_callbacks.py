@@ -0,0 +1,77 @@
+"""OCR callback registry: early callbacks, cross-worker spool, pruning."""
+
+import asyncio
+import os
+import time
+
+from pipeline.clients.ocr_callbacks import OcrCallbackRegistry
+
+
+def test_callback_before_expect_is_claimed(tmp_path):
+    async def scenario():
+        registry = OcrCallbackRegistry(tmp_path)
+        # The OCR node posts before the upload response reached the worker
+        assert await registry.deliver("f1", {"id": "f1"}) is False
+        await registry.expect("f1")
+        return await asyncio.wait_for(registry.wait("f1", 5.0), 0.1)
+
+    assert asyncio.run(scenario()) == {"id": "f1"}
+
+
+def test_local_waiter_is_resolved_directly(tmp_path):
+    async def scenario():
+        registry = OcrCallbackRegistry(tmp_path)
+        await registry.expect("f2")
+        waiting = asyncio.create_task(registry.wait("f2", 5.0))
+        await asyncio.sleep(0)
+        assert await registry.deliver("f2", {"id": "f2"}) is True
+        return await waiting
+
+    assert asyncio.run(scenario()) == {"id": "f2"}
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_callback_on_another_worker_is_picked_up(tmp_path):
+    async def scenario():
+        waiting_worker = OcrCallbackRegistry(tmp_path)
+        receiving_worker = OcrCallbackRegistry(tmp_path)
+        await waiting_worker.expect("f3")
+        waiting = asyncio.create_task(waiting_worker.wait("f3", 5.0))
+        await asyncio.sleep(0.05)
+        await receiving_worker.deliver("f3", {"id": "f3"})
+        payload = await asyncio.wait_for(waiting, 1.0)
+        await waiting_worker.forget("f3")
+        return payload
+
+    assert asyncio.run(scenario()) == {"id": "f3"}
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_wait_times_out(tmp_path):
+    async def scenario():
+        registry = OcrCallbackRegistry(tmp_path)
+        await registry.expect("f4")
+        return await registry.wait("f4", 0.3)
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_prune_removes_unclaimed_and_stale_entries(tmp_path):
+    async def scenario():
+        registry = OcrCallbackRegistry(tmp_path)
+        await registry.deliver("unknown", {"id": "unknown"})
+        await registry.expect("waiting")
+        await registry.deliver("waiting", {"id": "waiting"})
+        return registry
+
+    registry = asyncio.run(scenario())
+    minutes_ago = time.time() - 300
+    for path in tmp_path.iterdir():
+        os.utime(path, (minutes_ago, minutes_ago))
+
+    assert registry.prune() == 1
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "waiting.expected",
+        "waiting.json",
+    ]
+    assert registry.prune(max_age=60) == 2
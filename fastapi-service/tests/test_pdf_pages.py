@@ -0,0 +1,208 @@
+"""Fast PDF page counting (linearized header, xref/trailer walk)."""
+
+import io
+
+import pytest
+from pypdf import PdfReader, PdfWriter
+from pipeline.utils.pdf_pages import (
+    count_pages_from_trailer,
+    count_pdf_pages,
+    count_pdf_pages_fast,
+    linearized_page_count,
+)
+
+
+def _xref_section(offsets: dict[int, int], trailer: bytes, start: int) -> bytes:
+    """Classic xref table (one subsection per object) plus trailer."""
+    out = b"xref\n"
+    for number in sorted(offsets):
+        out += b"%d 1\n%010d 00000 n \n" % (number, offsets[number])
+    return out + b"trailer\n<< " + trailer + b" >>\nstartxref\n%d\n%%%%EOF\n" % start
+
+
+def _build_pdf(objects: dict[int, bytes], root: int = 1, header: bytes = b"") -> bytes:
+    out = b"%PDF-1.4\n" + header
+    offsets = {}
+    for number, body in objects.items():
+        offsets[number] = len(out)
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    start = len(out)
+    size = max(objects) + 1
+    return out + _xref_section(
+        offsets, b"/Size %d /Root %d 0 R" % (size, root), start
+    )
+
+
+def _append_update(base: bytes, objects: dict[int, bytes], root: int = 1) -> bytes:
+    """Incremental update: new objects, xref section chained with /Prev."""
+    prev = int(base.rsplit(b"startxref", 1)[1].split()[0])
+    out = base
+    offsets = {}
+    for number, body in objects.items():
+        offsets[number] = len(out)
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    start = len(out)
+    return out + _xref_section(
+        offsets, b"/Size 20 /Root %d 0 R /Prev %d" % (root, prev), start
+    )
+
+
+def _pages(count: int, first_page: int = 10) -> dict[int, bytes]:
+    kids = b" ".join(b"%d 0 R" % (first_page + i) for i in range(count))
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % count,
+    }
+    for i in range(count):
+        objects[first_page + i] = b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 10 10] >>"
+    return objects
+
+
+def _write(tmp_path, name: str, data: bytes) -> str:
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+def _pypdf_blank(pages: int) -> bytes:
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(100, 100)
+    buf = io.BytesIO()
+    writer.write(buf)
+    return buf.getvalue()
+
+
+def _linearized(pages_declared: int, length: int) -> bytes:
+    return b"%%PDF-1.5\n99 0 obj\n<< /Linearized 1 /L %d /N %d /O 10 >>\nendobj\n" % (
+        length,
+        pages_declared,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Linearized header
+# ---------------------------------------------------------------------------
+
+
+def test_linearized_count_with_matching_length():
+    head = _linearized(42, 123456)
+    assert linearized_page_count(head) == 42
+    assert linearized_page_count(head, file_size=123456) == 42
+
+
+def test_linearized_count_with_stale_length_is_ignored():
+    assert linearized_page_count(_linearized(42, 123456), file_size=130000) is None
+
+
+def test_not_linearized():
+    assert linearized_page_count(_pypdf_blank(3)) is None
+
+
+def test_stale_linearized_header_falls_back_to_trailer(tmp_path):
+    # Linearized for 500 pages, then updated: /L no longer matches the file
+    header = b"99 0 obj\n<< /Linearized 1 /L 1 /N 500 >>\nendobj\n"
+    data = _build_pdf(_pages(3), header=header)
+    assert count_pdf_pages_fast(_write(tmp_path, "stale.pdf", data)) == 3
+
+
+def test_linearized_header_used_when_length_matches(tmp_path):
+    body = _build_pdf(_pages(3))[len(b"%PDF-1.4\n") :]
+    header = b"%PDF-1.4\n99 0 obj\n<< /Linearized 1 /L LLLLLLLLLL /N 7 >>\nendobj\n"
+    size = len(header) + len(body)
+    data = header.replace(b"LLLLLLLLLL", b"%010d" % size) + body
+    assert count_pdf_pages_fast(_write(tmp_path, "lin.pdf", data)) == 7
+
+
+# ---------------------------------------------------------------------------
+# xref / trailer walk
+# ---------------------------------------------------------------------------
+
+
+def test_classic_xref():
+    data = _build_pdf(_pages(4))
+    read = lambda offset, length: data[offset : offset + length]  # noqa: E731
+    assert count_pages_from_trailer(read, len(data)) == 4
+
+
+def test_prev_chain_uses_newest_objects(tmp_path):
+    base = _build_pdf(_pages(2))
+    # The update adds a page and rewrites the page tree root
+    updated = _append_update(
+        base,
+        {
+            2: b"<< /Type /Pages /Kids [10 0 R 11 0 R 12 0 R] /Count 3 >>",
+            12: b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 10 10] >>",
+        },
+    )
+    path = _write(tmp_path, "updated.pdf", updated)
+    assert count_pdf_pages_fast(path) == 3
+    assert len(PdfReader(path).pages) == 3
+
+
+def test_prev_chain_finds_catalog_in_older_section():
+    base = _build_pdf(_pages(2))
+    updated = _append_update(
+        base, {12: b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 10 10] >>"}
+    )
+    read = lambda offset, length: updated[offset : offset + length]  # noqa: E731
+    assert count_pages_from_trailer(read, len(updated)) == 2
+
+
+def test_indirect_count():
+    objects = _pages(5)
+    objects[2] = objects[2].replace(b"/Count 5", b"/Count 7 0 R")
+    objects[7] = b"5"
+    data = _build_pdf(objects)
+    read = lambda offset, length: data[offset : offset + length]  # noqa: E731
+    assert count_pages_from_trailer(read, len(data)) == 5
+
+
+def test_xref_stream_returns_none():
+    objects = _pages(2)
+    data = _build_pdf(objects)
+    # Point startxref at an object (as xref-stream files do)
+    stream_offset = data.index(b"1 0 obj")
+    data = data.rsplit(b"startxref", 1)[0] + b"startxref\n%d\n%%%%EOF\n" % stream_offset
+    read = lambda offset, length: data[offset : offset + length]  # noqa: E731
+    assert count_pages_from_trailer(read, len(data)) is None
+
+
+def test_hybrid_xref_stream_returns_none():
+    data = _build_pdf(_pages(2)).replace(b"/Size", b"/XRefStm 5 /Size", 1)
+    read = lambda offset, length: data[offset : offset + length]  # noqa: E731
+    assert count_pages_from_trailer(read, len(data)) is None
+
+
+def test_damaged_offsets_return_none():
+    data = _build_pdf(_pages(2))
+    data = data.replace(b"startxref\n", b"startxref\n1", 1)
+    read = lambda offset, length: data[offset : offset + length]  # noqa: E731
+    assert count_pages_from_trailer(read, len(data)) is None
+
+
+# ---------------------------------------------------------------------------
+# Parity with pypdf
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("pages", [1, 3, 25, 120])
+def test_parity_with_pypdf(tmp_path, pages):
+    path = _write(tmp_path, f"blank{pages}.pdf", _pypdf_blank(pages))
+    expected = len(PdfReader(path).pages)
+    assert count_pdf_pages_fast(path) == expected
+    assert count_pdf_pages(path) == expected
+
+
+def test_parity_with_pypdf_for_handwritten_files(tmp_path):
+    for pages in (1, 6):
+        path = _write(tmp_path, f"hand{pages}.pdf", _build_pdf(_pages(pages)))
+        assert count_pdf_pages_fast(path) == len(PdfReader(path).pages) == pages
+
+
+def test_count_pdf_pages_falls_back_to_pypdf(tmp_path):
+    # startxref points nowhere: fast path gives up, pypdf rebuilds the table
+    broken = _build_pdf(_pages(4)).replace(b"startxref\n", b"startxref\n9", 1)
+    path = _write(tmp_path, "broken.pdf", broken)
+    assert count_pdf_pages_fast(path) is None
+    assert count_pdf_pages(path) == len(PdfReader(path).pages) == 4